@@ -0,0 +1,51 @@
+"""Compares sequential and concurrent `AsyncEvent` fire latency for I/O bound subscribers.
+
+Run with `poetry run python benchmarks/async_concurrency.py`.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+from evento import AsyncEvent, Concurrency
+
+IO_LATENCY = 0.005
+
+
+def make_subscriber() -> Callable[[Any], Awaitable[None]]:
+    async def subscriber(value: Any) -> None:
+        # stand-in for a cache write or webhook post
+        await asyncio.sleep(IO_LATENCY)
+
+    return subscriber
+
+
+async def measure(event: AsyncEvent[int], concurrency: Optional[Concurrency], fires: int) -> float:
+    start = time.perf_counter()
+    for i in range(fires):
+        if concurrency is None:
+            await event.fire(i)
+        else:
+            await event.fire_concurrent(i, concurrency)
+    return (time.perf_counter() - start) / fires
+
+
+async def main() -> None:
+    fires = 20
+    print(f"single subscriber latency: {IO_LATENCY * 1e3:.1f} ms")
+    print(f"{'subscribers':>12} {'sequential':>12} {'concurrent':>12} {'max 4':>12}")
+    for count in (1, 5, 20, 100):
+        event = AsyncEvent[int]()
+        event += [make_subscriber() for _ in range(count)]
+
+        sequential = await measure(event, None, fires)
+        concurrent = await measure(event, Concurrency(), fires)
+        limited = await measure(event, Concurrency(max_concurrency=4), fires)
+        print(
+            f"{count:>12} {sequential * 1e3:>9.1f} ms {concurrent * 1e3:>9.1f} ms"
+            f" {limited * 1e3:>9.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
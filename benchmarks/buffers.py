@@ -0,0 +1,79 @@
+"""Measures delivering 4 MB frames to 3 subscribers that slice off a header and
+forward the payload, using an `Event[bytes]` (where slicing copies) and a
+`BufferEvent` (where slices are views of a pooled buffer); in throughput (GB of
+frames delivered to subscribers per second), buffer allocations and page faults
+(the cost of getting fresh memory from the OS) per GB delivered.
+
+Run with `poetry run python benchmarks/buffers.py`.
+"""
+
+import resource
+from time import perf_counter
+from typing import Any, Callable
+
+from evento import BufferEvent, Event
+
+FRAME_SIZE = 4 << 20
+FRAMES = 500
+SUBSCRIBERS = 3
+HEADER = 16
+
+
+def forward(payload: Any) -> None:
+    pass
+
+
+def subscriber() -> Callable[[Any], None]:
+    def on_frame(frame: Any) -> None:
+        header = frame[:HEADER]
+        payload = frame[HEADER:]
+        forward((header, payload))
+
+    return on_frame
+
+
+def page_faults() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_minflt
+
+
+def report(name: str, seconds: float, faults: int, allocations: str) -> None:
+    delivered = FRAME_SIZE * FRAMES * SUBSCRIBERS / 1e9
+    print(
+        f"{name:>14} {delivered / seconds:>8.1f} GB/s {allocations:>24}"
+        f" {faults / delivered:>10.0f} page faults/GB"
+    )
+
+
+def main() -> None:
+    source = bytearray(range(256)) * (FRAME_SIZE // 256)
+
+    event = Event[bytes]()
+    for _ in range(SUBSCRIBERS):
+        event += subscriber()
+    faults = page_faults()
+    start = perf_counter()
+    for _ in range(FRAMES):
+        # reading the frame
+        event.fire(bytes(source))
+    seconds = perf_counter() - start
+    # the frame and a payload copy per subscriber
+    allocations = f"{FRAMES * (1 + SUBSCRIBERS)} buffers allocated"
+    report("Event[bytes]", seconds, page_faults() - faults, allocations)
+
+    buffers = BufferEvent()
+    for _ in range(SUBSCRIBERS):
+        buffers.append(subscriber())
+    faults = page_faults()
+    start = perf_counter()
+    for _ in range(FRAMES):
+        lease = buffers.acquire(FRAME_SIZE)
+        # reading the frame, into the pooled buffer
+        lease.view[:] = source
+        buffers.fire(lease)
+    seconds = perf_counter() - start
+    allocations = f"{buffers.pool.stats.allocated} buffers allocated"
+    report("BufferEvent", seconds, page_faults() - faults, allocations)
+
+
+if __name__ == "__main__":
+    main()
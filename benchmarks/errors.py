@@ -0,0 +1,79 @@
+"""Measures the fire overhead of error policies: firing without exceptions (which only
+pays for a try block, with or without a policy) and firing with a raising subscriber
+for every policy.
+
+Run with `poetry run python benchmarks/errors.py`.
+"""
+
+import logging
+import timeit
+from typing import Any, Callable, Optional
+
+from evento import Event, log_errors, raise_after_all, raise_group, route_errors
+from evento.errors import ErrorPolicy
+
+
+def noop(owner: object, value: Any) -> None:
+    pass
+
+
+def make_subscribers(count: int) -> list[Any]:
+    # every subscriber needs to be a distinct callable; bind noop to distinct owners
+    return [noop.__get__(object()) for _ in range(count)]
+
+
+def failing(value: Any) -> None:
+    raise ValueError()
+
+
+def measure(fire: Callable[[], Any], number: int) -> float:
+    return min(timeit.repeat(fire, number=number, repeat=5)) / number
+
+
+def make_event(count: int, policy: Optional[ErrorPolicy], fail: bool) -> Event[int]:
+    e = Event[int]()
+    if fail:
+        e += failing
+    e += make_subscribers(count)
+    e.error_policy = policy
+    return e
+
+
+def main() -> None:
+    # the logging policy shouldn't measure the handlers
+    logging.disable(logging.CRITICAL)
+
+    print(f"{'subscribers':>12} {'no policy':>12} {'with policy':>13}")
+    for count in (0, 1, 10, 1000):
+        number = max(1_000_000 // max(count, 1), 1000)
+        plain = make_event(count, None, False)
+        with_policy = make_event(count, log_errors, False)
+        print(
+            f"{count:>12} {measure(lambda: plain.fire(1), number) * 1e9:>9.0f} ns"
+            f" {measure(lambda: with_policy.fire(1), number) * 1e9:>10.0f} ns"
+        )
+
+    print()
+    print("a raising subscriber followed by 10 subscribers")
+    errors = Event[Any]()
+    policies: list[tuple[str, Optional[ErrorPolicy]]] = [
+        ("no policy", None),
+        ("raise_after_all", raise_after_all),
+        ("raise_group", raise_group),
+        ("log_errors", log_errors),
+        ("route_errors", route_errors(errors)),
+    ]
+    for name, policy in policies:
+        e = make_event(10, policy, True)
+
+        def fire() -> None:
+            try:
+                e.fire(1)
+            except Exception:
+                pass
+
+        print(f"{name:>16} {measure(fire, 100_000) * 1e9:>9.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Measures the memory used per event instance, with and without subscribers.
+
+Run with `poetry run python benchmarks/event_memory.py`.
+"""
+import tracemalloc
+from typing import Any, Callable
+
+from evento import AsyncEvent, Event, event, triggers_beforeafter_events
+
+COUNT = 100_000
+
+
+def noop(*args: Any) -> None:
+    pass
+
+
+def bytes_per_instance(create: Callable[[], Any]) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [create() for _ in range(COUNT)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # the list holding the instances isn't part of their footprint
+    return (after - before - instances.__sizeof__()) / COUNT
+
+
+def subscribed(subscribers: int) -> Callable[[], Event[Any]]:
+    def create() -> Event[Any]:
+        e = Event[Any]()
+        for i in range(subscribers):
+            e.append(noop.__get__(i))
+        e.fire(None)
+        return e
+
+    return create
+
+
+def main() -> None:
+    print(f"{'instance':>36} {'bytes':>8}")
+    for name, create in (
+        ("Event()", Event),
+        ("AsyncEvent()", AsyncEvent),
+        ("@event", lambda: event(noop)),
+        ("@triggers_beforeafter_events", lambda: triggers_beforeafter_events(noop)),
+        ("Event() with 1 subscriber, fired", subscribed(1)),
+        ("Event() with 3 subscribers, fired", subscribed(3)),
+    ):
+        print(f"{name:>36} {bytes_per_instance(create):>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
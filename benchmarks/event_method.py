@@ -0,0 +1,45 @@
+"""Measures the overhead of calling an `@event` decorated method that nobody observes,
+compared to calling a plain method.
+
+Run with `poetry run python benchmarks/event_method.py`.
+"""
+import timeit
+
+from evento import event
+
+
+def noop(value: int) -> None:
+    pass
+
+
+class Plain:
+    def update(self, value: int) -> int:
+        return value
+
+
+class Observable:
+    @event
+    def update(self, value: int) -> int:
+        return value
+
+
+def main() -> None:
+    number = 1_000_000
+    plain, observable = Plain(), Observable()
+
+    plain_time = min(timeit.repeat(lambda: plain.update(1), number=number, repeat=5)) / number
+
+    # every access creates a (lightweight) event for the instance, until it is observed
+    event_time = min(timeit.repeat(lambda: observable.update(1), number=number, repeat=5)) / number
+
+    observed = Observable()
+    observed.update.append(noop)
+    observed_time = min(timeit.repeat(lambda: observed.update(1), number=number, repeat=5)) / number
+
+    print(f"plain method call:         {plain_time * 1e9:>6.0f} ns")
+    print(f"unobserved @event call:    {event_time * 1e9:>6.0f} ns")
+    print(f"observed @event call:      {observed_time * 1e9:>6.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
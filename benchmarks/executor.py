@@ -0,0 +1,82 @@
+"""Compares inline firing with thread and process pool dispatch for CPU heavy subscribers.
+
+Reports the producer-side latency (how long `fire`/`submit` blocks the caller)
+and the total throughput (fires per second until all subscribers are done).
+
+Run with `poetry run python benchmarks/executor.py`.
+"""
+import os
+import time
+import zlib
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Callable, Optional
+
+from evento import Event, ExecutorDispatcher
+
+FIRES = 64
+PAYLOAD = os.urandom(256 * 1024) * 4
+
+
+def compress(payload: bytes) -> None:
+    # zlib releases the GIL, so threads can run this in parallel
+    zlib.compress(payload, 6)
+
+
+def checksum(payload: bytes) -> None:
+    # pure python work holds the GIL, so only processes run this in parallel
+    total = 0
+    for byte in payload[:200_000]:
+        total = (total * 31 + byte) & 0xFFFFFFFF
+
+
+def measure(
+    subscriber: Callable[[bytes], None], executor: Optional[Executor], ordered: bool = False
+) -> tuple[float, float]:
+    e = Event[bytes]()
+    e += subscriber
+
+    producer = 0.0
+    futures: list[Future[None]] = []
+    start = time.perf_counter()
+
+    for _ in range(FIRES):
+        fire_start = time.perf_counter()
+        if executor is None:
+            e.fire(PAYLOAD)
+        else:
+            futures.append(e.submit(ExecutorDispatcher(executor, ordered), PAYLOAD))
+        producer += time.perf_counter() - fire_start
+
+    wait(futures)
+    total = time.perf_counter() - start
+    return producer / FIRES, FIRES / total
+
+
+def main() -> None:
+    workers = os.cpu_count() or 1
+    print(f"{FIRES} fires of a {len(PAYLOAD) // 1024} KiB payload, {workers} workers")
+    print(f"{'subscriber':>10} {'dispatch':>16} {'producer latency':>18} {'throughput':>14}")
+
+    with ThreadPoolExecutor(workers) as threads, ProcessPoolExecutor(workers) as processes:
+        for subscriber in (compress, checksum):
+            for name, executor, ordered in (
+                ("inline", None, False),
+                ("threads", threads, False),
+                ("threads ordered", threads, True),
+                ("processes", processes, False),
+            ):
+                latency, throughput = measure(subscriber, executor, ordered)
+                print(
+                    f"{subscriber.__name__:>10} {name:>16} {latency * 1e6:>15.0f} µs"
+                    f" {throughput:>9.1f} /sec"
+                )
+
+
+if __name__ == "__main__":
+    main()
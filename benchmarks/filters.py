@@ -0,0 +1,75 @@
+"""Measures the fire cost with 1000 subscribers that are each interested in values of
+a single kind (out of 1000): subscribers that check the kind themselves, subscribers
+with a `where` predicate and keyed subscribers (`key`/`match`), which are indexed.
+
+Run with `poetry run python benchmarks/filters.py`.
+"""
+
+import timeit
+from operator import attrgetter
+from typing import Any, Callable, NamedTuple
+
+from evento import Event
+
+SUBSCRIBERS = 1000
+
+
+class Message(NamedTuple):
+    kind: int
+    value: int
+
+
+def handle(message: Message) -> None:
+    pass
+
+
+def checking(kind: int) -> Callable[[Message], None]:
+    def subscriber(message: Message) -> None:
+        if message.kind != kind:
+            return
+        handle(message)
+
+    return subscriber
+
+
+def handler() -> Callable[[Message], None]:
+    # every subscriber needs to be a distinct callable
+    def subscriber(message: Message) -> None:
+        handle(message)
+
+    return subscriber
+
+
+def of_kind(kind: int) -> Callable[[Message], bool]:
+    return lambda message: message.kind == kind
+
+
+def measure(event: Event[Message]) -> float:
+    message = Message(7, 1)
+    number = 1000
+    return min(timeit.repeat(lambda: event.fire(message), number=number, repeat=5)) / number
+
+
+def main() -> None:
+    checked = Event[Message]()
+    for kind in range(SUBSCRIBERS):
+        checked += checking(kind)
+
+    predicates = Event[Message]()
+    for kind in range(SUBSCRIBERS):
+        predicates.append(handler(), where=of_kind(kind))
+
+    keyed = Event[Message]()
+    # the same key function for all subscribers, so they share an index
+    key: Any = attrgetter("kind")
+    for kind in range(SUBSCRIBERS):
+        keyed.append(handler(), key=key, match=kind)
+
+    print(f"{SUBSCRIBERS} subscribers, 1 matching")
+    print(f"{'checking the kind':>20} {measure(checked) * 1e9:>10.0f} ns")
+    print(f"{'where':>20} {measure(predicates) * 1e9:>10.0f} ns")
+    print(f"{'key/match':>20} {measure(keyed) * 1e9:>10.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
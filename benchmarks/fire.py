@@ -0,0 +1,48 @@
+"""Measures the per-fire overhead of `Event` and `SignatureEvent` for different subscriber counts.
+
+Run with `poetry run python benchmarks/fire.py`.
+"""
+
+import timeit
+from typing import Any
+
+from evento import Event, event
+
+
+def noop(owner: object, value: Any) -> None:
+    pass
+
+
+def make_subscribers(count: int) -> list[Any]:
+    # every subscriber needs to be a distinct callable; bind noop to distinct owners
+    return [noop.__get__(object()) for _ in range(count)]
+
+
+def main() -> None:
+    print(f"{'subscribers':>12} {'Event.fire':>14} {'@event':>14} {'per subscriber':>16}")
+    for count in (0, 1, 10, 1000):
+        number = max(1_000_000 // max(count, 1), 1000)
+
+        e = Event[int]()
+        e += make_subscribers(count)
+
+        @event
+        def signature_event(value: int) -> None:
+            pass
+
+        signature_event += make_subscribers(count)
+
+        event_time = min(timeit.repeat(lambda: e.fire(1), number=number, repeat=5)) / number
+        signature_time = (
+            min(timeit.repeat(lambda: signature_event(1), number=number, repeat=5)) / number
+        )
+
+        per_subscriber = event_time / count if count else 0.0
+        print(
+            f"{count:>12} {event_time * 1e9:>11.0f} ns {signature_time * 1e9:>11.0f} ns"
+            f" {per_subscriber * 1e9:>13.1f} ns"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Compares firing values one by one with batched delivery using `fire_many`.
+
+Run with `poetry run python benchmarks/fire_many.py`.
+"""
+import time
+from typing import Callable, Sequence
+
+from evento import Event
+
+VALUES = list(range(50_000))
+
+
+def measure(fire: Callable[[], None], repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fire()
+        best = min(best, time.perf_counter() - start)
+    return best / len(VALUES)
+
+
+def main() -> None:
+    print(f"{len(VALUES)} values per batch")
+    print(f"{'subscribers':>12} {'fire loop':>12} {'fire_many':>12} {'batch aware':>12}")
+
+    for count in (1, 10):
+        per_value = Event[int]()
+        batch_aware = Event[int]()
+        totals = [0]
+
+        for _ in range(count):
+
+            def subscriber(value: int) -> None:
+                totals[0] += value
+
+            def batch_subscriber(values: Sequence[int]) -> None:
+                totals[0] += sum(values)
+
+            per_value += subscriber
+            batch_aware.append_batch(batch_subscriber)
+
+        def fire_loop() -> None:
+            for value in VALUES:
+                per_value.fire(value)
+
+        loop_time = measure(fire_loop)
+        many_time = measure(lambda: per_value.fire_many(VALUES))
+        batch_time = measure(lambda: batch_aware.fire_many(VALUES))
+        print(
+            f"{count:>12} {loop_time * 1e9:>9.0f} ns {many_time * 1e9:>9.0f} ns"
+            f" {batch_time * 1e9:>9.1f} ns"
+        )
+
+
+if __name__ == "__main__":
+    main()
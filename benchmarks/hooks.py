@@ -0,0 +1,56 @@
+"""Measures the fire overhead of (no-op) dispatch hooks, and that events fire without
+overhead when there are no hooks.
+
+Run with `poetry run python benchmarks/hooks.py`.
+"""
+
+import timeit
+from typing import Any
+
+from evento import Event, Hooks, add_hooks, remove_hooks
+
+
+def noop(owner: object, value: Any) -> None:
+    pass
+
+
+def make_subscribers(count: int) -> list[Any]:
+    # every subscriber needs to be a distinct callable; bind noop to distinct owners
+    return [noop.__get__(object()) for _ in range(count)]
+
+
+def measure(event: Event[int], number: int) -> float:
+    return min(timeit.repeat(lambda: event.fire(1), number=number, repeat=5)) / number
+
+
+def main() -> None:
+    hooks = Hooks()
+    print(
+        f"{'subscribers':>12} {'no hooks':>12} {'event hooks':>13}"
+        f" {'global hooks':>14} {'removed':>12}"
+    )
+    for count in (0, 1, 10, 100):
+        number = max(200_000 // max(count, 1), 1000)
+
+        e = Event[int]()
+        e += make_subscribers(count)
+        plain_time = measure(e, number)
+
+        add_hooks(hooks, e)
+        event_time = measure(e, number)
+        remove_hooks(hooks, e)
+
+        add_hooks(hooks)
+        global_time = measure(e, number)
+        remove_hooks(hooks)
+
+        removed_time = measure(e, number)
+
+        print(
+            f"{count:>12} {plain_time * 1e9:>9.0f} ns {event_time * 1e9:>10.0f} ns"
+            f" {global_time * 1e9:>11.0f} ns {removed_time * 1e9:>9.0f} ns"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Measures the fire overhead of instrumentation, and that events which aren't
+(or no longer are) instrumented don't pay for it.
+
+Run with `poetry run python benchmarks/instrumentation.py`.
+"""
+
+import timeit
+from typing import Any
+
+from evento import Event, instrument, uninstrument
+
+
+def noop(owner: object, value: Any) -> None:
+    pass
+
+
+def make_subscribers(count: int) -> list[Any]:
+    # every subscriber needs to be a distinct callable; bind noop to distinct owners
+    return [noop.__get__(object()) for _ in range(count)]
+
+
+def measure(event: Event[int], number: int) -> float:
+    return min(timeit.repeat(lambda: event.fire(1), number=number, repeat=5)) / number
+
+
+def main() -> None:
+    print(f"{'subscribers':>12} {'plain':>12} {'instrumented':>14} {'uninstrumented':>16}")
+    for count in (0, 1, 10, 100):
+        number = max(200_000 // max(count, 1), 1000)
+
+        e = Event[int]()
+        e += make_subscribers(count)
+        plain_time = measure(e, number)
+
+        instrument(e)
+        instrumented_time = measure(e, number)
+
+        uninstrument(e)
+        uninstrumented_time = measure(e, number)
+
+        print(
+            f"{count:>12} {plain_time * 1e9:>9.0f} ns {instrumented_time * 1e9:>11.0f} ns"
+            f" {uninstrumented_time * 1e9:>13.0f} ns"
+        )
+
+
+if __name__ == "__main__":
+    main()
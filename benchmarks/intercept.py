@@ -0,0 +1,80 @@
+"""Measures the cache-hit path of `fire_intercept`, where a subscriber answers the call
+from a cache so the (expensive) original method is skipped, for `@event` and `@async_event`.
+
+Run with `poetry run python benchmarks/intercept.py`.
+"""
+
+import asyncio
+import time
+import timeit
+from typing import Any, Callable
+
+from evento import async_event, event
+
+cache = {1: 499500}
+
+
+def compute(value: int) -> int:
+    # stand-in for an expensive computation
+    return sum(range(1000))
+
+
+def lookup(value: int) -> Any:
+    return cache.get(value)
+
+
+@event
+def sync_compute(value: int) -> int:
+    return compute(value)
+
+
+@async_event
+async def async_compute(value: int) -> int:
+    return compute(value)
+
+
+async def async_lookup(value: int) -> Any:
+    return lookup(value)
+
+
+def measure(func: Callable[[], Any], number: int = 20_000) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+async def measure_async(func: Callable[[], Any], number: int = 20_000) -> float:
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(number):
+            await func()
+        best = min(best, time.perf_counter() - start)
+    return best / number
+
+
+def report(name: str, duration: float) -> None:
+    print(f"{name:<36} {duration * 1e9:>10.0f} ns")
+
+
+async def main() -> None:
+    sync_compute.append(lookup)
+    async_compute.append(async_lookup)
+
+    report("original method", measure(lambda: compute(1)))
+    report("@event fire (hit ignored)", measure(lambda: sync_compute(1)))
+    report("@event fire_intercept (hit)", measure(lambda: sync_compute.fire_intercept(1)))
+    report("@event fire_intercept (miss)", measure(lambda: sync_compute.fire_intercept(2)))
+    report("@event fire_first (hit)", measure(lambda: sync_compute.fire_first(1)))
+
+    report("@async_event fire (hit ignored)", await measure_async(lambda: async_compute(1)))
+    report(
+        "@async_event fire_intercept (hit)",
+        await measure_async(lambda: async_compute.fire_intercept(1)),
+    )
+    report(
+        "@async_event fire_intercept (miss)",
+        await measure_async(lambda: async_compute.fire_intercept(2)),
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
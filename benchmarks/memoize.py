@@ -0,0 +1,64 @@
+"""Measures memoized `@event` / `@async_event` calls, and concurrent identical async calls
+being coalesced into a single call of the original method.
+
+Run with `poetry run python benchmarks/memoize.py`.
+"""
+
+import asyncio
+import time
+import timeit
+from typing import Any, Callable
+
+from evento import Memoize, async_event, event
+
+LATENCY = 0.01
+
+
+def compute(value: int) -> int:
+    # stand-in for an expensive computation
+    return sum(range(1000))
+
+
+@event
+def plain(value: int) -> int:
+    return compute(value)
+
+
+@event(memoize=Memoize())
+def memoized(value: int) -> int:
+    return compute(value)
+
+
+@async_event(memoize=Memoize())
+async def lookup(value: int) -> int:
+    # stand-in for a database lookup
+    await asyncio.sleep(LATENCY)
+    return value
+
+
+def measure(func: Callable[[], Any], number: int = 20_000) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+async def coalesced(callers: int) -> float:
+    assert lookup.cache is not None
+    lookup.cache.clear()
+    start = time.perf_counter()
+    await asyncio.gather(*(lookup(1) for _ in range(callers)))
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    print(f"{'original method':<28} {measure(lambda: compute(1)) * 1e9:>10.0f} ns")
+    print(f"{'@event':<28} {measure(lambda: plain(1)) * 1e9:>10.0f} ns")
+    print(f"{'@event (memoized, hit)':<28} {measure(lambda: memoized(1)) * 1e9:>10.0f} ns")
+
+    print(f"\nlookup latency: {LATENCY * 1e3:.1f} ms")
+    print(f"{'concurrent callers':>18} {'duration':>12}")
+    for callers in (1, 10, 100, 1000):
+        duration = await coalesced(callers)
+        print(f"{callers:>18} {duration * 1e3:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,169 @@
+"""Measures the throughput and latency of mirrored events between two processes,
+for both transports, small and large values and both serializers.
+
+Throughput: the number of values per second a process receives while another one
+fires them as fast as it can; latency: half of the round trip of a value that the
+receiving process fires back (on another mirrored event).
+
+Run with `poetry run python benchmarks/mirror.py`.
+"""
+
+import multiprocessing
+import threading
+import uuid
+from multiprocessing.connection import Connection
+from time import monotonic
+from typing import Any
+
+from evento import (
+    CompactSerializer,
+    Event,
+    PickleSerializer,
+    SharedMemoryTransport,
+    mirror,
+)
+from evento.serialization import Serializer
+from evento.transport import TransportKind
+
+
+def small(i: int) -> dict[str, Any]:
+    return {"id": i, "name": "small", "values": [1.5, 2.5, 3.5]}
+
+
+def large(i: int) -> dict[str, Any]:
+    return {"id": i, "name": "large", "data": bytes([i % 256]) * 64 * 1024}
+
+
+def receiver(
+    channel: str,
+    kind: TransportKind,
+    serializer: Serializer,
+    count: int,
+    echo: bool,
+    connection: Connection,
+) -> None:
+    values = Event[Any]()
+    received = 0
+    done = threading.Event()
+
+    def on_value(value: Any) -> None:
+        nonlocal received
+        received += 1
+        if received == count:
+            done.set()
+
+    values += on_value
+    mirrors = [mirror(values, f"{channel}-values", kind, serializer)]
+    if echo:
+        replies = Event[Any]()
+        values += replies.fire
+        mirrors.append(mirror(replies, f"{channel}-replies", kind, serializer))
+
+    connection.send("ready")
+    # until all values are received, or no more values are coming in
+    last = -1
+    while not done.wait(1.0) and received != last:
+        last = received
+    connection.send((received, monotonic()))
+    for m in mirrors:
+        m.close()
+
+
+def start_receiver(
+    channel: str, kind: TransportKind, serializer: Serializer, count: int, echo: bool
+) -> tuple[multiprocessing.process.BaseProcess, Connection]:
+    context = multiprocessing.get_context("spawn")
+    connection, child_connection = context.Pipe()
+    process = context.Process(
+        target=receiver, args=(channel, kind, serializer, count, echo, child_connection)
+    )
+    process.start()
+    assert connection.recv() == "ready"
+    return process, connection
+
+
+def throughput(
+    kind: TransportKind, serializer: Serializer, values: list[Any], count: int, batch_size: int
+) -> str:
+    channel = f"bench-{uuid.uuid4().hex[:8]}"
+    process, connection = start_receiver(channel, kind, serializer, count, echo=False)
+
+    event = Event[Any]()
+    m = mirror(event, f"{channel}-values", kind, serializer, batch_size=batch_size)
+    start = monotonic()
+    for i in range(count):
+        event.fire(values[i % len(values)])
+    m.flush()
+    # CLOCK_MONOTONIC is the same for all processes
+    received, end = connection.recv()
+    process.join()
+    m.close()
+    cleanup(f"{channel}-values", kind)
+
+    lost = f" ({count - received} lost)" if received < count else ""
+    return f"{received / (end - start):>10.0f} values/s{lost}"
+
+
+def latency(kind: TransportKind, serializer: Serializer, value: Any, count: int) -> str:
+    channel = f"bench-{uuid.uuid4().hex[:8]}"
+    process, connection = start_receiver(channel, kind, serializer, count, echo=True)
+
+    values, replies = Event[Any](), Event[Any]()
+    replied = threading.Event()
+    replies += lambda _: replied.set()
+    mirrors = [
+        mirror(values, f"{channel}-values", kind, serializer),
+        mirror(replies, f"{channel}-replies", kind, serializer),
+    ]
+
+    round_trips = []
+    for _ in range(count):
+        replied.clear()
+        start = monotonic()
+        values.fire(value)
+        replied.wait(5)
+        round_trips.append(monotonic() - start)
+
+    connection.recv()
+    process.join()
+    for m in mirrors:
+        m.close()
+    cleanup(f"{channel}-values", kind)
+    cleanup(f"{channel}-replies", kind)
+
+    round_trips.sort()
+    median = round_trips[len(round_trips) // 2] / 2
+    p99 = round_trips[len(round_trips) * 99 // 100] / 2
+    return f"{median * 1e6:>10.0f} µs (p99 {p99 * 1e6:.0f} µs)"
+
+
+def cleanup(channel: str, kind: TransportKind) -> None:
+    if kind == "shared_memory":
+        transport = SharedMemoryTransport(channel, capacity=16)
+        transport.unlink()
+        transport.close()
+
+
+def main() -> None:
+    kinds: list[TransportKind] = ["shared_memory", "socket"]
+    # distinct values, because pickle serializes repeated values in a batch only once
+    small_values = [small(i) for i in range(100)]
+    large_values = [large(i) for i in range(100)]
+    cases: list[tuple[str, Serializer, list[Any], int]] = [
+        ("small, pickle", PickleSerializer(), small_values, 100_000),
+        ("small, compact", CompactSerializer(), small_values, 100_000),
+        ("64 KB, pickle", PickleSerializer(), large_values, 5_000),
+        ("64 KB, compact", CompactSerializer(), large_values, 5_000),
+    ]
+
+    for kind in kinds:
+        print(kind)
+        for name, serializer, values, count in cases:
+            for batch_size in (1, 100):
+                result = throughput(kind, serializer, values, count, batch_size)
+                print(f"{f'{name}, batches of {batch_size}':>35} {result}")
+            print(f"{f'{name}, latency':>35} {latency(kind, serializer, values[0], 1000)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Measures how operators cut down downstream work: 100k fires (in bursts, within about
+a second) of a source event with 10 (no-op) subscribers, directly and through every
+operator, counting the downstream subscriber calls and the time spent firing.
+
+Run with `poetry run python benchmarks/operators.py`.
+"""
+
+import asyncio
+from time import perf_counter
+from typing import Any, Callable
+
+from evento import Event, buffer, coalesce, debounce, sample, throttle
+
+FIRES = 100_000
+BURST = 1000
+SUBSCRIBERS = 10
+
+
+async def measure(derive: Callable[[Event[int]], Event[Any]]) -> tuple[float, int]:
+    calls = 0
+
+    def subscriber(owner: object, value: Any) -> None:
+        nonlocal calls
+        calls += 1
+
+    source = Event[int]()
+    derived = derive(source)
+    # every subscriber needs to be a distinct callable; bind to distinct owners
+    derived += [subscriber.__get__(object()) for _ in range(SUBSCRIBERS)]
+
+    duration = 0.0
+    for burst in range(FIRES // BURST):
+        start = perf_counter()
+        for value in range(burst * BURST, (burst + 1) * BURST):
+            source.fire(value)
+        duration += perf_counter() - start
+        # lets timers expire between bursts
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.1)
+    return duration, calls
+
+
+async def main() -> None:
+    operators: list[tuple[str, Callable[[Event[int]], Event[Any]]]] = [
+        ("direct", lambda source: source),
+        ("throttle(0.05)", lambda source: throttle(source, 0.05)),
+        ("debounce(0.005)", lambda source: debounce(source, 0.005)),
+        ("coalesce(0.05, 10 keys)", lambda source: coalesce(source, 0.05, lambda v: v % 10)),
+        ("sample(0.05)", lambda source: sample(source, 0.05)),
+        ("buffer(count=100)", lambda source: buffer(source, count=100)),
+        ("buffer(time=0.05)", lambda source: buffer(source, time=0.05)),
+    ]
+
+    print(f"{FIRES} fires, {SUBSCRIBERS} subscribers")
+    print(f"{'operator':>24} {'firing':>10} {'per fire':>10} {'subscriber calls':>18}")
+    for name, derive in operators:
+        duration, calls = await measure(derive)
+        print(f"{name:>24} {duration * 1e3:>7.1f} ms {duration / FIRES * 1e9:>7.0f} ns {calls:>18}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,64 @@
+"""Compares fire, subscribe and unsubscribe costs of events with and without priorities.
+
+Run with `poetry run python benchmarks/priority.py`; the firing order is precomputed,
+so firing a prioritized event costs the same as firing an unprioritized one.
+"""
+
+import time
+import timeit
+from typing import Any
+
+from evento import Event
+
+
+def noop(owner: object, value: Any) -> None:
+    pass
+
+
+def make_subscribers(count: int) -> list[Any]:
+    # every subscriber needs to be a distinct callable; bind noop to distinct owners
+    return [noop.__get__(object()) for _ in range(count)]
+
+
+def subscribe(event: Event[Any], subscribers: list[Any], priorities: int) -> float:
+    start = time.perf_counter()
+    for index, subscriber in enumerate(subscribers):
+        event.append(subscriber, priority=index % priorities if priorities > 1 else 0)
+    return time.perf_counter() - start
+
+
+def unsubscribe(event: Event[Any], subscribers: list[Any]) -> float:
+    start = time.perf_counter()
+    for subscriber in subscribers:
+        event.remove(subscriber)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    print(
+        f"{'subscribers':>12} {'priorities':>11} {'fire':>14} {'per subscriber':>16}"
+        f" {'subscribe':>12} {'unsubscribe':>12}"
+    )
+    for count in (10, 1000, 100_000):
+        for priorities in (1, 10, 1000):
+            subscribers = make_subscribers(count)
+            e = Event[int]()
+
+            subscribe_time = subscribe(e, subscribers, priorities)
+
+            number = max(1_000_000 // count, 10)
+            e.fire(1)  # takes the snapshot
+            fire_time = min(timeit.repeat(lambda: e.fire(1), number=number, repeat=5)) / number
+
+            unsubscribe_time = unsubscribe(e, subscribers)
+
+            print(
+                f"{count:>12} {priorities:>11} {fire_time * 1e9:>11.0f} ns"
+                f" {fire_time / count * 1e9:>13.1f} ns"
+                f" {subscribe_time / count * 1e9:>9.0f} ns"
+                f" {unsubscribe_time / count * 1e9:>9.0f} ns"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Measures the throughput of `QueuedEvent`: the time it takes to fire 1M values
+and dispatch them to a single subscriber, for different batch sizes and backpressures,
+compared with firing an `AsyncEvent` directly.
+
+Run with `poetry run python benchmarks/queued.py [number of values]`.
+"""
+
+import asyncio
+import sys
+from time import perf_counter
+from typing import Any
+
+from evento import AsyncEvent, QueuedEvent
+from evento.queued import Backpressure
+
+
+async def noop(value: Any) -> None:
+    pass
+
+
+async def noop_batch(values: Any) -> None:
+    pass
+
+
+async def measure_direct(count: int) -> float:
+    e = AsyncEvent[int]()
+    e += noop
+    start = perf_counter()
+    for value in range(count):
+        await e.fire(value)
+    return perf_counter() - start
+
+
+async def measure_queued(
+    count: int, backpressure: Backpressure, batch_size: int, batches: bool
+) -> tuple[float, QueuedEvent[int]]:
+    e = QueuedEvent[int](maxsize=1024, backpressure=backpressure, batch_size=batch_size)
+    if batches:
+        e.append_batch(noop_batch)
+    else:
+        e.append(noop)
+
+    start = perf_counter()
+    if backpressure == "block":
+        for value in range(count):
+            await e.fire(value)
+    else:
+        for value in range(count):
+            e.fire_nowait(value)
+            if not value % 1024:
+                # lets the consumer catch up
+                await asyncio.sleep(0)
+    await e.join()
+    duration = perf_counter() - start
+    await e.close()
+    return duration, e
+
+
+async def main(count: int) -> None:
+    print(f"{count} values")
+    print(f"{'mode':>34} {'duration':>10} {'throughput':>16} {'dropped':>9}")
+
+    duration = await measure_direct(count)
+    print(f"{'AsyncEvent.fire':>34} {duration:>8.2f} s {count / duration:>10.0f} ev/s")
+
+    configs: list[tuple[Backpressure, int, bool]] = [
+        ("block", 1, False),
+        ("block", 64, False),
+        ("block", 64, True),
+        ("drop_newest", 64, True),
+        ("drop_oldest", 64, True),
+        ("coalesce", 64, True),
+    ]
+    for backpressure, batch_size, batches in configs:
+        duration, e = await measure_queued(count, backpressure, batch_size, batches)
+        name = f"{backpressure}, batch_size={batch_size}{' (batch)' if batches else ''}"
+        print(
+            f"{name:>34} {duration:>8.2f} s {count / duration:>10.0f} ev/s"
+            f" {e.queue_stats.dropped + e.queue_stats.coalesced:>9}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000))
@@ -0,0 +1,57 @@
+"""Measures appending values to an `EventLog` (recording fires of an event) with
+different commit batch sizes (every commit flushes to disk), and replaying the log
+into an event.
+
+Run with `poetry run python benchmarks/recording.py`.
+"""
+
+import tempfile
+from time import perf_counter
+from typing import Any
+
+from evento import Event, EventLog, record
+
+VALUE = {"id": 1, "name": "order", "total": 12.5, "items": ["a", "b", "c"]}
+
+
+def write(commit_every: int, fsync: bool, count: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        log = EventLog(directory, commit_every=commit_every, commit_interval=60, fsync=fsync)
+        event = Event[Any]()
+        record(event, log)
+        start = perf_counter()
+        for _ in range(count):
+            event.fire(VALUE)
+        log.commit()
+        seconds = perf_counter() - start
+        log.close()
+
+    name = f"commit every {commit_every}{'' if fsync else ', no fsync'}"
+    print(f"{name:>30} {count / seconds:>10.0f} records/s")
+
+
+def replay(count: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        with EventLog(directory, fsync=False) as log:
+            log.extend([VALUE] * count)
+            size = log._end
+
+            event = Event[Any]()
+            event += lambda value: None
+            start = perf_counter()
+            log.replay(event)
+            seconds = perf_counter() - start
+
+    print(f"{'replay':>30} {count / seconds:>10.0f} records/s {size / seconds / 1e6:>8.0f} MB/s")
+
+
+def main() -> None:
+    write(1, True, 2_000)
+    write(100, True, 100_000)
+    write(1000, True, 300_000)
+    write(1000, False, 300_000)
+    replay(300_000)
+
+
+if __name__ == "__main__":
+    main()
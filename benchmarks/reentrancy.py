@@ -0,0 +1,38 @@
+"""Measures the cost of subscribing and unsubscribing from inside subscribers while firing.
+
+Run with `poetry run python benchmarks/reentrancy.py`.
+"""
+
+import timeit
+from typing import Any, Callable
+
+from evento import Event
+
+
+def main() -> None:
+    print(f"{'subscribers':>12} {'fire with churn':>16}")
+    for count in (10, 100, 1000):
+        e = Event[int]()
+
+        def make(index: int) -> Callable[[int], None]:
+            def subscriber(depth: int) -> None:
+                # every subscriber re-subscribes a neighbour
+                # and the first one recursively fires the event again
+                neighbour = subscribers[(index + 1) % count]
+                e.remove(neighbour)
+                e.append(neighbour)
+                if index == 0 and depth < 3:
+                    e.fire(depth + 1)
+
+            return subscriber
+
+        subscribers: list[Any] = [make(i) for i in range(count)]
+        e += subscribers
+
+        number = max(10_000 // count, 10)
+        fire_time = min(timeit.repeat(lambda: e.fire(0), number=number, repeat=5)) / number
+        print(f"{count:>12} {fire_time * 1e6:>13.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Measures the routing cost of `EventRegistry` for different numbers of topic patterns
+(4 segments deep, a quarter of them with wildcards): firing a cached topic, resolving
+a topic that isn't cached, and matching every pattern with `fnmatch` for comparison.
+
+Run with `poetry run python benchmarks/registry.py`.
+"""
+
+import random
+import timeit
+from fnmatch import fnmatchcase
+from typing import Any
+
+from evento import EventRegistry
+
+
+def noop(topic: str, value: Any) -> None:
+    pass
+
+
+def make_patterns(count: int, rng: random.Random) -> list[str]:
+    patterns: set[str] = set()
+    while len(patterns) < count:
+        segments = [f"s{rng.randrange(20)}" for _ in range(4)]
+        if rng.random() < 0.25:
+            segments[rng.randrange(4)] = "*"
+        patterns.add(".".join(segments))
+    return sorted(patterns)
+
+
+def main() -> None:
+    rng = random.Random(0)
+    print(f"{'patterns':>10} {'cached':>10} {'resolve':>10} {'fnmatch':>12}")
+    for count in (10, 100, 1000, 10000):
+        patterns = make_patterns(count, rng)
+        registry = EventRegistry[int](cache_size=1_000_000)
+        for pattern in patterns:
+            registry.subscribe(pattern, noop)
+
+        # topics that match at least one pattern
+        topics = [pattern.replace("*", "s0") for pattern in rng.choices(patterns, k=100)]
+        number = 100
+
+        def fire_all() -> None:
+            for topic in topics:
+                registry.fire(topic, 1)
+
+        fire_all()
+        cached = min(timeit.repeat(fire_all, number=number, repeat=5)) / number / len(topics)
+
+        def resolve_all() -> None:
+            registry._cache.clear()
+            fire_all()
+
+        resolve = min(timeit.repeat(resolve_all, number=number, repeat=5)) / number / len(topics)
+
+        def match_all() -> None:
+            for topic in topics[:10]:
+                for pattern in patterns:
+                    if fnmatchcase(topic, pattern):
+                        noop(topic, 1)
+
+        linear = min(timeit.repeat(match_all, number=1, repeat=3)) / 10
+
+        print(
+            f"{count:>10} {cached * 1e9:>7.0f} ns {resolve * 1e9:>7.0f} ns {linear * 1e9:>9.0f} ns"
+        )
+
+
+if __name__ == "__main__":
+    main()
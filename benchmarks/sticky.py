@@ -0,0 +1,53 @@
+"""Measures the fire cost of a `StickyEvent` (retaining 1 and 1000 values) compared
+to an `Event`, with 10 subscribers; and the memory allocated by 100000 fires after
+the ring buffer filled up (which should be none).
+
+Run with `poetry run python benchmarks/sticky.py`.
+"""
+
+import timeit
+import tracemalloc
+from typing import Callable
+
+from evento import Event, StickyEvent
+
+SUBSCRIBERS = 10
+FIRES = 100000
+
+
+def handler() -> Callable[[int], None]:
+    # every subscriber needs to be a distinct callable
+    def subscriber(value: int) -> None:
+        pass
+
+    return subscriber
+
+
+def measure(name: str, event: Event[int]) -> None:
+    for _ in range(SUBSCRIBERS):
+        event.append(handler())
+    number = 10000
+    seconds = min(timeit.repeat(lambda: event.fire(1), number=number, repeat=5)) / number
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for _ in range(FIRES):
+        event.fire(1)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(
+        stat.size_diff for stat in after.compare_to(before, "filename") if stat.size_diff > 0
+    )
+    print(
+        f"{name:>26} {seconds * 1e6:>6.2f} us/fire {allocated / FIRES:>6.2f} bytes allocated/fire"
+    )
+
+
+def main() -> None:
+    measure("Event", Event[int]())
+    measure("StickyEvent(retain=1)", StickyEvent[int]())
+    measure("StickyEvent(retain=1000)", StickyEvent[int](retain=1000))
+
+
+if __name__ == "__main__":
+    main()
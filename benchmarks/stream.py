@@ -0,0 +1,87 @@
+"""Measures consuming the values fired by an `AsyncEvent` in another task, in values
+per second: with a hand-written adapter subscriber that puts them in an
+`asyncio.Queue`, with `stream()` and with `stream().batches(100)`. The producer
+fires the values one by one (and yields to the consumer every 100 values).
+
+Run with `poetry run python benchmarks/stream.py`.
+"""
+
+import asyncio
+from time import perf_counter
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from evento import AsyncEvent
+
+VALUES = 200000
+MAXSIZE = 1024
+
+
+async def produce(event: AsyncEvent[int]) -> None:
+    for value in range(VALUES):
+        await event(value)
+        if value % 100 == 0:
+            await asyncio.sleep(0)
+    await event(-1)
+
+
+async def queue_adapter(event: AsyncEvent[int]) -> int:
+    queue: asyncio.Queue[int] = asyncio.Queue(MAXSIZE)
+
+    async def subscriber(value: int) -> None:
+        await queue.put(value)
+
+    event.append(subscriber)
+    count = 0
+    try:
+        while True:
+            value = await queue.get()
+            if value < 0:
+                return count
+            count += 1
+    finally:
+        event.remove(subscriber)
+
+
+async def stream(event: AsyncEvent[int]) -> int:
+    count = 0
+    async with event.stream(MAXSIZE) as values:
+        async for value in values:
+            if value < 0:
+                return count
+            count += 1
+    return count
+
+
+async def batches(event: AsyncEvent[int]) -> int:
+    count = 0
+    async with event.stream(MAXSIZE) as values:
+        batches: AsyncIterator[list[int]] = values.batches(100)
+        async for batch in batches:
+            for value in batch:
+                if value < 0:
+                    return count
+                count += 1
+    return count
+
+
+async def measure(name: str, consume: Callable[[AsyncEvent[int]], Awaitable[Any]]) -> None:
+    event = AsyncEvent[int]()
+    consumer = asyncio.ensure_future(consume(event))
+    # lets the consumer subscribe
+    await asyncio.sleep(0)
+    start = perf_counter()
+    await produce(event)
+    count = await consumer
+    seconds = perf_counter() - start
+    assert count == VALUES
+    print(f"{name:>22} {VALUES / seconds / 1e3:>8.0f}K values/s")
+
+
+async def main() -> None:
+    await measure("asyncio.Queue adapter", queue_adapter)
+    await measure("stream()", stream)
+    await measure("stream().batches(100)", batches)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,46 @@
+"""Measures how subscribing and unsubscribing scales with the number of subscribers.
+
+Run with `poetry run python benchmarks/subscribe.py`; with O(1) registry operations
+the per-subscriber cost stays flat as the subscriber count grows.
+"""
+
+import time
+from typing import Any, Callable
+
+from evento import Event
+
+
+def make_subscribers(count: int) -> list[Callable[[Any], None]]:
+    def make() -> Callable[[Any], None]:
+        def subscriber(value: Any) -> None:
+            pass
+
+        return subscriber
+
+    return [make() for _ in range(count)]
+
+
+def main() -> None:
+    print(f"{'subscribers':>12} {'subscribe':>14} {'unsubscribe':>14}")
+    for count in (10, 100, 1_000, 10_000, 100_000):
+        subscribers = make_subscribers(count)
+        event = Event[Any]()
+
+        start = time.perf_counter()
+        for subscriber in subscribers:
+            event += subscriber
+        subscribe_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for subscriber in subscribers:
+            event -= subscriber
+        unsubscribe_time = time.perf_counter() - start
+
+        print(
+            f"{count:>12} {subscribe_time / count * 1e9:>11.0f} ns"
+            f" {unsubscribe_time / count * 1e9:>11.0f} ns"
+        )
+
+
+if __name__ == "__main__":
+    main()
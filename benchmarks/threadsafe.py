@@ -0,0 +1,103 @@
+"""Compares fire throughput of `ThreadSafeEvent` with a naive, fully locked event.
+
+Run with `poetry run python benchmarks/threadsafe.py`.
+"""
+import threading
+import time
+from typing import Any, Callable, Iterable, Union
+
+from evento import Event, ThreadSafeEvent
+
+
+class LockedEvent(Event[Any]):
+    """Takes a lock for every fire, subscribe and unsubscribe"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._lock = threading.Lock()
+
+    def fire(self, value: Any) -> None:
+        with self._lock:
+            for subscriber in tuple(self._subscribers):
+                subscriber(value)
+
+    __call__ = fire
+
+    def append(
+        self,
+        subscribers: Union[Callable[..., Any], Iterable[Callable[..., Any]]],
+        priority: int = 0,
+        **options: Any,
+    ) -> None:
+        with self._lock:
+            super().append(subscribers, priority, **options)
+
+    def remove(self, subscriber: Callable[..., Any]) -> None:
+        with self._lock:
+            super().remove(subscriber)
+
+
+def noop(owner: object, value: Any) -> None:
+    pass
+
+
+def blocking(owner: object, value: Any) -> None:
+    # releases the GIL, like subscribers doing I/O
+    time.sleep(0)
+
+
+def measure(event: Event[Any], threads: int, churn: bool, fires: int) -> float:
+    stop = threading.Event()
+
+    def fire() -> None:
+        for i in range(fires // threads):
+            event(i)
+
+    def mutate() -> None:
+        def subscriber(value: Any) -> None:
+            pass
+
+        while not stop.is_set():
+            event.append(subscriber)
+            event.remove(subscriber)
+            time.sleep(0.0001)
+
+    firers = [threading.Thread(target=fire) for _ in range(threads)]
+    mutator = threading.Thread(target=mutate)
+
+    start = time.perf_counter()
+    if churn:
+        mutator.start()
+    for thread in firers:
+        thread.start()
+    for thread in firers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    stop.set()
+    if churn:
+        mutator.join()
+
+    return fires / elapsed
+
+
+def main() -> None:
+    print(
+        f"{'subscriber':>10} {'threads':>8} {'churn':>6} {'ThreadSafeEvent':>18} {'LockedEvent':>18}"
+    )
+    for subscriber, fires in ((noop, 200_000), (blocking, 4_000)):
+        for threads in (1, 4, 16):
+            for churn in (False, True):
+                results = []
+                for event_type in (ThreadSafeEvent, LockedEvent):
+                    event: Event[Any] = event_type()
+                    event += [subscriber.__get__(object()) for _ in range(10)]
+                    results.append(measure(event, threads, churn, fires))
+
+                print(
+                    f"{subscriber.__name__:>10} {threads:>8} {str(churn):>6}"
+                    f" {results[0]:>11.0f} fires/s {results[1]:>11.0f} fires/s"
+                )
+
+
+if __name__ == "__main__":
+    main()
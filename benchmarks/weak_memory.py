@@ -0,0 +1,62 @@
+"""Measures memory usage over many subscribe/drop cycles of objects that
+subscribe one of their methods to a long living event.
+
+Objects subscribed with `append_weak` are released once they are dropped,
+objects subscribed with `append` stay alive as long as the event does.
+
+Run with `poetry run python benchmarks/weak_memory.py [cycles]`.
+"""
+import gc
+import os
+import resource
+import sys
+import time
+from typing import Callable
+
+from evento import Event
+
+
+class Listener:
+    def __init__(self) -> None:
+        self.payload = bytearray(64)
+
+    def on_value(self, value: int) -> None:
+        pass
+
+
+def rss_mib() -> float:
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        # peak usage (in KiB on linux), when /proc isn't available
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**10
+
+
+def run(name: str, cycles: int, subscribe: Callable[[Event[int], Listener], None]) -> None:
+    event = Event[int]()
+    gc.collect()
+    print(f"{name}: {rss_mib():.1f} MiB before")
+    start = time.perf_counter()
+
+    for cycle in range(1, cycles + 1):
+        listener = Listener()
+        subscribe(event, listener)
+        del listener
+
+        if cycle % (cycles // 4) == 0:
+            print(f"{name}: {rss_mib():.1f} MiB after {cycle} cycles, {len(event)} subscribers")
+
+    print(f"{name}: {(time.perf_counter() - start) / cycles * 1e9:.0f} ns per cycle")
+
+
+def main() -> None:
+    cycles = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    run("append_weak", cycles, lambda event, listener: event.append_weak(listener.on_value))
+    # strong subscriptions are kept alive by the event, so keep these cycles limited
+    run("append", cycles // 10, lambda event, listener: event.append(listener.on_value))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
 from .async_event import AsyncEvent
+from .buffers import BufferEvent, BufferPool, Lease, PoolStats
+from .concurrency import Concurrency
 from .decorators import (
     async_event,
     event,
@@ -6,14 +8,79 @@ from .decorators import (
     triggers_before_event,
     triggers_beforeafter_events,
 )
+from .errors import (
+    ExceptionGroup,
+    SubscriberError,
+    log_errors,
+    raise_after_all,
+    raise_group,
+    route_errors,
+)
 from .event import Event
+from .executor import ExecutorDispatcher
+from .hooks import Hooks, add_hooks, remove_hooks
+from .instrumentation import EventStats, instrument, to_prometheus, uninstrument
+from .memoize import CacheAccess, Memoize
+from .mirror import Mirror, mirror
+from .operators import buffer, coalesce, debounce, sample, throttle
+from .queued import QueuedEvent, QueueStats
+from .recording import EventLog, record
+from .registry import EventRegistry, TopicEvent
+from .serialization import CompactSerializer, PickleSerializer, Serializer
+from .sticky import StickyEvent
+from .stream import Stream
+from .threadsafe import ThreadSafeEvent
+from .transport import SharedMemoryTransport, Transport, UnixSocketTransport
 
 __all__ = [
+    "add_hooks",
     "async_event",
     "AsyncEvent",
+    "buffer",
+    "BufferEvent",
+    "BufferPool",
+    "CacheAccess",
+    "CompactSerializer",
+    "coalesce",
+    "Concurrency",
+    "debounce",
     "event",
     "Event",
+    "ExceptionGroup",
+    "EventLog",
+    "EventRegistry",
+    "EventStats",
+    "ExecutorDispatcher",
+    "Hooks",
+    "instrument",
+    "Lease",
+    "log_errors",
+    "Memoize",
+    "mirror",
+    "Mirror",
+    "PickleSerializer",
+    "PoolStats",
+    "QueuedEvent",
+    "QueueStats",
+    "raise_after_all",
+    "raise_group",
+    "record",
+    "remove_hooks",
+    "route_errors",
+    "sample",
+    "Serializer",
+    "SharedMemoryTransport",
+    "StickyEvent",
+    "Stream",
+    "SubscriberError",
+    "ThreadSafeEvent",
+    "throttle",
+    "to_prometheus",
+    "TopicEvent",
+    "Transport",
     "triggers_after_event",
     "triggers_before_event",
     "triggers_beforeafter_events",
+    "uninstrument",
+    "UnixSocketTransport",
 ]
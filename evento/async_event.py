@@ -1,17 +1,57 @@
-from typing import Any, Awaitable, Callable, Generic, Iterable, TypeVar, Union
+from functools import partial
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
 
 from .base import BaseEvent
+from .concurrency import Concurrency
+from .stream import Stream, StreamPolicy
+from .subscribers import AsyncWeakSubscriber, BatchSubscriber
 
 T = TypeVar("T")
 
 
 class AsyncEvent(Generic[T], BaseEvent):
+    __slots__ = ("_concurrency",)
+
+    _weak_subscriber_type = AsyncWeakSubscriber
+
+    def __init__(self, concurrency: Optional[Concurrency] = None) -> None:
+        """When `concurrency` is given, every fire runs the subscribers concurrently"""
+        super().__init__()
+        self._concurrency = concurrency
+
     async def fire(self, value: T) -> None:
-        for subscriber in self._iter():
-            await subscriber(value)
+        await self._fire_async((value,), {}, None, self._concurrency)
 
     __call__ = fire
 
+    async def fire_many(self, values: Iterable[T]) -> None:
+        """Fires the event for every one of the given `values`, with a single
+        bookkeeping cycle for the entire batch.
+
+        Every subscriber receives all values before the next subscriber is awaited;
+        batch subscribers (see `append_batch`) receive `values` in a single call,
+        without copying unless `values` is an iterator."""
+        if iter(values) is values:
+            values = list(values)
+        await self._fire_async((values,), {}, partial(_fire_many, values))
+
+    async def fire_concurrent(self, value: T, concurrency: Optional[Concurrency] = None) -> None:
+        """Fires the event, running all subscribers concurrently using the given
+        `concurrency` options, falling back to the event's own options"""
+        await self._fire_async(
+            (value,), {}, None, concurrency or self._concurrency or Concurrency()
+        )
+
     def __iadd__(
         self,
         subscribers: Union[Callable[[T], Awaitable[Any]], Iterable[Callable[[T], Awaitable[Any]]]],
@@ -22,19 +62,57 @@ class AsyncEvent(Generic[T], BaseEvent):
 
     def __isub__(self, subscriber: Callable[[T], Awaitable[Any]]) -> "AsyncEvent[T]":
         """Removes given `subscriber` and returns this Event"""
-        # only modify self if we're not currently firing
-        # otherwise queue the unsubscription for processing after firing is done
         self.remove(subscriber)
         return self
 
     def append(
         self,
         subscribers: Union[Callable[[T], Awaitable[Any]], Iterable[Callable[[T], Awaitable[Any]]]],
+        priority: int = 0,
     ) -> None:
-        super().append(subscribers)
+        super().append(subscribers, priority)
 
     def remove(self, subscriber: Callable[[T], Awaitable[Any]]) -> None:
         super().remove(subscriber)
 
-    def add(self, subscriber: Callable[[T], Awaitable[Any]]) -> Callable[[], Any]:
-        return super().add(subscriber)
+    def add(
+        self, subscriber: Callable[[T], Awaitable[Any]], priority: int = 0
+    ) -> Callable[[], Any]:
+        return super().add(subscriber, priority)
+
+    def append_weak(self, subscriber: Callable[[T], Awaitable[Any]], priority: int = 0) -> None:
+        super().append_weak(subscriber, priority)
+
+    def add_weak(
+        self, subscriber: Callable[[T], Awaitable[Any]], priority: int = 0
+    ) -> Callable[[], Any]:
+        return super().add_weak(subscriber, priority)
+
+    def append_batch(
+        self, subscriber: Callable[[Sequence[T]], Awaitable[Any]], priority: int = 0
+    ) -> None:
+        """Adds a `subscriber` that receives a sequence of values instead of a single value;
+        all values of a `fire_many` batch at once. It can be removed using `remove`."""
+        self.append(BatchSubscriber(subscriber), priority)
+
+    def add_batch(
+        self, subscriber: Callable[[Sequence[T]], Awaitable[Any]], priority: int = 0
+    ) -> Callable[[], Any]:
+        """Same as `append_batch` but returns a callable without arguments
+        that can be used to unsubscribe the `subscriber`"""
+        return self.add(BatchSubscriber(subscriber), priority)
+
+    def stream(self, maxsize: int = 1024, policy: StreamPolicy = "block") -> Stream[T]:
+        """Returns an async iterator over the values fired from now on, which are
+        buffered (up to `maxsize` values, see `Stream` for the `policy` when it's full)
+        until they're taken; close it (e.g. with `aclose`) to unsubscribe"""
+        return Stream(self, maxsize, policy)
+
+
+async def _fire_many(values: Iterable[Any], subscriber: Callable[..., Awaitable[Any]]) -> None:
+    # the subscriber's part of AsyncEvent.fire_many
+    if type(subscriber) is BatchSubscriber:
+        await subscriber.subscriber(values)
+    else:
+        for value in values:
+            await subscriber(value)
@@ -1,89 +1,436 @@
+import bisect
+import inspect
 import logging
-from typing import Any, Callable, Generator, Iterable, Union
+import weakref
+from itertools import chain
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Union,
+    cast,
+)
+
+from .concurrency import Concurrency
+from .errors import ErrorPolicy, SubscriberError, SubscriberErrors
+from .subscribers import BatchSubscriber, WeakSubscriber
+
+if TYPE_CHECKING:
+    from .filters import KeyedSubscribers
+    from .hooks import Hooks
+    from .instrumentation import EventStats
 
 log = logging.getLogger(__name__)
 
+# shared by all events without subscribers, so they don't need a dict of their own;
+# read-only, appending replaces it with a new dict
+NO_SUBSCRIBERS = cast(dict[Callable[..., Any], int], MappingProxyType({}))
+
+
+class _Extras:
+    """The state of an event that most events don't need, see `BaseEvent._get_extras`"""
+
+    __slots__ = ("buckets", "levels", "error_policy", "keyed", "stats", "hooks")
+
+    def __init__(self) -> None:
+        # once a subscriber with a non-default priority is added, the subscribers are
+        # also kept in insertion-ordered buckets per priority, which are fired from the
+        # highest to the lowest priority
+        self.buckets: Optional[dict[int, dict[Callable[..., Any], None]]] = None
+        # sorted (ascending) priorities of the buckets
+        self.levels: list[int] = []
+        self.error_policy: Optional[ErrorPolicy] = None
+        # set once keyed subscribers were added, see `Event.append`
+        self.keyed: Optional[dict[tuple[Callable[..., Any], int], "KeyedSubscribers"]] = None
+        # set while the event is instrumented, see `instrumentation.instrument`
+        self.stats: Optional["EventStats"] = None
+        # the hooks of the event itself, see `hooks.add_hooks`
+        self.hooks: list["Hooks"] = []
+
 
 class BaseEvent:
+    __slots__ = (
+        "_subscribers",
+        "_snapshot",
+        "_fireCount",
+        "_currentFireCount",
+        "_dead_subscribers",
+        "_extras",
+        "__weakref__",
+    )
+
+    _weak_subscriber_type = WeakSubscriber
+
     @property
     def is_firing(self) -> bool:
         return self._currentFireCount > 0
 
+    @property
+    def error_policy(self) -> Optional[ErrorPolicy]:
+        """What happens when subscribers raise during `fire` (or `fire_many`).
+
+        Without a policy (the default) the exception propagates right away and the
+        remaining subscribers are skipped. With a policy (see `errors`) the remaining
+        subscribers are still invoked, after which the policy gets all exceptions.
+        Either way the event's bookkeeping is restored."""
+        extras = self._extras
+        return None if extras is None else extras.error_policy
+
+    @error_policy.setter
+    def error_policy(self, policy: Optional[ErrorPolicy]) -> None:
+        self._get_extras().error_policy = policy
+
     def __init__(self) -> None:
-        self._subscribers: list[Callable[..., Any]] = []
+        # a dict (mapping subscribers to their priority) is used as an insertion-ordered
+        # set; it keeps the firing order while making membership checks, appends and
+        # removals O(1)
+        self._subscribers: dict[Callable[..., Any], int] = NO_SUBSCRIBERS
+        # copy-on-write snapshot of the subscribers that fires iterate over;
+        # reset whenever the subscribers change and rebuilt by the next fire,
+        # fires that are already in progress keep iterating their own snapshot
+        self._snapshot: Optional[tuple[Callable[..., Any], ...]] = ()
         self._fireCount = 0
         self._currentFireCount = 0
-        self._add_queue: list[Callable[..., Any]] = []
-        self._remove_queue: list[Callable[..., Any]] = []
+        # set when weakly referenced subscribers got garbage collected;
+        # they are pruned when the next snapshot is taken
+        self._dead_subscribers = False
+        # the state that most events don't need, allocated by the first one that does
+        self._extras: Optional[_Extras] = None
+
+    def _get_extras(self) -> "_Extras":
+        extras = self._extras
+        if extras is None:
+            extras = self._extras = _Extras()
+        return extras
+
+    def _fire(
+        self,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        call: Optional[Callable[[Callable[..., Any]], Any]] = None,
+    ) -> None:
+        """Invokes the subscribers with `args` and `kwargs`, or by `call` when given
+        (for batches); all fire methods of (synchronous) events end up here"""
+        subscribers = self._snapshot
+        if subscribers is None:
+            subscribers = self._take_snapshot()
+        if not subscribers:
+            # firing events without subscribers is common, e.g. unobserved methods
+            self._fireCount += 1
+            return
+
+        self._currentFireCount += 1
+
+        # iterated explicitly, so the remaining subscribers can be resumed when one raises;
+        # a single try block is all the fire pays for that when none does
+        remaining = iter(subscribers)
+        try:
+            # separate loops, so fires don't pay for a branch per subscriber; a single
+            # value is passed as is, unpacking it would be much slower for bound methods
+            if call is None and len(args) == 1 and not kwargs:
+                (value,) = args
+                for subscriber in remaining:
+                    # the subscriber might have got removed by one of the previous subscribers
+                    if subscribers is not self._snapshot and subscriber not in self._subscribers:
+                        continue
+                    subscriber(value)
+            elif call is None:
+                for subscriber in remaining:
+                    if subscribers is not self._snapshot and subscriber not in self._subscribers:
+                        continue
+                    subscriber(*args, **kwargs)
+            else:
+                for subscriber in remaining:
+                    if subscribers is not self._snapshot and subscriber not in self._subscribers:
+                        continue
+                    call(subscriber)
+        except Exception as error:
+            self._continue_fire(error, subscriber, remaining, subscribers, args, kwargs, call)
+        finally:
+            self._currentFireCount -= 1
+            self._fireCount += 1
+
+    async def _fire_async(
+        self,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        call: Optional[Callable[[Callable[..., Any]], Awaitable[Any]]] = None,
+        concurrency: Optional[Concurrency] = None,
+    ) -> None:
+        """Same as `_fire`, for async events; the subscribers are awaited one by one,
+        or run concurrently with the given `concurrency` options (which don't
+        support `call`)"""
+        subscribers = self._snapshot
+        if subscribers is None:
+            subscribers = self._take_snapshot()
+
+        if concurrency is not None:
+            await self._fire_concurrent(subscribers, concurrency, *args, **kwargs)
+            return
+
+        self._currentFireCount += 1
+
+        remaining = iter(subscribers)
+        try:
+            if call is None and len(args) == 1 and not kwargs:
+                (value,) = args
+                for subscriber in remaining:
+                    if subscribers is not self._snapshot and subscriber not in self._subscribers:
+                        continue
+                    await subscriber(value)
+            elif call is None:
+                for subscriber in remaining:
+                    if subscribers is not self._snapshot and subscriber not in self._subscribers:
+                        continue
+                    await subscriber(*args, **kwargs)
+            else:
+                for subscriber in remaining:
+                    if subscribers is not self._snapshot and subscriber not in self._subscribers:
+                        continue
+                    await call(subscriber)
+        except Exception as error:
+            await self._continue_fire_async(
+                error, subscriber, remaining, subscribers, args, kwargs, call
+            )
+        finally:
+            self._currentFireCount -= 1
+            self._fireCount += 1
+
+    def _continue_fire(
+        self,
+        error: Exception,
+        subscriber: Callable[..., Any],
+        remaining: Iterator[Callable[..., Any]],
+        snapshot: tuple[Callable[..., Any], ...],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        call: Optional[Callable[[Callable[..., Any]], Any]] = None,
+    ) -> None:
+        """Handles the `error` raised by `subscriber` according to the error policy;
+        invokes the `remaining` subscribers of the fire's `snapshot` and passes all
+        exceptions to the policy. Subscribers are invoked with `args` and `kwargs`, or by
+        `call` when given (for batches)."""
+        policy = self.error_policy
+        if policy is None:
+            raise error
+
+        errors = _errors(self, subscriber, error)
+        for subscriber in remaining:
+            if snapshot is not self._snapshot and subscriber not in self._subscribers:
+                continue
+            try:
+                if call is None:
+                    subscriber(*args, **kwargs)
+                else:
+                    call(subscriber)
+            except Exception as error:
+                errors.extend(_errors(self, subscriber, error))
+        policy(errors)
+
+    async def _continue_fire_async(
+        self,
+        error: Exception,
+        subscriber: Callable[..., Any],
+        remaining: Iterator[Callable[..., Any]],
+        snapshot: tuple[Callable[..., Any], ...],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        call: Optional[Callable[[Callable[..., Any]], Awaitable[Any]]] = None,
+    ) -> None:
+        """Same as `_continue_fire`, for async events"""
+        policy = self.error_policy
+        if policy is None:
+            raise error
+
+        errors = _errors(self, subscriber, error)
+        for subscriber in remaining:
+            if snapshot is not self._snapshot and subscriber not in self._subscribers:
+                continue
+            try:
+                if call is None:
+                    await subscriber(*args, **kwargs)
+                else:
+                    await call(subscriber)
+            except Exception as error:
+                errors.extend(_errors(self, subscriber, error))
+
+        result = policy(errors)
+        if inspect.isawaitable(result):
+            await result
+
+    async def _fire_concurrent(
+        self,
+        subscribers: tuple[Callable[..., Any], ...],
+        concurrency: Concurrency,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        self._currentFireCount += 1
 
-    def _fire(self, *args: Any, **kwargs: Any) -> Any:
-        for subscriber in self._iter():
-            subscriber(*args, **kwargs)
+        try:
+            policy = self.error_policy
+            if policy is None:
+                await concurrency.run(subscribers, *args, **kwargs)
+                return
 
-    def append(self, subscribers: Union[Callable[..., Any], Iterable[Callable[..., Any]]]) -> None:
+            errors = []
+            for subscriber, error in await concurrency.run_collecting(subscribers, *args, **kwargs):
+                errors.extend(_errors(self, subscriber, error))
+            if errors:
+                result = policy(errors)
+                if inspect.isawaitable(result):
+                    await result
+        finally:
+            self._currentFireCount -= 1
+            self._fireCount += 1
+
+    def append(
+        self,
+        subscribers: Union[Callable[..., Any], Iterable[Callable[..., Any]]],
+        priority: int = 0,
+    ) -> None:
+        """Adds the given subscriber(s). Subscribers with a higher `priority` are invoked
+        first, subscribers with the same priority in the order they were added.
+        Subscribers that were already added are ignored (and keep their priority).
+        Subscribers have to be hashable (like functions, methods and events)."""
         if callable(subscribers):
             subscribers = [subscribers]
 
+        if self._dead_subscribers:
+            self._prune()
+
         for subscriber in subscribers:
-            if subscriber not in self._subscribers:
-                if self.is_firing:
-                    self._add_queue.append(subscriber)
-                else:
-                    self._subscribers.append(subscriber)
+            try:
+                subscribed = subscriber in self._subscribers
+            except TypeError:
+                raise TypeError(
+                    f"Subscribers have to be hashable, got {type(subscriber).__name__}"
+                ) from None
+            if not subscribed:
+                if priority or (self._extras is not None and self._extras.buckets is not None):
+                    self._bucket(priority)[subscriber] = None
+                if self._subscribers is NO_SUBSCRIBERS:
+                    self._subscribers = {}
+                self._subscribers[subscriber] = priority
+                self._snapshot = None
 
     def remove(self, subscriber: Callable[..., Any]) -> None:
-        if self.is_firing:
-            self._remove_queue.append(subscriber)
-            return
-
         if subscriber not in self._subscribers:
             log.warning("Got unknown subscriber to remove from event")
             return
 
-        self._subscribers.remove(subscriber)
+        priority = self._subscribers.pop(subscriber)
+        extras = self._extras
+        if extras is not None and extras.buckets is not None:
+            bucket = extras.buckets[priority]
+            del bucket[subscriber]
+            if not bucket:
+                del extras.buckets[priority]
+                del extras.levels[bisect.bisect_left(extras.levels, priority)]
+        self._snapshot = None
 
-    def add(self, subscriber: Callable[..., Any]) -> Callable[[], None]:
+    def add(self, subscriber: Callable[..., Any], priority: int = 0) -> Callable[[], None]:
         """Same as `append` but returns a callable without arguments
         that can be used to unsubscribe the `subscriber`"""
-        self.append(subscriber)
+        self.append(subscriber, priority)
 
         def unsub() -> None:
             self.remove(subscriber)
 
         return unsub
 
-    def _iter(self) -> Generator[Callable[..., Any], None, None]:
-        # count the number of (recursive) fires currently happening
-        self._currentFireCount += 1
+    def append_weak(self, subscriber: Callable[..., Any], priority: int = 0) -> None:
+        """Same as `append`, but only keeps a weak reference to the `subscriber`;
+        it is removed automatically once it is garbage collected.
+        For bound methods only the method's object has to be kept alive."""
+        if subscriber not in self._subscribers:
+            self.append(self._weak(subscriber), priority)
 
-        # execute all subscribers
-        for subscriber in self._subscribers:
-            # the handler might have got unsubscribed
-            # inside one of the previous subscribers
-            if subscriber not in self._remove_queue:
-                # self._invoke(subscriber, value)
-                yield subscriber
+    def add_weak(self, subscriber: Callable[..., Any], priority: int = 0) -> Callable[[], None]:
+        """Same as `append_weak` but returns a callable without arguments
+        that can be used to unsubscribe the `subscriber`"""
+        # the returned callable shouldn't keep the subscriber alive either
+        weak = self._weak(subscriber)
+        self.append(weak, priority)
 
-        # current fire cycle is done, uncount it
-        self._currentFireCount -= 1
+        def unsub() -> None:
+            self.remove(weak)
 
-        # we're counting the number of fires (mostly for testing purposes)
-        self._fireCount += 1
+        return unsub
 
-        # only if we're not still in a recursive fire situation
-        if not self.is_firing:
-            self._process_queues()
+    def _weak(
+        self,
+        subscriber: Callable[..., Any],
+        weak_type: Optional[Callable[[Any, Callable[[], None]], WeakSubscriber]] = None,
+    ) -> WeakSubscriber:
+        event_ref = weakref.ref(self)
 
-    def _process_queues(self) -> None:
-        for subscriber in self._add_queue:
-            self.append(subscriber)
+        def on_dead() -> None:
+            # garbage collection can happen at any time (even while taking a snapshot),
+            # so the subscribers aren't modified here, only flagged for pruning
+            event = event_ref()
+            if event is not None:
+                event._dead_subscribers = True
+                event._snapshot = None
 
-        for subscriber in self._remove_queue:
-            self.remove(subscriber)
+        return (weak_type or self._weak_subscriber_type)(subscriber, on_dead)
+
+    def _bucket(self, priority: int) -> dict[Callable[..., Any], None]:
+        extras = self._get_extras()
+        buckets = extras.buckets
+        if buckets is None:
+            # until now all subscribers had the default priority,
+            # so they're already in firing order
+            buckets = extras.buckets = {0: dict.fromkeys(self._subscribers)}
+            extras.levels = [0]
+
+        bucket = buckets.get(priority)
+        if bucket is None:
+            bucket = buckets[priority] = {}
+            bisect.insort(extras.levels, priority)
+        return bucket
+
+    def _take_snapshot(self) -> tuple[Callable[..., Any], ...]:
+        if self._dead_subscribers:
+            self._prune()
 
-        # reset processed queues
-        self._add_queue = []
-        self._remove_queue = []
+        extras = self._extras
+        if extras is None or extras.buckets is None:
+            snapshot = tuple(self._subscribers)
+        else:
+            buckets = extras.buckets
+            snapshot = tuple(chain.from_iterable(buckets[p] for p in reversed(extras.levels)))
+        # assigned here (and not by overrides), so it happens under the lock of thread-safe events
+        self._snapshot = snapshot = self._wrap_snapshot(snapshot)
+        return snapshot
+
+    def _wrap_snapshot(
+        self, snapshot: tuple[Callable[..., Any], ...]
+    ) -> tuple[Callable[..., Any], ...]:
+        # overridden by layers that wrap the subscribers in the snapshot
+        return snapshot
+
+    def _prune(self) -> None:
+        self._dead_subscribers = False
+        self._subscribers = {
+            subscriber: priority
+            for subscriber, priority in self._subscribers.items()
+            if not _dead(subscriber)
+        }
+        extras = self._extras
+        if extras is not None and extras.buckets is not None:
+            buckets = {
+                priority: {s: None for s in bucket if s in self._subscribers}
+                for priority, bucket in extras.buckets.items()
+            }
+            extras.buckets = {priority: bucket for priority, bucket in buckets.items() if bucket}
+            extras.levels = sorted(extras.buckets)
+        self._snapshot = None
 
     def __repr__(self) -> str:
         return f"Event(id={id(self)}, len={len(self)})"
@@ -91,8 +438,36 @@ class BaseEvent:
     def __eq__(self, other: Any) -> bool:
         return id(self) == id(other)
 
+    # consistent with __eq__, so events can subscribe to other events
+    __hash__ = object.__hash__
+
     def __len__(self) -> int:
-        return len(self._subscribers)
+        if self._dead_subscribers:
+            self._take_snapshot()
+        keyed = None if self._extras is None else self._extras.keyed
+        if not keyed:
+            return len(self._subscribers)
+        # keyed subscribers are subscribed through an index per key function
+        return len(self._subscribers) + sum(len(index.matches) - 1 for index in keyed.values())
 
     def __contains__(self, subscriber: Callable[..., Any]) -> bool:
-        return subscriber in self._subscribers
+        if subscriber in self._subscribers:
+            return True
+        keyed = None if self._extras is None else self._extras.keyed
+        return keyed is not None and any(subscriber in index for index in keyed.values())
+
+
+def _errors(
+    event: BaseEvent, subscriber: Callable[..., Any], error: Exception
+) -> list[SubscriberError]:
+    # subscribers that invoke other subscribers report their exceptions as a whole
+    if isinstance(error, SubscriberErrors):
+        return list(error.errors)
+    return [SubscriberError(event, subscriber, error)]
+
+
+def _dead(subscriber: Callable[..., Any]) -> bool:
+    # weak subscribers can be subscribed as batch subscribers, see `Stream`
+    if type(subscriber) is BatchSubscriber:
+        subscriber = subscriber.subscriber
+    return isinstance(subscriber, WeakSubscriber) and subscriber.dead
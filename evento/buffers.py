@@ -0,0 +1,236 @@
+import threading
+from typing import Iterable, Optional, Union
+
+from .event import Event
+
+
+class PoolStats:
+    """The metrics of a `BufferPool`"""
+
+    __slots__ = ("acquired", "allocated", "allocated_bytes", "reused", "retained", "in_use")
+
+    def __init__(self) -> None:
+        self.acquired = 0
+        # buffers that were created because there was no free one
+        self.allocated = 0
+        self.allocated_bytes = 0
+        self.reused = 0
+        # released buffers that weren't reused, because views of them were still in use
+        self.retained = 0
+        self.in_use = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {
+            "acquired": self.acquired,
+            "allocated": self.allocated,
+            "allocated_bytes": self.allocated_bytes,
+            "reused": self.reused,
+            "retained": self.retained,
+            "in_use": self.in_use,
+        }
+
+
+class BufferPool:
+    """Reusable buffers, in size classes of powers of two (of at least `min_size`
+    bytes); keeps up to `max_free` released buffers per size class"""
+
+    __slots__ = ("min_size", "max_free", "stats", "_free", "_lock")
+
+    def __init__(self, min_size: int = 4096, max_free: int = 8) -> None:
+        if min_size < 1:
+            raise ValueError("min_size should be at least 1")
+        self.min_size = min_size
+        self.max_free = max_free
+        self.stats = PoolStats()
+        # size => the free buffers of that size
+        self._free: dict[int, list[bytearray]] = {}
+        # leases can be released by other threads
+        self._lock = threading.Lock()
+
+    def acquire(self, size: int) -> "Lease":
+        """Returns a lease on a (writable) buffer of `size` bytes"""
+        capacity = max(self.min_size, 1 << (size - 1).bit_length())
+        stats = self.stats
+        with self._lock:
+            free = self._free.get(capacity)
+            if free:
+                buffer = free.pop()
+                stats.reused += 1
+            else:
+                buffer = bytearray(capacity)
+                stats.allocated += 1
+                stats.allocated_bytes += capacity
+            stats.acquired += 1
+            stats.in_use += 1
+        return Lease(_Frame(self, buffer, size))
+
+    def _recycle(self, buffer: bytearray) -> None:
+        with self._lock:
+            self.stats.in_use -= 1
+            try:
+                # resizing fails while there are views of the buffer (like slices that a
+                # subscriber kept); those keep the buffer, so they never show other contents
+                buffer.pop()
+                buffer.append(0)
+            except BufferError:
+                self.stats.retained += 1
+                return
+            free = self._free.setdefault(len(buffer), [])
+            if len(free) < self.max_free:
+                free.append(buffer)
+
+    def clear(self) -> None:
+        """Drops the free buffers"""
+        with self._lock:
+            self._free.clear()
+
+
+class _Frame:
+    """A pooled buffer with the number of leases on it; goes back to the pool
+    (and its views get released) when the last lease is released"""
+
+    __slots__ = ("pool", "buffer", "view", "readonly", "leases")
+
+    def __init__(self, pool: BufferPool, buffer: bytearray, size: int) -> None:
+        self.pool = pool
+        self.buffer = buffer
+        self.view = memoryview(buffer)[:size]
+        self.readonly = self.view.toreadonly()
+        self.leases = 1
+
+    def lease(self) -> "Lease":
+        with self.pool._lock:
+            if self.leases == 0:
+                raise ValueError("The buffer was released")
+            self.leases += 1
+        return Lease(self)
+
+    def release(self) -> None:
+        with self.pool._lock:
+            self.leases -= 1
+            if self.leases > 0:
+                return
+        # views that were handed out no longer work; views sliced from them keep
+        # working, and keep the buffer from being reused (see BufferPool._recycle)
+        for view in (self.readonly, self.view):
+            try:
+                view.release()
+            except BufferError:
+                # something (like numpy) still uses it
+                pass
+        self.pool._recycle(self.buffer)
+
+
+class Lease:
+    """Keeps a pooled buffer from being reused until `release` is called (also
+    when used as a context manager); `view` is a memoryview of its contents"""
+
+    __slots__ = ("_frame",)
+
+    def __init__(self, frame: _Frame) -> None:
+        self._frame: Optional[_Frame] = frame
+
+    @property
+    def view(self) -> memoryview:
+        """The (writable) contents of the buffer"""
+        return self._get_frame().view
+
+    @property
+    def readonly(self) -> memoryview:
+        return self._get_frame().readonly
+
+    @property
+    def released(self) -> bool:
+        return self._frame is None
+
+    def lease(self) -> "Lease":
+        """Returns another lease on the same buffer"""
+        return self._get_frame().lease()
+
+    def release(self) -> None:
+        """Releases the lease; releasing it again does nothing"""
+        frame, self._frame = self._frame, None
+        if frame is not None:
+            frame.release()
+
+    def _get_frame(self) -> _Frame:
+        frame = self._frame
+        if frame is None:
+            raise ValueError("The lease was released")
+        return frame
+
+    def __enter__(self) -> "Lease":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.release()
+
+    def __len__(self) -> int:
+        return len(self._get_frame().view)
+
+    def __repr__(self) -> str:
+        if self._frame is None:
+            return "Lease(released)"
+        return f"Lease(size={len(self._frame.view)})"
+
+
+Payload = Union[Lease, bytes, bytearray, memoryview]
+
+
+class BufferEvent(Event[memoryview]):
+    """Event that delivers bytes as read-only memoryviews of pooled buffers, so
+    subscribers can slice and forward them without copying.
+
+    Fire a `Lease` from `acquire` (after writing the contents into its `view`, e.g.
+    using `readinto`) to avoid copying at all; the fire takes over the lease and
+    releases it when the subscribers are done. Other bytes-like values are copied
+    into a pooled buffer once.
+
+    The views are only valid while the subscribers run, because the buffer gets reused;
+    a subscriber that needs the contents later calls `lease` while it runs, and releases
+    the lease when it's done with them. Slices of the views that are kept after the fire
+    keep working, but keep their buffer from being reused (see `PoolStats.retained`)."""
+
+    __slots__ = ("pool", "_firing")
+
+    def __init__(self, pool: Optional[BufferPool] = None) -> None:
+        super().__init__()
+        self.pool = pool or BufferPool()
+        # the frames being fired; more than one for nested fires
+        self._firing: list[_Frame] = []
+
+    def acquire(self, size: int) -> Lease:
+        """Returns a lease on a pooled buffer of `size` bytes, to fire once it's filled"""
+        return self.pool.acquire(size)
+
+    def fire(self, value: Payload) -> None:
+        if isinstance(value, Lease):
+            lease = value
+        else:
+            data = memoryview(value)
+            lease = self.pool.acquire(data.nbytes)
+            lease.view[:] = data.cast("B")
+
+        frame = lease._get_frame()
+        firing = self._firing
+        firing.append(frame)
+        try:
+            Event.fire(self, frame.readonly)
+        finally:
+            firing.pop()
+            lease.release()
+
+    __call__ = fire
+
+    def fire_many(self, values: Iterable[Payload]) -> None:
+        """Fires every one of the given `values`; batch subscribers
+        receive single item batches, as every buffer is released after its fire"""
+        for value in values:
+            self.fire(value)
+
+    def lease(self) -> Lease:
+        """Returns a lease on the buffer that is being fired; for subscribers
+        that need the contents after they returned"""
+        if not self._firing:
+            raise RuntimeError("lease can only be called while the event is firing")
+        return self._firing[-1].lease()
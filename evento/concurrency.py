@@ -0,0 +1,80 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional, Sequence
+
+from .errors import ExceptionGroup
+
+
+@dataclass(frozen=True)
+class Concurrency:
+    """Options for firing async subscribers concurrently instead of one after the other.
+
+    `max_concurrency` limits the number of subscribers that run at the same time
+    (unlimited when None) and `timeout` limits the duration of the entire fire
+    in seconds, cancelling subscribers that are still running when it expires
+    (raising `asyncio.TimeoutError`).
+
+    All subscribers run, even when some of them raise; the exceptions
+    are raised together afterwards in an `ExceptionGroup` (or passed to the
+    event's error policy, when it has one)."""
+
+    max_concurrency: Optional[int] = None
+    timeout: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        if self.max_concurrency is not None and self.max_concurrency < 1:
+            raise ValueError("max_concurrency should be at least 1")
+
+    async def run(
+        self, subscribers: Sequence[Callable[..., Awaitable[Any]]], *args: Any, **kwargs: Any
+    ) -> None:
+        errors = await self.run_collecting(subscribers, *args, **kwargs)
+        if errors:
+            raise ExceptionGroup(
+                f"{len(errors)} subscriber(s) raised", [error for _, error in errors]
+            )
+
+    async def run_collecting(
+        self, subscribers: Sequence[Callable[..., Awaitable[Any]]], *args: Any, **kwargs: Any
+    ) -> list[tuple[Callable[..., Awaitable[Any]], Exception]]:
+        """Same as `run`, but returns the subscribers that raised
+        with their exceptions instead of raising them"""
+        if self.timeout is None:
+            return await self._gather(subscribers, args, kwargs)
+        return await asyncio.wait_for(self._gather(subscribers, args, kwargs), self.timeout)
+
+    async def _gather(
+        self,
+        subscribers: Sequence[Callable[..., Awaitable[Any]]],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> list[tuple[Callable[..., Awaitable[Any]], Exception]]:
+        errors: list[tuple[Callable[..., Awaitable[Any]], Exception]] = []
+
+        if self.max_concurrency is None or len(subscribers) <= self.max_concurrency:
+            results = await asyncio.gather(
+                *(subscriber(*args, **kwargs) for subscriber in subscribers),
+                return_exceptions=True,
+            )
+
+            for subscriber, result in zip(subscribers, results):
+                if isinstance(result, Exception):
+                    errors.append((subscriber, result))
+                elif isinstance(result, BaseException):
+                    raise result
+
+            return errors
+
+        # a fixed number of workers share the subscribers,
+        # so there is no need for a task (and semaphore) per subscriber
+        pending = iter(subscribers)
+
+        async def worker() -> None:
+            for subscriber in pending:
+                try:
+                    await subscriber(*args, **kwargs)
+                except Exception as exc:
+                    errors.append((subscriber, exc))
+
+        await asyncio.gather(*(worker() for _ in range(self.max_concurrency)))
+        return errors
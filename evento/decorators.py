@@ -1,27 +1,83 @@
-from typing import Any, Awaitable, Callable
+from typing import Any, Awaitable, Callable, Optional, overload
 
+from .concurrency import Concurrency
 from .event import Event
+from .memoize import Memoize
 from .signature import AsyncSignatureEvent, P, R, SignatureEvent
 
 Method = Callable[..., Any]
 Observer = Callable[..., Any]
 
 
+@overload
 def event(method: Callable[P, R]) -> SignatureEvent[P, R]:
-    return SignatureEvent[P, R](method)
+    ...
 
 
+@overload
+def event(*, memoize: Optional[Memoize] = None) -> Callable[[Callable[P, R]], SignatureEvent[P, R]]:
+    ...
+
+
+def event(method: Optional[Callable[P, R]] = None, *, memoize: Optional[Memoize] = None) -> Any:
+    """Turns a method into a `SignatureEvent`;
+    use as `@event` or `@event(memoize=Memoize(...))`"""
+
+    def decorator(method: Callable[P, R]) -> SignatureEvent[P, R]:
+        return SignatureEvent[P, R](method, memoize=memoize)
+
+    return decorator if method is None else decorator(method)
+
+
+@overload
 def async_event(method: Callable[P, Awaitable[R]]) -> AsyncSignatureEvent[P, R]:
-    return AsyncSignatureEvent[P, R](method)
+    ...
+
+
+@overload
+def async_event(
+    *, concurrency: Optional[Concurrency] = None, memoize: Optional[Memoize] = None
+) -> Callable[[Callable[P, Awaitable[R]]], AsyncSignatureEvent[P, R]]:
+    ...
+
+
+def async_event(
+    method: Optional[Callable[P, Awaitable[R]]] = None,
+    *,
+    concurrency: Optional[Concurrency] = None,
+    memoize: Optional[Memoize] = None,
+) -> Any:
+    """Turns an async method into an `AsyncSignatureEvent`;
+    use as `@async_event` or `@async_event(concurrency=Concurrency(...), memoize=Memoize(...))`"""
+
+    def decorator(method: Callable[P, Awaitable[R]]) -> AsyncSignatureEvent[P, R]:
+        return AsyncSignatureEvent[P, R](method, concurrency=concurrency, memoize=memoize)
+
+    return decorator if method is None else decorator(method)
 
 
 class BeforeEventMethodWrapper:
+    __slots__ = ("method", "_beforeEvent")
+
     def __init__(self, method: Method) -> None:
         self.method = method
-        self.beforeEvent: Event[Any] = Event()
+        # created on first use, most wrapped methods are never observed
+        self._beforeEvent: Optional[Event[Any]] = None
+
+    @property
+    def beforeEvent(self) -> Event[Any]:
+        if self._beforeEvent is None:
+            self._beforeEvent = Event()
+        return self._beforeEvent
+
+    @beforeEvent.setter
+    def beforeEvent(self, value: Event[Any]) -> None:
+        # the event is assigned back by the in-place operators (`wrapper.beforeEvent += observer`)
+        self._beforeEvent = value
 
     def run(self, *args: Any, **kwargs: Any) -> None:
-        self.beforeEvent(self.beforeEvent)
+        if self._beforeEvent is not None:
+            self._beforeEvent(self._beforeEvent)
         self.method(*args, **kwargs)
 
     def subscribe(self, observer: Observer) -> "BeforeEventMethodWrapper":
@@ -42,13 +98,28 @@ def triggers_before_event(method: Method) -> BeforeEventMethodWrapper:
 
 
 class AfterEventMethodWrapper:
+    __slots__ = ("method", "_afterEvent")
+
     def __init__(self, method: Method) -> None:
         self.method = method
-        self.afterEvent: Event[Any] = Event()
+        # created on first use, most wrapped methods are never observed
+        self._afterEvent: Optional[Event[Any]] = None
+
+    @property
+    def afterEvent(self) -> Event[Any]:
+        if self._afterEvent is None:
+            self._afterEvent = Event()
+        return self._afterEvent
+
+    @afterEvent.setter
+    def afterEvent(self, value: Event[Any]) -> None:
+        # the event is assigned back by the in-place operators (`wrapper.afterEvent += observer`)
+        self._afterEvent = value
 
     def run(self, *args: Any, **kwargs: Any) -> None:
         self.method(*args, **kwargs)
-        self.afterEvent(self.afterEvent)
+        if self._afterEvent is not None:
+            self._afterEvent(self._afterEvent)
 
     def subscribe(self, observer: Observer) -> "AfterEventMethodWrapper":
         self.afterEvent += observer
@@ -68,15 +139,42 @@ def triggers_after_event(method: Method) -> AfterEventMethodWrapper:
 
 
 class AroundEventMethodWrapper:
+    __slots__ = ("method", "_beforeEvent", "_afterEvent")
+
     def __init__(self, method: Method) -> None:
         self.method = method
-        self.beforeEvent: Event[Event[Any]] = Event()
-        self.afterEvent: Event[Event[Any]] = Event()
+        # created on first use, most wrapped methods are never observed
+        self._beforeEvent: Optional[Event[Event[Any]]] = None
+        self._afterEvent: Optional[Event[Event[Any]]] = None
+
+    @property
+    def beforeEvent(self) -> Event[Event[Any]]:
+        if self._beforeEvent is None:
+            self._beforeEvent = Event()
+        return self._beforeEvent
+
+    @beforeEvent.setter
+    def beforeEvent(self, value: Event[Event[Any]]) -> None:
+        # the event is assigned back by the in-place operators (`wrapper.beforeEvent += observer`)
+        self._beforeEvent = value
+
+    @property
+    def afterEvent(self) -> Event[Event[Any]]:
+        if self._afterEvent is None:
+            self._afterEvent = Event()
+        return self._afterEvent
+
+    @afterEvent.setter
+    def afterEvent(self, value: Event[Event[Any]]) -> None:
+        # the event is assigned back by the in-place operators (`wrapper.afterEvent += observer`)
+        self._afterEvent = value
 
     def __call__(self, *args: Any, **kwargs: Any) -> None:
-        self.beforeEvent(self.beforeEvent)
+        if self._beforeEvent is not None:
+            self._beforeEvent(self._beforeEvent)
         self.method(*args, **kwargs)
-        self.afterEvent(self.afterEvent)
+        if self._afterEvent is not None:
+            self._afterEvent(self._afterEvent)
 
     def subscribe(self, before: Observer, after: Observer) -> None:
         self.beforeEvent += before
@@ -0,0 +1,86 @@
+import asyncio
+import inspect
+import logging
+import sys
+from typing import Any, Callable, NamedTuple, Sequence
+
+if sys.version_info >= (3, 11):
+    from builtins import ExceptionGroup
+else:
+
+    class ExceptionGroup(Exception):
+        """Minimal stand-in for the builtin ExceptionGroup of python 3.11+"""
+
+        def __init__(self, message: str, exceptions: Sequence[Exception]) -> None:
+            super().__init__(message, exceptions)
+            self.message = message
+            self.exceptions = tuple(exceptions)
+
+
+log = logging.getLogger(__name__)
+
+
+class SubscriberError(NamedTuple):
+    """An exception raised by a subscriber of an event"""
+
+    event: Any
+    subscriber: Callable[..., Any]
+    error: Exception
+
+
+class SubscriberErrors(Exception):
+    """Raised by subscribers that invoke other subscribers (like the keyed subscribers
+    of an `Event`), to pass all of their exceptions on to the event's error policy"""
+
+    def __init__(self, errors: Sequence[SubscriberError]) -> None:
+        super().__init__(errors)
+        self.errors = list(errors)
+
+
+# an error policy decides what happens with the exceptions raised by the subscribers
+# of a fire, once all subscribers ran (see `BaseEvent.error_policy`); for async events
+# it can also return an awaitable
+ErrorPolicy = Callable[[Sequence[SubscriberError]], Any]
+
+
+def raise_after_all(errors: Sequence[SubscriberError]) -> None:
+    """Error policy that raises the first exception after all subscribers ran"""
+    raise errors[0].error
+
+
+def raise_group(errors: Sequence[SubscriberError]) -> None:
+    """Error policy that raises all exceptions together in an `ExceptionGroup`
+    after all subscribers ran"""
+    raise ExceptionGroup(f"{len(errors)} subscriber(s) raised", [error.error for error in errors])
+
+
+def log_errors(errors: Sequence[SubscriberError]) -> None:
+    """Error policy that logs the exceptions, without raising"""
+    for error in errors:
+        log.error("Subscriber %r of %r raised", error.subscriber, error.event, exc_info=error.error)
+
+
+def route_errors(error_event: Callable[[SubscriberError], Any]) -> ErrorPolicy:
+    """Returns an error policy that fires the given `error_event` (or calls any callable)
+    for every exception, without raising"""
+
+    def policy(errors: Sequence[SubscriberError]) -> Any:
+        results = [error_event(error) for error in errors]
+        awaitables = [result for result in results if inspect.isawaitable(result)]
+        if awaitables:
+            # an async event
+            return asyncio.gather(*awaitables)
+
+    return policy
+
+
+__all__ = [
+    "ErrorPolicy",
+    "ExceptionGroup",
+    "log_errors",
+    "raise_after_all",
+    "raise_group",
+    "route_errors",
+    "SubscriberError",
+    "SubscriberErrors",
+]
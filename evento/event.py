@@ -1,16 +1,54 @@
-from typing import Any, Callable, Generic, Iterable, TypeVar, Union
+from concurrent.futures import Future
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Hashable,
+    Iterable,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
 
 from .base import BaseEvent
+from .executor import ExecutorDispatcher
+from .filters import FilteredSubscriber, KeyedSubscribers
+from .subscribers import BatchSubscriber
 
 T = TypeVar("T")
 
 
 class Event(Generic[T], BaseEvent):
+    __slots__ = ()
+
     def fire(self, value: T) -> None:
-        self._fire(value)
+        self._fire((value,), {})
 
     __call__ = fire
 
+    def fire_many(self, values: Iterable[T]) -> None:
+        """Fires the event for every one of the given `values`, with a single
+        bookkeeping cycle for the entire batch.
+
+        Every subscriber receives all values before the next subscriber is invoked;
+        batch subscribers (see `append_batch`) receive `values` in a single call,
+        without copying unless `values` is an iterator."""
+        if iter(values) is values:
+            values = list(values)
+        self._fire((values,), {}, partial(_fire_many, values))
+
+    def submit(self, dispatcher: ExecutorDispatcher, value: T) -> Future[None]:
+        """Fires the event without blocking; the subscribers are run by the given
+        `dispatcher`. The returned future completes once all subscribers are done."""
+        subscribers = self._snapshot
+        if subscribers is None:
+            subscribers = self._take_snapshot()
+
+        self._fireCount += 1
+        return dispatcher.submit(subscribers, value)
+
     def __iadd__(
         self, subscribers: Union[Callable[[T], Any], Iterable[Callable[[T], Any]]]
     ) -> "Event[T]":
@@ -20,16 +58,108 @@ class Event(Generic[T], BaseEvent):
 
     def __isub__(self, subscriber: Callable[[T], Any]) -> "Event[T]":
         """Removes given `subscriber` and returns this Event"""
-        # only modify self if we're not currently firing
-        # otherwise queue the unsubscription for processing after firing is done
         self.remove(subscriber)
         return self
 
-    def append(self, subscribers: Union[Callable[[T], Any], Iterable[Callable[[T], Any]]]) -> None:
-        super().append(subscribers)
+    def append(
+        self,
+        subscribers: Union[Callable[[T], Any], Iterable[Callable[[T], Any]]],
+        priority: int = 0,
+        *,
+        key: Optional[Callable[[T], Hashable]] = None,
+        match: Hashable = None,
+        where: Optional[Callable[[T], bool]] = None,
+    ) -> None:
+        """Adds the given subscriber(s), see `BaseEvent.append`.
+
+        With a `key` function, the subscribers are only invoked for values of which
+        the key equals `match`; subscribers are indexed by their match, so fires only
+        invoke the matching subscribers (instead of subscribers that ignore most values).
+        Subscribers with the same key function (the same object) share an index.
+
+        With a `where` predicate, the subscribers are only invoked for values that
+        satisfy it; the predicate is evaluated for every fire, so unlike `key` this
+        doesn't save any calls."""
+        if key is None and where is None:
+            super().append(subscribers, priority)
+            return
+
+        if callable(subscribers):
+            subscribers = [subscribers]
+
+        for subscriber in subscribers:
+            if where is not None:
+                subscriber = FilteredSubscriber(subscriber, where)
+            if key is None:
+                super().append(subscriber, priority)
+            elif subscriber not in self:
+                self._keyed_subscribers(key, priority).add(subscriber, match)
 
     def remove(self, subscriber: Callable[[T], Any]) -> None:
+        keyed = None if self._extras is None else self._extras.keyed
+        if keyed is not None and subscriber not in self._subscribers:
+            for index_key, index in keyed.items():
+                if index.remove(subscriber):
+                    if not index:
+                        del keyed[index_key]
+                        super().remove(index)
+                    return
+
         super().remove(subscriber)
 
-    def add(self, subscriber: Callable[[T], Any]) -> Callable[[], Any]:
-        return super().add(subscriber)
+    def add(
+        self,
+        subscriber: Callable[[T], Any],
+        priority: int = 0,
+        *,
+        key: Optional[Callable[[T], Hashable]] = None,
+        match: Hashable = None,
+        where: Optional[Callable[[T], bool]] = None,
+    ) -> Callable[[], Any]:
+        """Same as `append` but returns a callable without arguments
+        that can be used to unsubscribe the `subscriber`"""
+        self.append(subscriber, priority, key=key, match=match, where=where)
+
+        def unsub() -> None:
+            self.remove(subscriber)
+
+        return unsub
+
+    def append_weak(self, subscriber: Callable[[T], Any], priority: int = 0) -> None:
+        super().append_weak(subscriber, priority)
+
+    def add_weak(self, subscriber: Callable[[T], Any], priority: int = 0) -> Callable[[], Any]:
+        return super().add_weak(subscriber, priority)
+
+    def append_batch(self, subscriber: Callable[[Sequence[T]], Any], priority: int = 0) -> None:
+        """Adds a `subscriber` that receives a sequence of values instead of a single value;
+        all values of a `fire_many` batch at once. It can be removed using `remove`."""
+        self.append(BatchSubscriber(subscriber), priority)
+
+    def add_batch(
+        self, subscriber: Callable[[Sequence[T]], Any], priority: int = 0
+    ) -> Callable[[], Any]:
+        """Same as `append_batch` but returns a callable without arguments
+        that can be used to unsubscribe the `subscriber`"""
+        return self.add(BatchSubscriber(subscriber), priority)
+
+    def _keyed_subscribers(self, key: Callable[[T], Hashable], priority: int) -> KeyedSubscribers:
+        extras = self._get_extras()
+        keyed = extras.keyed
+        if keyed is None:
+            keyed = extras.keyed = {}
+
+        index = keyed.get((key, priority))
+        if index is None:
+            index = keyed[(key, priority)] = KeyedSubscribers(key, self)
+            BaseEvent.append(self, index, priority)
+        return index
+
+
+def _fire_many(values: Iterable[Any], subscriber: Callable[..., Any]) -> None:
+    # the subscriber's part of Event.fire_many
+    if type(subscriber) is BatchSubscriber:
+        subscriber.subscriber(values)
+    else:
+        for value in values:
+            subscriber(value)
@@ -0,0 +1,162 @@
+import threading
+from concurrent.futures import CancelledError, Executor, Future
+from typing import Any, Callable, Iterable, TypeVar
+
+from .errors import ExceptionGroup
+
+R = TypeVar("R")
+
+
+class ExecutorDispatcher:
+    """Runs subscribers on a `concurrent.futures` executor instead of the firing thread.
+
+    With a `ProcessPoolExecutor` the subscribers and fired values have to be picklable.
+
+    When `ordered` is True, calls to the same subscriber run one after the other
+    in the order of the fires (a serial queue per subscriber); otherwise calls
+    are submitted right away and might run in any order."""
+
+    def __init__(self, executor: Executor, ordered: bool = False) -> None:
+        self.executor = executor
+        self.ordered = ordered
+        # resolved when the last pending call per subscriber is done (or skipped because
+        # it got cancelled), only used in ordered mode
+        self._tails: dict[Callable[..., Any], Future[Any]] = {}
+        self._lock = threading.Lock()
+
+    def submit(
+        self, subscribers: Iterable[Callable[..., Any]], *args: Any, **kwargs: Any
+    ) -> Future[None]:
+        """Submits a call to every subscriber and returns a future that completes
+        when all of them are done. If any of the calls raised, the future's
+        exception is an `ExceptionGroup` with all of the raised exceptions."""
+        return combine_futures(self.submit_each(subscribers, *args, **kwargs), lambda: None)
+
+    def submit_each(
+        self, subscribers: Iterable[Callable[..., Any]], *args: Any, **kwargs: Any
+    ) -> list[Future[Any]]:
+        """Submits a call to every subscriber and returns a future for every call"""
+        submit = self._submit_ordered if self.ordered else self.executor.submit
+        return [submit(subscriber, *args, **kwargs) for subscriber in subscribers]
+
+    def _submit_ordered(
+        self, subscriber: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Future[Any]:
+        with self._lock:
+            tail = self._tails.get(subscriber)
+
+            if tail is None:
+                future = finished = self.executor.submit(subscriber, *args, **kwargs)
+            else:
+                # start this call once the previous call to the same subscriber is done;
+                # the returned future can get cancelled before that, so the next call
+                # waits for `finished` instead
+                future = Future()
+                finished = Future()
+                tail.add_done_callback(
+                    lambda _: self._start(future, finished, subscriber, args, kwargs)
+                )
+
+            self._tails[subscriber] = finished
+
+        finished.add_done_callback(lambda done: self._release(subscriber, done))
+        return future
+
+    def _start(
+        self,
+        future: Future[Any],
+        finished: Future[None],
+        subscriber: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        # submits a deferred call, unless it got cancelled; exceptions raised in
+        # done-callbacks get swallowed, so they have to end up in the call's future
+        # (like when the executor shut down)
+        if not future.set_running_or_notify_cancel():
+            finished.set_result(None)
+            return
+        try:
+            submitted = self.executor.submit(subscriber, *args, **kwargs)
+        except Exception as exc:
+            future.set_exception(exc)
+            finished.set_result(None)
+            return
+        _chain(submitted, future)
+        submitted.add_done_callback(lambda _: finished.set_result(None))
+
+    def _release(self, subscriber: Callable[..., Any], done: Future[Any]) -> None:
+        with self._lock:
+            if self._tails.get(subscriber) is done:
+                del self._tails[subscriber]
+
+
+def _chain(source: Future[R], target: Future[R]) -> None:
+    def copy(_: Future[R]) -> None:
+        if target.done():
+            return
+        if source.cancelled():
+            if target.cancel():
+                target.set_running_or_notify_cancel()
+            else:
+                # a running future can't be cancelled
+                target.set_exception(CancelledError())
+            return
+        exc = source.exception()
+        if exc is None:
+            target.set_result(source.result())
+        else:
+            target.set_exception(exc)
+
+    source.add_done_callback(copy)
+
+
+def combine_futures(futures: list[Future[Any]], result: Callable[[], R]) -> Future[R]:
+    """Returns a future that completes when all given `futures` are done.
+
+    Its exception is an `ExceptionGroup` when any of the `futures` failed,
+    otherwise its result is the return value of `result`,
+    which is invoked once all `futures` are done."""
+    combined: Future[R] = Future()
+    remaining = len(futures)
+    lock = threading.Lock()
+
+    def complete() -> None:
+        errors: list[Exception] = []
+
+        for future in futures:
+            if future.cancelled():
+                errors.append(CancelledError())
+                continue
+            exc = future.exception()
+            if exc is None:
+                continue
+            if not isinstance(exc, Exception):
+                combined.set_exception(exc)
+                return
+            errors.append(exc)
+
+        if errors:
+            combined.set_exception(ExceptionGroup(f"{len(errors)} subscriber(s) raised", errors))
+            return
+
+        try:
+            combined.set_result(result())
+        except Exception as exc:
+            combined.set_exception(exc)
+
+    def on_done(_: Future[Any]) -> None:
+        nonlocal remaining
+        with lock:
+            remaining -= 1
+            if remaining:
+                return
+        complete()
+
+    if not futures:
+        complete()
+
+    for future in futures:
+        future.add_done_callback(on_done)
+
+    return combined
@@ -0,0 +1,103 @@
+import weakref
+from typing import Any, Callable, Hashable, Iterator
+
+from .base import BaseEvent
+from .errors import SubscriberError, SubscriberErrors
+from .subscribers import SubscriberWrapper
+
+
+class FilteredSubscriber(SubscriberWrapper):
+    """Only invokes the wrapped subscriber for values that satisfy `predicate`"""
+
+    __slots__ = ("predicate",)
+
+    def __init__(self, subscriber: Callable[..., Any], predicate: Callable[[Any], bool]) -> None:
+        super().__init__(subscriber)
+        self.predicate = predicate
+
+    def __call__(self, value: Any) -> Any:
+        if self.predicate(value):
+            return self.subscriber(value)
+
+
+class KeyedSubscribers:
+    """Indexes the subscribers that subscribed with the same `key` function (and
+    priority) by the key they match; subscribed in their place, so fires only invoke
+    the subscribers that match the key of the fired value, with a single key lookup"""
+
+    __slots__ = ("key", "index", "matches", "event")
+
+    def __init__(self, key: Callable[[Any], Hashable], event: BaseEvent) -> None:
+        self.key = key
+        # match => its subscribers; replaced (instead of modified) when they change,
+        # so fires in progress keep iterating their own subscribers
+        self.index: dict[Hashable, tuple[Callable[..., Any], ...]] = {}
+        # subscriber => its match
+        self.matches: dict[Callable[..., Any], Hashable] = {}
+        # weakly referenced, because the event references this
+        self.event = weakref.ref(event)
+
+    def add(self, subscriber: Callable[..., Any], match: Hashable) -> None:
+        self.matches[subscriber] = match
+        self.index[match] = self.index.get(match, ()) + (subscriber,)
+
+    def remove(self, subscriber: Callable[..., Any]) -> bool:
+        """Removes the given `subscriber`, returns False when it wasn't found"""
+        if subscriber not in self.matches:
+            return False
+
+        match = self.matches.pop(subscriber)
+        subscribers = tuple(s for s in self.index[match] if s != subscriber)
+        if subscribers:
+            self.index[match] = subscribers
+        else:
+            del self.index[match]
+        return True
+
+    def __call__(self, value: Any) -> None:
+        key = self.key(value)
+        subscribers = self.index.get(key)
+        if subscribers is None:
+            return
+
+        remaining = iter(subscribers)
+        try:
+            for subscriber in remaining:
+                # the subscriber might have got removed by one of the previous subscribers
+                if subscribers is not self.index.get(key) and subscriber not in self.matches:
+                    continue
+                subscriber(value)
+        except Exception as error:
+            self._continue(error, subscriber, remaining, key, value)
+
+    def _continue(
+        self,
+        error: Exception,
+        subscriber: Callable[..., Any],
+        remaining: Iterator[Callable[..., Any]],
+        key: Hashable,
+        value: Any,
+    ) -> None:
+        # see BaseEvent._continue_fire; the event's policy gets all exceptions at once
+        event = self.event()
+        if event is None or event.error_policy is None:
+            raise error
+
+        errors = [SubscriberError(event, subscriber, error)]
+        for subscriber in remaining:
+            if subscriber not in self.matches:
+                continue
+            try:
+                subscriber(value)
+            except Exception as error:
+                errors.append(SubscriberError(event, subscriber, error))
+        raise SubscriberErrors(errors)
+
+    def __contains__(self, subscriber: Callable[..., Any]) -> bool:
+        return subscriber in self.matches
+
+    def __len__(self) -> int:
+        return len(self.matches)
+
+    def __repr__(self) -> str:
+        return f"KeyedSubscribers(key={self.key!r}, len={len(self)})"
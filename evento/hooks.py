@@ -0,0 +1,382 @@
+import weakref
+from functools import partial
+from typing import Any, Awaitable, Callable, Optional, Sequence
+
+from .base import BaseEvent
+from .concurrency import Concurrency
+from .layers import Layer, add_layer, is_async, remove_layer
+from .subscribers import BatchSubscriber, SubscriberWrapper
+
+
+class Hooks:
+    """Callbacks around the dispatching of events, for example for tracing or profiling;
+    override the ones that are needed and install them using `add_hooks`.
+
+    Whatever a `..._started` callback returns is passed to the matching `..._ended`
+    callback as `context`, together with the exception (`error`) that was raised by
+    the fire or subscriber, if any. Hooks are invoked synchronously, also for async
+    events; async fires and subscribers end when they're done."""
+
+    def fire_started(self, event: BaseEvent, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        return None
+
+    def fire_ended(self, event: BaseEvent, context: Any, error: Optional[BaseException]) -> None:
+        pass
+
+    def subscriber_started(
+        self,
+        event: BaseEvent,
+        subscriber: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        return None
+
+    def subscriber_ended(
+        self,
+        event: BaseEvent,
+        subscriber: Callable[..., Any],
+        context: Any,
+        error: Optional[BaseException],
+    ) -> None:
+        pass
+
+
+class HookedSubscriber(SubscriberWrapper):
+    """Invokes `hooks` around the calls of the wrapped subscriber"""
+
+    __slots__ = ("hooks", "event", "original")
+
+    def __init__(
+        self, subscriber: Callable[..., Any], hooks: Sequence[Hooks], event: BaseEvent
+    ) -> None:
+        super().__init__(subscriber)
+        # the installed hooks; changes when hooks are added or removed
+        self.hooks = hooks
+        # weakly referenced, because the event's snapshot references this wrapper
+        self.event = weakref.ref(event)
+        # the subscriber as it was subscribed, without any wrappers of other layers
+        self.original = _unwrap(subscriber)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        hooks = self.hooks
+        event = self.event()
+        if not hooks or event is None:
+            if event is not None:
+                # the hooks got removed; the next fire takes a snapshot without them
+                event._snapshot = None
+            return self.subscriber(*args, **kwargs)
+
+        original = self.original
+        if len(hooks) == 1:
+            # the common case, without the lists
+            hook = hooks[0]
+            context = hook.subscriber_started(event, original, args, kwargs)
+            try:
+                result = self.subscriber(*args, **kwargs)
+            except BaseException as error:
+                hook.subscriber_ended(event, original, context, error)
+                raise
+
+            hook.subscriber_ended(event, original, context, None)
+            return result
+
+        hooks = tuple(hooks)
+        contexts = [hook.subscriber_started(event, original, args, kwargs) for hook in hooks]
+        try:
+            result = self.subscriber(*args, **kwargs)
+        except BaseException as error:
+            _subscriber_ended(hooks, contexts, event, original, error)
+            raise
+
+        _subscriber_ended(hooks, contexts, event, original, None)
+        return result
+
+
+class AsyncHookedSubscriber(HookedSubscriber):
+    """HookedSubscriber for async subscribers"""
+
+    __slots__ = ()
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        hooks = self.hooks
+        event = self.event()
+        if not hooks or event is None:
+            if event is not None:
+                event._snapshot = None
+            return await self.subscriber(*args, **kwargs)
+
+        original = self.original
+        if len(hooks) == 1:
+            # the common case, without the lists
+            hook = hooks[0]
+            context = hook.subscriber_started(event, original, args, kwargs)
+            try:
+                result = await self.subscriber(*args, **kwargs)
+            except BaseException as error:
+                hook.subscriber_ended(event, original, context, error)
+                raise
+
+            hook.subscriber_ended(event, original, context, None)
+            return result
+
+        hooks = tuple(hooks)
+        contexts = [hook.subscriber_started(event, original, args, kwargs) for hook in hooks]
+        try:
+            result = await self.subscriber(*args, **kwargs)
+        except BaseException as error:
+            _subscriber_ended(hooks, contexts, event, original, error)
+            raise
+
+        _subscriber_ended(hooks, contexts, event, original, None)
+        return result
+
+
+class Hooked(BaseEvent):
+    """Base class of the mixins (see `layers`) that invoke the hooks of a single event,
+    so events without hooks of their own don't have any overhead"""
+
+    __slots__ = ()
+
+    _hooked_type = HookedSubscriber
+
+    @property
+    def _hooks(self) -> list[Hooks]:
+        return self._get_extras().hooks
+
+    def _wrap_snapshot(
+        self, snapshot: tuple[Callable[..., Any], ...]
+    ) -> tuple[Callable[..., Any], ...]:
+        return _wrap(super()._wrap_snapshot(snapshot), self._hooks, self, self._hooked_type)
+
+
+class _SyncHooked(Hooked):
+    __slots__ = ()
+
+    def _fire(
+        self,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        call: Optional[Callable[[Callable[..., Any]], Any]] = None,
+    ) -> None:
+        fire = partial(super()._fire, args, kwargs, call)
+        _fire(fire, self._hooks, self, args, kwargs)
+
+
+class _AsyncHooked(Hooked):
+    __slots__ = ()
+
+    _hooked_type = AsyncHookedSubscriber
+
+    async def _fire_async(
+        self,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        call: Optional[Callable[[Callable[..., Any]], Awaitable[Any]]] = None,
+        concurrency: Optional[Concurrency] = None,
+    ) -> None:
+        fire = partial(super()._fire_async, args, kwargs, call, concurrency)
+        await _fire_async(fire, self._hooks, self, args, kwargs)
+
+
+HOOKED = Layer("Hooked", _SyncHooked, _AsyncHooked)
+
+_global_hooks: list[Hooks] = []
+# the methods of BaseEvent that all fires (and snapshots) end up in, see `_replace_fires`
+_original_fires: dict[str, Callable[..., Any]] = {}
+
+
+class _GloballyHookedSnapshot(tuple):  # type: ignore[type-arg]
+    """A snapshot of which the subscribers invoke the global hooks"""
+
+    __slots__ = ()
+
+
+def add_hooks(hooks: Hooks, event: Optional[BaseEvent] = None) -> None:
+    """Installs the given `hooks` for the given `event`, or globally (for all events)
+    when no event is given. Hooks are invoked for every fire that dispatches to the
+    subscribers (`BaseEvent._fire` and `BaseEvent._fire_async`, which all fire methods
+    use, including `fire_many` and `fire_concurrent`), with the arguments it dispatches.
+
+    `submit` and the lazy `fire_results` (which `fire_first` and `fire_intercept` use)
+    don't invoke the fire hooks; they invoke the subscriber hooks of the event's hooks,
+    and of the global hooks once the event has fired after they were installed.
+
+    Without any hooks, events fire without any overhead; while there are global hooks
+    those methods are replaced by versions that invoke the hooks."""
+    if event is not None:
+        event._get_extras().hooks.append(hooks)
+        if not isinstance(event, Hooked):
+            add_layer(event, HOOKED)
+        return
+
+    if not _global_hooks:
+        _replace_fires()
+    _global_hooks.append(hooks)
+
+
+def remove_hooks(hooks: Hooks, event: Optional[BaseEvent] = None) -> None:
+    """Uninstalls hooks that were installed using `add_hooks`"""
+    if event is not None:
+        if isinstance(event, Hooked) and hooks in event._hooks:
+            event._hooks.remove(hooks)
+            if not event._hooks:
+                remove_layer(event, HOOKED)
+        return
+
+    if hooks in _global_hooks:
+        _global_hooks.remove(hooks)
+        if not _global_hooks:
+            _restore_fires()
+
+
+def _replace_fires() -> None:
+    for name, replace in (
+        ("_fire", _globally_hooked),
+        ("_fire_async", _globally_hooked_async),
+        ("_take_snapshot", _globally_hooked_snapshot),
+    ):
+        method = BaseEvent.__dict__[name]
+        _original_fires[name] = method
+        setattr(BaseEvent, name, replace(method))
+
+
+def _restore_fires() -> None:
+    for name, fire in _original_fires.items():
+        setattr(BaseEvent, name, fire)
+    _original_fires.clear()
+    # snapshots that were taken while there were global hooks
+    # are replaced on their first use after this
+
+
+def _globally_hooked(fire: Callable[..., None]) -> Callable[..., None]:
+    def hooked_fire(
+        self: BaseEvent,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        call: Optional[Callable[[Callable[..., Any]], Any]] = None,
+    ) -> None:
+        _hook_snapshot(self)
+        _fire(partial(fire, self, args, kwargs, call), _global_hooks, self, args, kwargs)
+
+    return hooked_fire
+
+
+def _globally_hooked_async(fire: Callable[..., Awaitable[None]]) -> Callable[..., Awaitable[None]]:
+    async def hooked_fire(
+        self: BaseEvent,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        call: Optional[Callable[[Callable[..., Any]], Awaitable[Any]]] = None,
+        concurrency: Optional[Concurrency] = None,
+    ) -> None:
+        _hook_snapshot(self)
+        fire_async = partial(fire, self, args, kwargs, call, concurrency)
+        await _fire_async(fire_async, _global_hooks, self, args, kwargs)
+
+    return hooked_fire
+
+
+def _globally_hooked_snapshot(
+    take_snapshot: Callable[[BaseEvent], tuple[Callable[..., Any], ...]]
+) -> Callable[[BaseEvent], tuple[Callable[..., Any], ...]]:
+    def hooked_take_snapshot(self: BaseEvent) -> tuple[Callable[..., Any], ...]:
+        # wraps the snapshot of the event (and its layers) as it's taken, so thread-safe
+        # events do that under their lock and a concurrent append can't get lost
+        snapshot = take_snapshot(self)
+        hooked_type = AsyncHookedSubscriber if is_async(type(self)) else HookedSubscriber
+        snapshot = _GloballyHookedSnapshot(_wrap(snapshot, _global_hooks, self, hooked_type))
+        self._snapshot = snapshot
+        return snapshot
+
+    return hooked_take_snapshot
+
+
+def _hook_snapshot(event: BaseEvent) -> None:
+    if type(event._snapshot) is not _GloballyHookedSnapshot:
+        # taken before the global hooks were installed; the fire takes a new one
+        event._snapshot = None
+
+
+def _fire(
+    fire: Callable[[], Any],
+    hooks: Sequence[Hooks],
+    event: BaseEvent,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> Any:
+    hooks = tuple(hooks)
+    contexts = [hook.fire_started(event, args, kwargs) for hook in hooks]
+    try:
+        result = fire()
+    except BaseException as error:
+        _fire_ended(hooks, contexts, event, error)
+        raise
+
+    _fire_ended(hooks, contexts, event, None)
+    return result
+
+
+async def _fire_async(
+    fire: Callable[[], Awaitable[Any]],
+    hooks: Sequence[Hooks],
+    event: BaseEvent,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> Any:
+    hooks = tuple(hooks)
+    contexts = [hook.fire_started(event, args, kwargs) for hook in hooks]
+    try:
+        result = await fire()
+    except BaseException as error:
+        _fire_ended(hooks, contexts, event, error)
+        raise
+
+    _fire_ended(hooks, contexts, event, None)
+    return result
+
+
+def _fire_ended(
+    hooks: Sequence[Hooks],
+    contexts: list[Any],
+    event: BaseEvent,
+    error: Optional[BaseException],
+) -> None:
+    # in reverse order, so hooks can nest (like spans)
+    for hook, context in zip(reversed(hooks), reversed(contexts)):
+        hook.fire_ended(event, context, error)
+
+
+def _subscriber_ended(
+    hooks: Sequence[Hooks],
+    contexts: list[Any],
+    event: BaseEvent,
+    subscriber: Callable[..., Any],
+    error: Optional[BaseException],
+) -> None:
+    for hook, context in zip(reversed(hooks), reversed(contexts)):
+        hook.subscriber_ended(event, subscriber, context, error)
+
+
+def _wrap(
+    snapshot: tuple[Callable[..., Any], ...],
+    hooks: Sequence[Hooks],
+    event: BaseEvent,
+    hooked_type: type[HookedSubscriber],
+) -> tuple[Callable[..., Any], ...]:
+    return tuple(
+        # keeps batch subscribers recognizable for fire_many
+        BatchSubscriber(hooked_type(subscriber.subscriber, hooks, event))
+        if type(subscriber) is BatchSubscriber
+        else hooked_type(subscriber, hooks, event)
+        for subscriber in snapshot
+    )
+
+
+def _unwrap(subscriber: Callable[..., Any]) -> Callable[..., Any]:
+    # removes the wrappers that layers put in snapshots
+    from .instrumentation import TimedSubscriber
+
+    while isinstance(subscriber, (HookedSubscriber, TimedSubscriber)):
+        subscriber = subscriber.subscriber
+    return subscriber
@@ -0,0 +1,309 @@
+import bisect
+from time import perf_counter
+from typing import Any, Callable, Iterable, Optional, TypeVar
+
+from .base import BaseEvent
+from .layers import Layer, add_layer, remove_layer
+from .subscribers import BatchSubscriber, SubscriberWrapper
+
+E = TypeVar("E", bound=BaseEvent)
+
+# upper bounds (in seconds) of the latency histogram buckets
+DEFAULT_BUCKETS = (
+    0.000001,
+    0.000005,
+    0.00001,
+    0.00005,
+    0.0001,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+)
+
+
+class Histogram:
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        self.bounds = tuple(sorted(bounds))
+        # the number of observations per bucket, the last one for values above all bounds
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.sum = 0.0
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        """The number of observations less than or equal to each bound
+        (ending with infinity), like prometheus histogram buckets"""
+        result = []
+        total = 0
+        for bound, count in zip(self.bounds + (float("inf"),), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "buckets": {str(bound): count for bound, count in self.cumulative()},
+            "count": self.count,
+            "sum": self.sum,
+        }
+
+
+class SubscriberStats:
+    __slots__ = ("name", "calls", "time", "exceptions")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.calls = 0
+        # cumulative duration of the calls, in seconds
+        self.time = 0.0
+        self.exceptions = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"calls": self.calls, "time": self.time, "exceptions": self.exceptions}
+
+
+class EventStats:
+    """The statistics of an instrumented event (see `instrument`).
+
+    `fires` and `latency` only cover `fire` (and calling the event);
+    the subscriber statistics cover every invocation of the current subscribers.
+    For events that are fired from multiple threads at the same time,
+    counts might be slightly off."""
+
+    __slots__ = ("name", "fires", "latency", "subscribers")
+
+    def __init__(self, name: str, buckets: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        self.name = name
+        self.fires = 0
+        self.latency = Histogram(buckets)
+        # the statistics per subscriber (only of the current subscribers)
+        self.subscribers: dict[Callable[..., Any], SubscriberStats] = {}
+
+    def fired(self, duration: float) -> None:
+        self.fires += 1
+        self.latency.observe(duration)
+
+    def as_dict(self) -> dict[str, Any]:
+        subscribers: dict[str, dict[str, Any]] = {}
+        for stats in self.subscribers.values():
+            # subscribers with the same name are combined
+            combined = subscribers.setdefault(
+                stats.name, {"calls": 0, "time": 0.0, "exceptions": 0}
+            )
+            for key, value in stats.as_dict().items():
+                combined[key] += value
+
+        return {
+            "name": self.name,
+            "fires": self.fires,
+            "latency": self.latency.as_dict(),
+            "subscribers": subscribers,
+        }
+
+    def _wrap(
+        self, snapshot: tuple[Callable[..., Any], ...], timed_type: type["TimedSubscriber"]
+    ) -> tuple[Callable[..., Any], ...]:
+        previous = self.subscribers
+        self.subscribers = {}
+        wrapped: list[Callable[..., Any]] = []
+
+        for subscriber in snapshot:
+            stats = previous.get(subscriber) or SubscriberStats(_name(subscriber))
+            self.subscribers[subscriber] = stats
+
+            if type(subscriber) is BatchSubscriber:
+                # keeps batch subscribers recognizable for fire_many
+                wrapped.append(BatchSubscriber(timed_type(subscriber.subscriber, stats)))
+            else:
+                wrapped.append(timed_type(subscriber, stats))
+
+        return tuple(wrapped)
+
+
+class TimedSubscriber(SubscriberWrapper):
+    """Records the calls of the wrapped subscriber in `stats`"""
+
+    __slots__ = ("stats",)
+
+    def __init__(self, subscriber: Callable[..., Any], stats: SubscriberStats) -> None:
+        super().__init__(subscriber)
+        self.stats = stats
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        stats = self.stats
+        start = perf_counter()
+        try:
+            return self.subscriber(*args, **kwargs)
+        except BaseException:
+            stats.exceptions += 1
+            raise
+        finally:
+            stats.calls += 1
+            stats.time += perf_counter() - start
+
+
+class AsyncTimedSubscriber(TimedSubscriber):
+    """TimedSubscriber for async subscribers, timing until the subscriber is done"""
+
+    __slots__ = ()
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        stats = self.stats
+        start = perf_counter()
+        try:
+            return await self.subscriber(*args, **kwargs)
+        except BaseException:
+            stats.exceptions += 1
+            raise
+        finally:
+            stats.calls += 1
+            stats.time += perf_counter() - start
+
+
+class Instrumented(BaseEvent):
+    """Base class of the mixins (see `layers`) that record the statistics of an event,
+    so events that aren't instrumented don't have any overhead"""
+
+    __slots__ = ()
+
+    _timed_type = TimedSubscriber
+
+    @property
+    def _stats(self) -> EventStats:
+        # set for as long as the event is instrumented
+        return self._extras.stats  # type: ignore[union-attr,return-value]
+
+    def _wrap_snapshot(
+        self, snapshot: tuple[Callable[..., Any], ...]
+    ) -> tuple[Callable[..., Any], ...]:
+        # the snapshot is what's fired; the subscribers themselves are not wrapped
+        return self._stats._wrap(super()._wrap_snapshot(snapshot), self._timed_type)
+
+
+class _SyncInstrumented(Instrumented):
+    __slots__ = ()
+
+    def fire(self, *args: Any, **kwargs: Any) -> Any:
+        start = perf_counter()
+        try:
+            return super().fire(*args, **kwargs)  # type: ignore[misc]
+        finally:
+            self._stats.fired(perf_counter() - start)
+
+    __call__ = fire
+
+
+class _AsyncInstrumented(Instrumented):
+    __slots__ = ()
+
+    _timed_type = AsyncTimedSubscriber
+
+    async def fire(self, *args: Any, **kwargs: Any) -> Any:
+        start = perf_counter()
+        try:
+            return await super().fire(*args, **kwargs)  # type: ignore[misc]
+        finally:
+            self._stats.fired(perf_counter() - start)
+
+    __call__ = fire
+
+
+INSTRUMENTED = Layer("Instrumented", _SyncInstrumented, _AsyncInstrumented)
+
+
+def instrument(
+    event: E, name: Optional[str] = None, buckets: Iterable[float] = DEFAULT_BUCKETS
+) -> EventStats:
+    """Starts recording fire counts and latencies of the given `event`, and call counts,
+    durations and exceptions of its subscribers; returns the statistics, which are
+    named `name` (or after the event's id) in exports. Events that were already
+    instrumented keep their statistics.
+
+    Only instrumented events pay for instrumentation."""
+    if isinstance(event, Instrumented):
+        return event._stats
+
+    stats = EventStats(name or f"event-{id(event):x}", buckets)
+    event._get_extras().stats = stats
+    add_layer(event, INSTRUMENTED)
+    return stats
+
+
+def uninstrument(event: BaseEvent) -> None:
+    """Stops recording statistics of the given `event`"""
+    if not isinstance(event, Instrumented):
+        return
+
+    remove_layer(event, INSTRUMENTED)
+    event._get_extras().stats = None
+
+
+def to_prometheus(stats: Iterable[EventStats], prefix: str = "evento") -> str:
+    """Exports the given statistics in the prometheus text format"""
+    stats = list(stats)
+    lines = []
+
+    def metric(name: str, kind: str, help: str) -> str:
+        lines.append(f"# HELP {prefix}_{name} {help}")
+        lines.append(f"# TYPE {prefix}_{name} {kind}")
+        return f"{prefix}_{name}"
+
+    name = metric("fires_total", "counter", "Number of fires")
+    for event_stats in stats:
+        lines.append(f"{name}{_labels(event=event_stats.name)} {event_stats.fires}")
+
+    name = metric("fire_duration_seconds", "histogram", "Duration of fires")
+    for event_stats in stats:
+        histogram = event_stats.latency
+        for bound, count in histogram.cumulative():
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            lines.append(f"{name}_bucket{_labels(event=event_stats.name, le=le)} {count}")
+        lines.append(f"{name}_sum{_labels(event=event_stats.name)} {histogram.sum!r}")
+        lines.append(f"{name}_count{_labels(event=event_stats.name)} {histogram.count}")
+
+    for key, kind, help in (
+        ("calls", "calls_total", "Number of subscriber calls"),
+        ("time", "duration_seconds_total", "Cumulative duration of subscriber calls"),
+        ("exceptions", "exceptions_total", "Number of exceptions raised by subscribers"),
+    ):
+        name = metric(f"subscriber_{kind}", "counter", help)
+        for event_stats in stats:
+            for subscriber, values in event_stats.as_dict()["subscribers"].items():
+                labels = _labels(event=event_stats.name, subscriber=subscriber)
+                lines.append(f"{name}{labels} {values[key]!r}")
+
+    return "\n".join(lines) + "\n"
+
+
+def _labels(**labels: str) -> str:
+    escaped = (
+        value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        for value in labels.values()
+    )
+    return "{" + ",".join(f'{key}="{value}"' for key, value in zip(labels, escaped)) + "}"
+
+
+def _name(subscriber: Callable[..., Any]) -> str:
+    while isinstance(subscriber, SubscriberWrapper):
+        inner = subscriber.subscriber
+        if inner is None:
+            # a dead weak subscriber
+            break
+        subscriber = inner
+
+    name = getattr(subscriber, "__qualname__", None) or type(subscriber).__qualname__
+    module = getattr(subscriber, "__module__", None)
+    return f"{module}.{name}" if module else name
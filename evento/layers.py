@@ -0,0 +1,63 @@
+"""Adds behaviour to single events, by changing their type into a subclass of their type
+and a mixin (a layer); so other events (of the same type) don't pay for it."""
+
+import inspect
+from typing import NamedTuple
+
+from .base import BaseEvent
+
+
+class Layer(NamedTuple):
+    name: str
+    # mixins (subclasses of BaseEvent without slots of their own) for events
+    # with a normal and with an async `fire`
+    sync: type
+    async_: type
+
+
+# layered type => (type it extends, layer)
+_bases: dict[type, tuple[type, Layer]] = {}
+# (type, layer) => layered type
+_types: dict[tuple[type, Layer], type] = {}
+
+
+def add_layer(event: BaseEvent, layer: Layer) -> None:
+    event.__class__ = _layered(type(event), layer)
+    # the next fire takes a new snapshot, which the layer might want to wrap
+    event._snapshot = None
+
+
+def remove_layer(event: BaseEvent, layer: Layer) -> None:
+    """Removes the given `layer` from the type of `event`, keeping any other layers"""
+    event_type = type(event)
+    layers = []
+    while event_type in _bases:
+        event_type, other = _bases[event_type]
+        layers.append(other)
+
+    for other in reversed(layers):
+        if other != layer:
+            event_type = _layered(event_type, other)
+
+    event.__class__ = event_type
+    event._snapshot = None
+
+
+def is_async(event_type: type) -> bool:
+    """Whether events of the given type have an async `fire`"""
+    return inspect.iscoroutinefunction(getattr(event_type, "fire", None))
+
+
+def _layered(event_type: type, layer: Layer) -> type:
+    layered = _types.get((event_type, layer))
+    if layered is None:
+        mixin = layer.async_ if is_async(event_type) else layer.sync
+        # without slots of its own, so existing events can change to this type
+        layered = type(
+            f"{layer.name}{event_type.__name__}",
+            (mixin, event_type),
+            {"__slots__": (), "__module__": mixin.__module__},
+        )
+        _types[(event_type, layer)] = layered
+        _bases[layered] = (event_type, layer)
+    return layered
@@ -0,0 +1,225 @@
+import asyncio
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import partial
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Generic,
+    Hashable,
+    NamedTuple,
+    Optional,
+    TypeVar,
+)
+
+from .event import Event
+
+R = TypeVar("R")
+
+# separates positional from keyword arguments in cache keys
+_KWARGS_MARK = object()
+
+
+@dataclass(frozen=True)
+class Memoize:
+    """Options for caching the results of a signature event's original method,
+    keyed by the arguments (which have to be hashable).
+
+    `maxsize` limits the number of cached results, evicting the least recently used
+    result when it's exceeded (unlimited when None) and `ttl` limits the time
+    in seconds a result is used for (forever when None).
+
+    The event's subscribers are still invoked for every call, only the original
+    method is skipped when its result is cached; exceptions aren't cached."""
+
+    maxsize: Optional[int] = 128
+    ttl: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        if self.maxsize is not None and self.maxsize < 1:
+            raise ValueError("maxsize should be at least 1")
+        if self.ttl is not None and self.ttl <= 0:
+            raise ValueError("ttl should be positive")
+
+
+class CacheAccess(NamedTuple):
+    """Fired by `MemoCache.accessed` for every call"""
+
+    hit: bool
+    args: tuple[Any, ...]
+    kwargs: dict[str, Any]
+
+
+class BaseMemoCache(Generic[R]):
+    """The results of a method are cached per instance (`per_instance`, set when the
+    event is used as a method): keyed by the id of the instance and evicted once it's
+    garbage collected, so the cache doesn't keep instances alive. Instances that don't
+    support weak references are part of the key, like the other arguments."""
+
+    __slots__ = ("options", "accessed", "per_instance", "_results", "_instances")
+
+    def __init__(self, options: Memoize) -> None:
+        self.options = options
+        # fired for every call, telling if the result came from the cache
+        self.accessed = Event[CacheAccess]()
+        # if the first argument is the instance of a method
+        self.per_instance = False
+        # key => (result, expiry time); ordered from least to most recently used
+        self._results: OrderedDict[Hashable, tuple[R, Optional[float]]] = OrderedDict()
+        # id => (weak reference to the instance, the keys of its results)
+        self._instances: dict[int, tuple[weakref.ref[Any], set[Hashable]]] = {}
+
+    def clear(self) -> None:
+        self._results.clear()
+        for _, keys in self._instances.values():
+            keys.clear()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def __contains__(self, args: tuple[Any, ...]) -> bool:
+        """Tells if there's a valid cached result for the given positional arguments"""
+        return self._lookup(self._key(args, {})) is not None
+
+    def _key(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Hashable:
+        if not self.per_instance or not args:
+            return _key(args, kwargs)
+
+        instance = args[0]
+        owner = id(instance)
+        if owner not in self._instances:
+            try:
+                ref = weakref.ref(instance, partial(self._forget, owner))
+            except TypeError:
+                # in a tuple, so it can't be mistaken for an id
+                return ((instance,), _key(args[1:], kwargs))
+            self._instances[owner] = (ref, set())
+        return (owner, _key(args[1:], kwargs))
+
+    def _forget(self, owner: int, ref: "weakref.ref[Any]") -> None:
+        # evicts the results of an instance that got garbage collected
+        entry = self._instances.get(owner)
+        if entry is None or entry[0] is not ref:
+            return
+        del self._instances[owner]
+        for key in entry[1]:
+            self._results.pop(key, None)
+
+    def _evicted(self, key: Hashable) -> None:
+        if self._instances:
+            entry = self._instances.get(key[0])  # type: ignore[index]
+            if entry is not None:
+                entry[1].discard(key)
+
+    def _lookup(self, key: Hashable) -> Optional[tuple[R, Optional[float]]]:
+        entry = self._results.get(key)
+        if entry is None:
+            return None
+
+        if entry[1] is not None and entry[1] <= time.monotonic():
+            del self._results[key]
+            self._evicted(key)
+            return None
+
+        self._results.move_to_end(key)
+        return entry
+
+    def _store(self, key: Hashable, result: R) -> None:
+        ttl = self.options.ttl
+        self._results[key] = (result, None if ttl is None else time.monotonic() + ttl)
+        if self._instances:
+            entry = self._instances.get(key[0])  # type: ignore[index]
+            if entry is not None:
+                entry[1].add(key)
+
+        maxsize = self.options.maxsize
+        if maxsize is not None and len(self._results) > maxsize:
+            self._evicted(self._results.popitem(last=False)[0])
+
+    def _accessed(self, hit: bool, args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+        # avoids creating the CacheAccess when nobody is interested
+        if self.accessed._subscribers:
+            self.accessed.fire(CacheAccess(hit, args, kwargs))
+
+
+class MemoCache(BaseMemoCache[R]):
+    """Caches the results of `method`, according to the given `options`;
+    calling it calls `method` for arguments that don't have a (valid) cached result"""
+
+    __slots__ = ("method",)
+
+    def __init__(self, method: Callable[..., R], options: Memoize) -> None:
+        super().__init__(options)
+        self.method = method
+
+    def __call__(self, *args: Any, **kwargs: Any) -> R:
+        key = self._key(args, kwargs)
+        entry = self._lookup(key)
+        if entry is not None:
+            self._accessed(True, args, kwargs)
+            return entry[0]
+
+        self._accessed(False, args, kwargs)
+        result = self.method(*args, **kwargs)
+        self._store(key, result)
+        return result
+
+
+class AsyncMemoCache(BaseMemoCache[R]):
+    """`MemoCache` for async methods, caching the awaited results.
+
+    Concurrent calls with the same arguments are coalesced; while a call is in
+    progress, calls with the same arguments await its result instead of awaiting
+    the method again (reported as hits)."""
+
+    __slots__ = ("method", "_pending")
+
+    def __init__(self, method: Callable[..., Awaitable[R]], options: Memoize) -> None:
+        super().__init__(options)
+        self.method = method
+        self._pending: dict[Hashable, asyncio.Future[R]] = {}
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> R:
+        key = self._key(args, kwargs)
+        entry = self._lookup(key)
+        if entry is not None:
+            self._accessed(True, args, kwargs)
+            return entry[0]
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            self._accessed(True, args, kwargs)
+            # shielded, so cancelling this call doesn't cancel the others
+            return await asyncio.shield(pending)
+
+        self._accessed(False, args, kwargs)
+        # in a task of its own, so cancelling any of the calls (including this one)
+        # doesn't cancel the method for the others
+        task = asyncio.ensure_future(self._call(key, args, kwargs))
+        task.add_done_callback(_retrieve)
+        self._pending[key] = task
+        return await asyncio.shield(task)
+
+    async def _call(self, key: Hashable, args: tuple[Any, ...], kwargs: dict[str, Any]) -> R:
+        try:
+            result = await self.method(*args, **kwargs)
+        finally:
+            del self._pending[key]
+        self._store(key, result)
+        return result
+
+
+def _retrieve(task: "asyncio.Future[Any]") -> None:
+    # don't complain about an unretrieved exception when all callers were cancelled
+    if not task.cancelled():
+        task.exception()
+
+
+def _key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> Hashable:
+    if not kwargs:
+        # single int or str arguments are their own key, like with functools.lru_cache
+        return args[0] if len(args) == 1 and type(args[0]) in (int, str) else args
+    return args + (_KWARGS_MARK,) + tuple(kwargs.items())
@@ -0,0 +1,260 @@
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from contextvars import ContextVar
+from time import monotonic, sleep
+from typing import Any, Optional, Sequence, TypeVar, Union, overload
+
+from .async_event import AsyncEvent
+from .event import Event
+from .serialization import PickleSerializer, Serializer
+from .transport import Transport, TransportKind, open_transport
+
+T = TypeVar("T")
+
+log = logging.getLogger(__name__)
+
+# the mirror of which the received values are being fired, so they aren't sent back
+_receiving: ContextVar[Optional["Mirror"]] = ContextVar("evento_receiving", default=None)
+
+
+class Mirror:
+    """Mirrors the fires of an event to the events mirrored (with the same channel)
+    by other processes, see `mirror`"""
+
+    __slots__ = (
+        "event",
+        "transport",
+        "serializer",
+        "batch_size",
+        "linger",
+        "sent",
+        "received",
+        "_loop",
+        "_unsubscribe",
+        "_pending",
+        "_flush_at",
+        "_lock",
+        "_thread",
+        "_closed",
+    )
+
+    def __init__(
+        self,
+        event: Union[Event[Any], AsyncEvent[Any]],
+        transport: Transport,
+        serializer: Serializer,
+        batch_size: int,
+        linger: float,
+        loop: Optional[asyncio.AbstractEventLoop],
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size should be at least 1")
+
+        self.event = event
+        self.transport = transport
+        self.serializer = serializer
+        self.batch_size = batch_size
+        self.linger = linger
+        # the number of values sent to and received from other processes
+        self.sent = 0
+        self.received = 0
+        self._pending: list[Any] = []
+        self._flush_at = 0.0
+        self._lock = threading.Lock()
+        self._closed = False
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        if isinstance(event, AsyncEvent):
+            self._loop = loop or asyncio.get_running_loop()
+            self._unsubscribe = event.add_batch(self._publish_async)
+        else:
+            self._unsubscribe = event.add_batch(self._publish)
+
+        self._thread = threading.Thread(
+            target=self._run, name=f"evento-mirror-{transport.channel}", daemon=True
+        )
+        self._thread.start()
+
+    def _publish(self, values: Sequence[Any]) -> None:
+        if _receiving.get() is self:
+            return
+
+        with self._lock:
+            pending = self._pending
+            if not pending:
+                self._flush_at = monotonic() + self.linger
+            pending.extend(values)
+            if len(pending) >= self.batch_size:
+                self._flush()
+
+    async def _publish_async(self, values: Sequence[Any]) -> None:
+        self._publish(values)
+
+    def _flush(self) -> None:
+        # with the lock held
+        values, self._pending = self._pending, []
+        if values:
+            self.transport.send(self.serializer.dumps(values))
+            self.sent += len(values)
+
+    def flush(self) -> None:
+        """Sends the values that are waiting for a full batch right away"""
+        with self._lock:
+            self._flush()
+
+    def _run(self) -> None:
+        _receiving.set(self)
+        transport = self.transport
+        while not self._closed:
+            timeout = 0.05
+            if self._pending:
+                timeout = min(timeout, max(0.0, self._flush_at - monotonic()))
+                if timeout == 0.0:
+                    with self._lock:
+                        self._flush()
+                    continue
+
+            try:
+                messages = transport.receive(timeout)
+            except Exception:
+                if self._closed:
+                    return
+                log.exception("Failed to receive mirrored messages")
+                sleep(timeout)
+                continue
+
+            for message in messages:
+                try:
+                    values = self.serializer.loads(message)
+                except Exception:
+                    log.exception("Failed to deserialize a mirrored message")
+                    continue
+                self.received += len(values)
+                self._dispatch(values)
+
+    def _dispatch(self, values: list[Any]) -> None:
+        if self._loop is None:
+            try:
+                _fire(self.event, values)
+            except Exception:
+                log.exception("Subscriber of mirrored event raised")
+            return
+
+        try:
+            future = asyncio.run_coroutine_threadsafe(self._dispatch_async(values), self._loop)
+        except RuntimeError:
+            # the loop is closed
+            self._closed = True
+            return
+
+        # waits for the fire, so mirrored values are fired in order
+        while True:
+            try:
+                future.result(0.05)
+                return
+            except concurrent.futures.TimeoutError:
+                if self._closed:
+                    future.cancel()
+                    return
+
+    async def _dispatch_async(self, values: list[Any]) -> None:
+        # the task has its own context
+        _receiving.set(self)
+        try:
+            await _fire_async(self.event, values)
+        except Exception:
+            log.exception("Subscriber of mirrored event raised")
+
+    def close(self) -> None:
+        """Stops mirroring, after sending the values that are waiting for a full batch"""
+        if self._closed:
+            return
+        self._unsubscribe()
+        self.flush()
+        self._closed = True
+        if threading.current_thread() is not self._thread:
+            self._thread.join()
+        self.transport.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"Mirror(channel={self.transport.channel!r}, sent={self.sent},"
+            f" received={self.received})"
+        )
+
+
+def _fire(event: Any, values: list[Any]) -> None:
+    if len(values) == 1:
+        event.fire(values[0])
+    else:
+        event.fire_many(values)
+
+
+async def _fire_async(event: Any, values: list[Any]) -> None:
+    if len(values) == 1:
+        await event.fire(values[0])
+    else:
+        await event.fire_many(values)
+
+
+@overload
+def mirror(
+    event: Event[T],
+    channel: str,
+    transport: Union[TransportKind, Transport] = "auto",
+    serializer: Optional[Serializer] = None,
+    batch_size: int = 1,
+    linger: float = 0.001,
+    *,
+    directory: Optional[str] = None,
+) -> Mirror:
+    ...
+
+
+@overload
+def mirror(
+    event: AsyncEvent[T],
+    channel: str,
+    transport: Union[TransportKind, Transport] = "auto",
+    serializer: Optional[Serializer] = None,
+    batch_size: int = 1,
+    linger: float = 0.001,
+    loop: Optional[asyncio.AbstractEventLoop] = None,
+    *,
+    directory: Optional[str] = None,
+) -> Mirror:
+    ...
+
+
+def mirror(
+    event: Union[Event[Any], AsyncEvent[Any]],
+    channel: str,
+    transport: Union[TransportKind, Transport] = "auto",
+    serializer: Optional[Serializer] = None,
+    batch_size: int = 1,
+    linger: float = 0.001,
+    loop: Optional[asyncio.AbstractEventLoop] = None,
+    *,
+    directory: Optional[str] = None,
+) -> Mirror:
+    """Sends the values fired by `event` to the events mirrored with the same `channel`
+    in other processes on this host, and fires the values they send; without a broker.
+
+    `transport` is "shared_memory" (a ring buffer all processes read), "socket" (unix
+    datagram sockets) or "auto" (shared memory when available, otherwise sockets).
+    Values are serialized by `serializer` (a `PickleSerializer` by default).
+    Fires are sent in batches of `batch_size` values; a batch that isn't full is sent
+    after `linger` seconds. Values fired by `fire_many` are sent together.
+
+    Received values are fired by a thread of the mirror: `Event`s are fired in that
+    thread, `AsyncEvent`s in their `loop` (by default the running loop). Values fired
+    while firing received values (by the event's subscribers) aren't sent.
+    `Mirror.close` stops mirroring. Transports that are opened by kind use
+    `directory` for their files, see `Transport`."""
+    if not isinstance(transport, Transport):
+        transport = open_transport(channel, transport, directory)
+    elif transport.channel != channel:
+        raise ValueError("The transport should be opened for the same channel")
+    return Mirror(event, transport, serializer or PickleSerializer(), batch_size, linger, loop)
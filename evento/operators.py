@@ -0,0 +1,415 @@
+"""Operators that derive a new event from an existing (source) event, firing less often
+than the source; for example for sources that fire faster than subscribers need.
+
+The derived event is an `Event` for an `Event` source and an `AsyncEvent` for an
+`AsyncEvent` source, so operators can be chained. The source only references
+the operator weakly; it stops once the derived event is garbage collected or detached.
+
+Timing uses callbacks scheduled on an asyncio event loop (the running loop when it's
+first needed, unless one is given), at most one per operator at a time and
+rescheduled lazily, instead of a timer per fire. The source has to fire on the loop's
+thread. Values that are emitted by a timer are dispatched by a task for async events."""
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Generic, Hashable, Optional, TypeVar, Union, overload
+
+from .async_event import AsyncEvent
+from .event import Event
+
+T = TypeVar("T")
+
+
+class DerivedEvent(Event[T]):
+    """An `Event` that is fired by an operator"""
+
+    __slots__ = ("_operator",)
+
+    _operator: "Operator[T]"
+
+    def detach(self) -> None:
+        """Stops the operator; pending values are discarded"""
+        self._operator.detach()
+
+
+class AsyncDerivedEvent(AsyncEvent[T]):
+    """An `AsyncEvent` that is fired by an operator"""
+
+    __slots__ = ("_operator",)
+
+    _operator: "Operator[T]"
+
+    def detach(self) -> None:
+        """Stops the operator; pending values are discarded"""
+        self._operator.detach()
+
+
+class Operator(ABC, Generic[T]):
+    """Base class of the operators; subscribed (weakly) to the source and firing
+    `output`, which keeps the operator alive"""
+
+    def __init__(
+        self, source: Union[Event[Any], AsyncEvent[Any]], loop: Optional[asyncio.AbstractEventLoop]
+    ) -> None:
+        self.source = source
+        self.loop = loop
+        self.handle: Optional[asyncio.TimerHandle] = None
+        self.output: Union[DerivedEvent[T], AsyncDerivedEvent[T]]
+        # values emitted by an async source's subscriber, awaited once it's done
+        self._ready: Optional[list[T]] = None
+        self._tasks: set[asyncio.Task[None]] = set()
+        self.is_async = isinstance(source, AsyncEvent)
+
+        self.output = AsyncDerivedEvent[T]() if self.is_async else DerivedEvent[T]()
+        self.output._operator = self
+        # the operator itself is subscribed, because weakly referenced bound methods
+        # are relatively slow to call
+        source.append_weak(self)
+
+    def __call__(self, value: Any) -> Any:
+        if self.is_async:
+            return self._receive_async(value)
+        self.receive(value)
+
+    @abstractmethod
+    def receive(self, value: Any) -> None:
+        """Handles a value fired by the source; calls `emit` for the values to fire"""
+
+    def detach(self) -> None:
+        if self.handle is not None:
+            self.handle.cancel()
+            self.handle = None
+        self.source.remove(self)
+
+    async def _receive_async(self, value: Any) -> None:
+        ready = self._ready = []
+        try:
+            self.receive(value)
+        finally:
+            self._ready = None
+        for emitted in ready:
+            await self.output.fire(emitted)  # type: ignore[misc]
+
+    def emit(self, value: T) -> None:
+        output = self.output
+        if not self.is_async:
+            output.fire(value)
+        elif self._ready is not None:
+            self._ready.append(value)
+        else:
+            # emitted by a timer
+            task = self._loop().create_task(output.fire(value))  # type: ignore[arg-type]
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def _loop(self) -> asyncio.AbstractEventLoop:
+        if self.loop is None:
+            self.loop = asyncio.get_running_loop()
+        return self.loop
+
+
+class _Throttle(Operator[T]):
+    def __init__(
+        self,
+        source: Union[Event[Any], AsyncEvent[Any]],
+        interval: float,
+        leading: bool,
+        trailing: bool,
+        loop: Optional[asyncio.AbstractEventLoop],
+    ) -> None:
+        if not (leading or trailing):
+            raise ValueError("leading and/or trailing should be True")
+        super().__init__(source, loop)
+        self.interval = interval
+        self.leading = leading
+        self.trailing = trailing
+        # the end of the current interval, before which nothing else is emitted
+        self.window_end = float("-inf")
+        self.latest: Optional[T] = None
+        self.has_latest = False
+
+    def receive(self, value: T) -> None:
+        loop = self._loop()
+        now = loop.time()
+        if now >= self.window_end:
+            self.window_end = now + self.interval
+            if self.leading:
+                self.emit(value)
+                return
+
+        self.latest = value
+        self.has_latest = True
+        if self.trailing and self.handle is None:
+            self.handle = loop.call_at(self.window_end, self._flush)
+
+    def _flush(self) -> None:
+        self.handle = None
+        if self.has_latest:
+            value = self.latest
+            self.latest, self.has_latest = None, False
+            self.window_end = self._loop().time() + self.interval
+            self.emit(value)  # type: ignore[arg-type]
+
+
+class _Debounce(Operator[T]):
+    def __init__(
+        self,
+        source: Union[Event[Any], AsyncEvent[Any]],
+        quiet: float,
+        loop: Optional[asyncio.AbstractEventLoop],
+    ) -> None:
+        super().__init__(source, loop)
+        self.quiet = quiet
+        self.deadline = 0.0
+        self.latest: Optional[T] = None
+
+    def receive(self, value: T) -> None:
+        loop = self._loop()
+        self.latest = value
+        # the pending timer isn't rescheduled for every fire; when it expires
+        # before the deadline, it's rescheduled once for the deadline
+        self.deadline = loop.time() + self.quiet
+        if self.handle is None:
+            self.handle = loop.call_at(self.deadline, self._flush)
+
+    def _flush(self) -> None:
+        loop = self._loop()
+        if loop.time() < self.deadline:
+            self.handle = loop.call_at(self.deadline, self._flush)
+            return
+
+        self.handle = None
+        value, self.latest = self.latest, None
+        self.emit(value)  # type: ignore[arg-type]
+
+
+class _Coalesce(Operator[T]):
+    def __init__(
+        self,
+        source: Union[Event[Any], AsyncEvent[Any]],
+        window: float,
+        key: Callable[[T], Hashable],
+        loop: Optional[asyncio.AbstractEventLoop],
+    ) -> None:
+        super().__init__(source, loop)
+        self.window = window
+        self.key = key
+        self.latest: dict[Hashable, T] = {}
+
+    def receive(self, value: T) -> None:
+        self.latest[self.key(value)] = value
+        if self.handle is None:
+            self.handle = self._loop().call_later(self.window, self._flush)
+
+    def _flush(self) -> None:
+        self.handle = None
+        values, self.latest = self.latest, {}
+        for value in values.values():
+            self.emit(value)
+
+
+class _Sample(Operator[T]):
+    def __init__(
+        self,
+        source: Union[Event[Any], AsyncEvent[Any]],
+        period: float,
+        loop: Optional[asyncio.AbstractEventLoop],
+    ) -> None:
+        super().__init__(source, loop)
+        self.period = period
+        self.latest: Optional[T] = None
+        self.has_latest = False
+
+    def receive(self, value: T) -> None:
+        self.latest = value
+        self.has_latest = True
+        if self.handle is None:
+            self.handle = self._loop().call_later(self.period, self._tick)
+
+    def _tick(self) -> None:
+        if not self.has_latest:
+            # idle until the next value
+            self.handle = None
+            return
+
+        self.handle = self._loop().call_later(self.period, self._tick)
+        value = self.latest
+        self.latest, self.has_latest = None, False
+        self.emit(value)  # type: ignore[arg-type]
+
+
+class _Buffer(Operator[list[T]]):
+    def __init__(
+        self,
+        source: Union[Event[Any], AsyncEvent[Any]],
+        count: Optional[int],
+        time: Optional[float],
+        loop: Optional[asyncio.AbstractEventLoop],
+    ) -> None:
+        if count is None and time is None:
+            raise ValueError("count and/or time should be given")
+        if count is not None and count < 1:
+            raise ValueError("count should be at least 1")
+        super().__init__(source, loop)
+        self.count = count
+        self.time = time
+        self.values: list[T] = []
+
+    def receive(self, value: T) -> None:
+        values = self.values
+        values.append(value)
+        if self.count is not None and len(values) >= self.count:
+            self._flush()
+        elif self.time is not None and self.handle is None:
+            self.handle = self._loop().call_later(self.time, self._flush)
+
+    def _flush(self) -> None:
+        if self.handle is not None:
+            self.handle.cancel()
+            self.handle = None
+        values, self.values = self.values, []
+        if values:
+            self.emit(values)
+
+
+@overload
+def throttle(
+    source: AsyncEvent[T],
+    interval: float,
+    leading: bool = True,
+    trailing: bool = True,
+    loop: Optional[asyncio.AbstractEventLoop] = None,
+) -> AsyncDerivedEvent[T]:
+    ...
+
+
+@overload
+def throttle(
+    source: Event[T],
+    interval: float,
+    leading: bool = True,
+    trailing: bool = True,
+    loop: Optional[asyncio.AbstractEventLoop] = None,
+) -> DerivedEvent[T]:
+    ...
+
+
+def throttle(
+    source: Union[Event[T], AsyncEvent[T]],
+    interval: float,
+    leading: bool = True,
+    trailing: bool = True,
+    loop: Optional[asyncio.AbstractEventLoop] = None,
+) -> Union[DerivedEvent[T], AsyncDerivedEvent[T]]:
+    """Fires at most once per `interval` seconds; with the first value of an interval
+    when `leading`, and with the latest value at the end of an interval when `trailing`"""
+    return _Throttle[T](source, interval, leading, trailing, loop).output
+
+
+@overload
+def debounce(
+    source: AsyncEvent[T], quiet: float, loop: Optional[asyncio.AbstractEventLoop] = None
+) -> AsyncDerivedEvent[T]:
+    ...
+
+
+@overload
+def debounce(
+    source: Event[T], quiet: float, loop: Optional[asyncio.AbstractEventLoop] = None
+) -> DerivedEvent[T]:
+    ...
+
+
+def debounce(
+    source: Union[Event[T], AsyncEvent[T]],
+    quiet: float,
+    loop: Optional[asyncio.AbstractEventLoop] = None,
+) -> Union[DerivedEvent[T], AsyncDerivedEvent[T]]:
+    """Fires with the latest value once the source didn't fire for `quiet` seconds"""
+    return _Debounce[T](source, quiet, loop).output
+
+
+@overload
+def coalesce(
+    source: AsyncEvent[T],
+    window: float,
+    key: Callable[[T], Hashable],
+    loop: Optional[asyncio.AbstractEventLoop] = None,
+) -> AsyncDerivedEvent[T]:
+    ...
+
+
+@overload
+def coalesce(
+    source: Event[T],
+    window: float,
+    key: Callable[[T], Hashable],
+    loop: Optional[asyncio.AbstractEventLoop] = None,
+) -> DerivedEvent[T]:
+    ...
+
+
+def coalesce(
+    source: Union[Event[T], AsyncEvent[T]],
+    window: float,
+    key: Callable[[T], Hashable],
+    loop: Optional[asyncio.AbstractEventLoop] = None,
+) -> Union[DerivedEvent[T], AsyncDerivedEvent[T]]:
+    """Collects values for `window` seconds (from the first value) and then fires with
+    the latest value of every `key`, in the order the keys were first seen"""
+    return _Coalesce[T](source, window, key, loop).output
+
+
+@overload
+def sample(
+    source: AsyncEvent[T], period: float, loop: Optional[asyncio.AbstractEventLoop] = None
+) -> AsyncDerivedEvent[T]:
+    ...
+
+
+@overload
+def sample(
+    source: Event[T], period: float, loop: Optional[asyncio.AbstractEventLoop] = None
+) -> DerivedEvent[T]:
+    ...
+
+
+def sample(
+    source: Union[Event[T], AsyncEvent[T]],
+    period: float,
+    loop: Optional[asyncio.AbstractEventLoop] = None,
+) -> Union[DerivedEvent[T], AsyncDerivedEvent[T]]:
+    """Fires every `period` seconds with the latest value, unless the source
+    didn't fire since the previous sample"""
+    return _Sample[T](source, period, loop).output
+
+
+@overload
+def buffer(
+    source: AsyncEvent[T],
+    count: Optional[int] = None,
+    time: Optional[float] = None,
+    loop: Optional[asyncio.AbstractEventLoop] = None,
+) -> AsyncDerivedEvent[list[T]]:
+    ...
+
+
+@overload
+def buffer(
+    source: Event[T],
+    count: Optional[int] = None,
+    time: Optional[float] = None,
+    loop: Optional[asyncio.AbstractEventLoop] = None,
+) -> DerivedEvent[list[T]]:
+    ...
+
+
+def buffer(
+    source: Union[Event[T], AsyncEvent[T]],
+    count: Optional[int] = None,
+    time: Optional[float] = None,
+    loop: Optional[asyncio.AbstractEventLoop] = None,
+) -> Union[DerivedEvent[list[T]], AsyncDerivedEvent[list[T]]]:
+    """Fires with lists of values; once `count` values were collected
+    and/or `time` seconds after the first value of a list"""
+    return _Buffer[T](source, count, time, loop).output
@@ -0,0 +1,249 @@
+import asyncio
+import logging
+from time import perf_counter
+from typing import Any, Callable, Hashable, Iterable, Literal, Optional, TypeVar
+
+from .async_event import AsyncEvent
+from .concurrency import Concurrency
+from .instrumentation import DEFAULT_BUCKETS, Histogram
+
+T = TypeVar("T")
+
+log = logging.getLogger(__name__)
+
+# what a fire does when the queue is full, see `QueuedEvent`
+Backpressure = Literal["block", "drop_newest", "drop_oldest", "coalesce"]
+
+_BACKPRESSURES = ("block", "drop_newest", "drop_oldest", "coalesce")
+
+
+class QueueStats:
+    """The metrics of a `QueuedEvent`; `latency` is the time (in seconds)
+    values spent between their fire and their dispatch"""
+
+    __slots__ = ("enqueued", "dropped", "coalesced", "dispatched", "max_depth", "latency")
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        self.enqueued = 0
+        self.dropped = 0
+        # values that replaced a queued value with the same key
+        self.coalesced = 0
+        self.dispatched = 0
+        self.max_depth = 0
+        self.latency = Histogram(buckets)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "enqueued": self.enqueued,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "dispatched": self.dispatched,
+            "max_depth": self.max_depth,
+            "latency": self.latency.as_dict(),
+        }
+
+
+class QueuedEvent(AsyncEvent[T]):
+    """AsyncEvent that decouples firing from dispatching: fires put the value in a
+    bounded queue (of `maxsize` values) and return right away, `consumers` tasks
+    dispatch the queued values to the subscribers.
+
+    When the queue is full, `backpressure` decides what happens to a new value:
+    - "block": `fire` waits for room (and `fire_nowait` raises `asyncio.QueueFull`)
+    - "drop_newest": the new value is dropped
+    - "drop_oldest": the oldest queued value is dropped to make room
+    - "coalesce": a queued value with the same `key` (see below) is replaced by the
+      new one, also when the queue isn't full; new keys wait for room like "block".
+      Without `key` all values share the same key, so only the latest is dispatched.
+
+    Consumers dispatch up to `batch_size` queued values at once, using `fire_many`
+    (so batch subscribers receive them in a single call). Exceptions raised by
+    subscribers are handled by the event's `error_policy` or logged.
+
+    Consumer tasks are started by the first fire and stopped by `close`."""
+
+    __slots__ = (
+        "_queue",
+        "_backpressure",
+        "_key",
+        "_latest",
+        "_consumers",
+        "_batch_size",
+        "_tasks",
+        "_queue_stats",
+    )
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        backpressure: Backpressure = "block",
+        consumers: int = 1,
+        batch_size: int = 1,
+        key: Optional[Callable[[T], Hashable]] = None,
+        concurrency: Optional[Concurrency] = None,
+    ) -> None:
+        """`concurrency` is used for dispatching single values, see `AsyncEvent`"""
+        super().__init__(concurrency)
+        if maxsize < 1:
+            raise ValueError("maxsize should be at least 1")
+        if backpressure not in _BACKPRESSURES:
+            raise ValueError(f"backpressure should be one of {', '.join(_BACKPRESSURES)}")
+        if consumers < 1:
+            raise ValueError("consumers should be at least 1")
+        if batch_size < 1:
+            raise ValueError("batch_size should be at least 1")
+
+        # (time of the fire, value) items; keys instead of values when coalescing
+        self._queue: asyncio.Queue[tuple[float, Any]] = asyncio.Queue(maxsize)
+        self._backpressure = backpressure
+        self._key = key
+        # key => latest value, for the queued keys when coalescing
+        self._latest: dict[Hashable, T] = {}
+        self._consumers = consumers
+        self._batch_size = batch_size
+        self._tasks: Optional[list[asyncio.Task[None]]] = None
+        self._queue_stats = QueueStats()
+
+    @property
+    def queue_stats(self) -> QueueStats:
+        return self._queue_stats
+
+    @property
+    def depth(self) -> int:
+        """The number of queued values"""
+        return self._queue.qsize()
+
+    async def fire(self, value: T) -> None:
+        """Queues the given `value`; waits for room when the queue is full
+        and the backpressure is "block" (or "coalesce", for a new key)"""
+        backpressure = self._backpressure
+        if backpressure == "block":
+            if self._tasks is None:
+                self._start()
+            await self._queue.put((perf_counter(), value))
+            self._enqueued()
+        elif backpressure == "coalesce":
+            await self._coalesce(value)
+        else:
+            self.fire_nowait(value)
+
+    __call__ = fire
+
+    async def fire_many(self, values: Iterable[T]) -> None:
+        """Queues every one of the given `values`, see `fire`"""
+        for value in values:
+            await self.fire(value)
+
+    def fire_nowait(self, value: T) -> bool:
+        """Queues the given `value` without waiting; returns False when it got dropped.
+        Raises `asyncio.QueueFull` when there's no room and the backpressure is
+        "block" (or "coalesce", for a new key)."""
+        if self._tasks is None:
+            self._start()
+
+        queue = self._queue
+        stats = self._queue_stats
+
+        if self._backpressure == "coalesce":
+            key = None if self._key is None else self._key(value)
+            if key in self._latest:
+                self._latest[key] = value
+                stats.coalesced += 1
+                return True
+            queue.put_nowait((perf_counter(), key))
+            self._latest[key] = value
+            self._enqueued()
+            return True
+
+        if queue.full():
+            if self._backpressure == "drop_newest":
+                stats.dropped += 1
+                return False
+            if self._backpressure == "drop_oldest":
+                queue.get_nowait()
+                queue.task_done()
+                stats.dropped += 1
+
+        queue.put_nowait((perf_counter(), value))
+        self._enqueued()
+        return True
+
+    async def join(self) -> None:
+        """Waits until all queued values are dispatched"""
+        await self._queue.join()
+
+    async def close(self, drain: bool = True) -> None:
+        """Stops the consumer tasks, after dispatching the queued values when `drain`"""
+        if self._tasks is None:
+            return
+        if drain:
+            await self.join()
+
+        tasks, self._tasks = self._tasks, None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _coalesce(self, value: T) -> None:
+        key = None if self._key is None else self._key(value)
+        latest = self._latest
+        if key in latest:
+            latest[key] = value
+            self._queue_stats.coalesced += 1
+            return
+
+        if self._tasks is None:
+            self._start()
+        # set before waiting for room, so fires with the same key coalesce into it
+        latest[key] = value
+        try:
+            await self._queue.put((perf_counter(), key))
+        except BaseException:
+            del latest[key]
+            raise
+        self._enqueued()
+
+    def _enqueued(self) -> None:
+        stats = self._queue_stats
+        stats.enqueued += 1
+        depth = self._queue.qsize()
+        if depth > stats.max_depth:
+            stats.max_depth = depth
+
+    def _start(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._tasks = [loop.create_task(self._consume()) for _ in range(self._consumers)]
+
+    async def _consume(self) -> None:
+        queue = self._queue
+        stats = self._queue_stats
+        latency = stats.latency
+        batch_size = self._batch_size
+        coalescing = self._backpressure == "coalesce"
+
+        while True:
+            items = [await queue.get()]
+            while len(items) < batch_size and not queue.empty():
+                items.append(queue.get_nowait())
+
+            now = perf_counter()
+            for fired, _ in items:
+                latency.observe(now - fired)
+
+            if coalescing:
+                values = [self._latest.pop(key) for _, key in items]
+            else:
+                values = [value for _, value in items]
+
+            try:
+                if len(values) == 1:
+                    await AsyncEvent.fire(self, values[0])
+                else:
+                    await AsyncEvent.fire_many(self, values)
+            except Exception:
+                # the consumer keeps going
+                log.exception("Subscriber of queued event raised")
+            finally:
+                stats.dispatched += len(values)
+                for _ in items:
+                    queue.task_done()
@@ -0,0 +1,364 @@
+import bisect
+import inspect
+import mmap
+import os
+import struct
+import sys
+import threading
+import zlib
+from array import array
+from time import monotonic
+from typing import (
+    Any,
+    Awaitable,
+    BinaryIO,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Union,
+)
+
+from .async_event import AsyncEvent
+from .event import Event
+from .serialization import PickleSerializer, Serializer
+
+# every record starts with the length and crc32 of its payload, and its sequence number
+_RECORD = struct.Struct("<IIQ")
+_OFFSET = struct.Struct("<Q")
+
+
+class _Segment:
+    """A log file (of which the name is the sequence number of its first record)
+    and an index file with the offset of every record"""
+
+    __slots__ = ("first_seq", "path", "index_path")
+
+    def __init__(self, directory: str, first_seq: int) -> None:
+        self.first_seq = first_seq
+        self.path = os.path.join(directory, f"{first_seq:020d}.log")
+        self.index_path = os.path.join(directory, f"{first_seq:020d}.idx")
+
+
+class EventLog:
+    """Append-only log of values, in memory mapped segment files of (at least)
+    `segment_size` bytes in `directory`. Records are numbered from 1 on; an index
+    of their offsets makes reading from any sequence number O(1).
+
+    Appended records are written to the memory map, so they survive the process
+    crashing right away. Commits (`commit`) flush them and the index to disk (with
+    `fsync`, unless it's False) for every `commit_every` records, and on the first
+    append `commit_interval` seconds after the last commit; so many appends share
+    a single (slow) flush. Opening the log recovers records that weren't committed
+    (yet made it to disk), and drops incomplete ones.
+
+    A log has a single writer; reading (see `read`) can happen while appending."""
+
+    __slots__ = (
+        "directory",
+        "segment_size",
+        "serializer",
+        "commit_every",
+        "commit_interval",
+        "fsync",
+        "_segments",
+        "_first_seqs",
+        "_file",
+        "_map",
+        "_offsets",
+        "_end",
+        "_next_seq",
+        "_committed",
+        "_committed_end",
+        "_committed_at",
+        "_index_file",
+        "_lock",
+    )
+
+    # of the active segment
+    _file: BinaryIO
+    _map: mmap.mmap
+    _offsets: "array[int]"
+    _end: int
+    _index_file: BinaryIO
+    _next_seq: int
+    _committed: int
+    _committed_end: int
+    _committed_at: float
+
+    def __init__(
+        self,
+        directory: str,
+        segment_size: int = 64 << 20,
+        serializer: Optional[Serializer] = None,
+        commit_every: int = 1000,
+        commit_interval: float = 0.1,
+        fsync: bool = True,
+    ) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.segment_size = segment_size
+        self.serializer = serializer or PickleSerializer()
+        self.commit_every = commit_every
+        self.commit_interval = commit_interval
+        self.fsync = fsync
+        self._lock = threading.Lock()
+
+        first_seqs = sorted(
+            int(name[:-4]) for name in os.listdir(directory) if name.endswith(".log")
+        )
+        self._segments = [_Segment(directory, first_seq) for first_seq in first_seqs]
+        self._first_seqs = first_seqs
+        if self._segments:
+            self._open_active()
+        else:
+            self._create_segment(1, segment_size)
+
+    @property
+    def first_seq(self) -> int:
+        return self._first_seqs[0]
+
+    @property
+    def next_seq(self) -> int:
+        """The sequence number of the next record"""
+        return self._next_seq
+
+    def __len__(self) -> int:
+        return self._next_seq - self._first_seqs[0]
+
+    def append(self, value: Any) -> int:
+        """Appends a record with the given `value`, returns its sequence number"""
+        payload = self.serializer.dumps(value)
+        with self._lock:
+            seq = self._write(payload)
+            self._maybe_commit()
+        return seq
+
+    def extend(self, values: Iterable[Any]) -> int:
+        """Appends a record for every one of the given `values`;
+        returns the sequence number of the next record"""
+        dumps = self.serializer.dumps
+        payloads = [dumps(value) for value in values]
+        with self._lock:
+            for payload in payloads:
+                self._write(payload)
+            self._maybe_commit()
+            return self._next_seq
+
+    def _write(self, payload: bytes) -> int:
+        length = len(payload)
+        end = self._end
+        if end + _RECORD.size + length > len(self._map):
+            self._roll(_RECORD.size + length)
+            end = self._end
+
+        seq = self._next_seq
+        mapped = self._map
+        start = end + _RECORD.size
+        mapped[start : start + length] = payload
+        # the header last, so incomplete records don't look complete
+        _RECORD.pack_into(mapped, end, length, zlib.crc32(payload), seq)
+        self._offsets.append(end)
+        self._end = start + length
+        self._next_seq = seq + 1
+        return seq
+
+    def _maybe_commit(self) -> None:
+        if self._next_seq - self._committed >= self.commit_every:
+            self._commit()
+        elif monotonic() - self._committed_at >= self.commit_interval:
+            self._commit()
+
+    def commit(self) -> None:
+        """Flushes the appended records (and their index) to disk"""
+        with self._lock:
+            self._commit()
+
+    def _commit(self) -> None:
+        first_seq = self._first_seqs[-1]
+        uncommitted = self._committed - first_seq
+        if uncommitted < len(self._offsets):
+            if self.fsync:
+                # flush from the page with the first uncommitted record
+                start = self._committed_end - self._committed_end % mmap.PAGESIZE
+                self._map.flush(start, self._end - start)
+            self._index_file.write(self._offsets[uncommitted:].tobytes())
+            self._index_file.flush()
+            if self.fsync:
+                os.fsync(self._index_file.fileno())
+        self._committed = self._next_seq
+        self._committed_end = self._end
+        self._committed_at = monotonic()
+
+    def _roll(self, size: int) -> None:
+        # seals the active segment, and starts a new one
+        self._commit()
+        self._close_active()
+        segment = self._segments[-1]
+        with open(segment.path, "r+b") as file:
+            file.truncate(self._end)
+        self._create_segment(self._next_seq, max(self.segment_size, size))
+
+    def _create_segment(self, first_seq: int, size: int) -> None:
+        segment = _Segment(self.directory, first_seq)
+        with open(segment.path, "wb") as file:
+            file.truncate(size)
+        open(segment.index_path, "wb").close()
+        self._segments.append(segment)
+        self._first_seqs.append(first_seq)
+        self._open_active()
+
+    def _open_active(self) -> None:
+        segment = self._segments[-1]
+        self._file = open(segment.path, "r+b")
+        self._map = mmap.mmap(self._file.fileno(), 0)
+        offsets = array("Q")
+        if os.path.exists(segment.index_path):
+            with open(segment.index_path, "rb") as file:
+                offsets.frombytes(file.read())
+
+        # drops records of the index that didn't make it to disk
+        mapped = self._map
+        while offsets and not _valid(mapped, offsets[-1], segment.first_seq + len(offsets) - 1):
+            offsets.pop()
+
+        # and recovers records that did, but weren't indexed
+        end = 0
+        if offsets:
+            end = offsets[-1] + _RECORD.size + _RECORD.unpack_from(mapped, offsets[-1])[0]
+        while _valid(mapped, end, segment.first_seq + len(offsets)):
+            offsets.append(end)
+            end += _RECORD.size + _RECORD.unpack_from(mapped, end)[0]
+
+        with open(segment.index_path, "wb") as file:
+            file.write(offsets.tobytes())
+        self._index_file = open(segment.index_path, "ab")
+        self._offsets = offsets
+        self._end = end
+        self._next_seq = segment.first_seq + len(offsets)
+        self._committed = self._next_seq
+        self._committed_end = end
+        self._committed_at = monotonic()
+
+    def _close_active(self) -> None:
+        self._map.close()
+        self._file.close()
+        self._index_file.close()
+
+    def close(self) -> None:
+        """Commits and closes the log"""
+        with self._lock:
+            if self._map.closed:
+                return
+            self._commit()
+            self._close_active()
+
+    def __enter__(self) -> "EventLog":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def read(self, from_seq: int = 1, to_seq: Optional[int] = None) -> Iterator[tuple[int, Any]]:
+        """Yields the sequence number and value of the records from `from_seq` up to
+        (not including) `to_seq`, or up to the last record, also when that's appended
+        while reading. Only one segment is mapped (not read) at a time."""
+        seq = max(from_seq, self._first_seqs[0])
+        loads = self.serializer.loads
+        while seq < (self._next_seq if to_seq is None else min(to_seq, self._next_seq)):
+            index = bisect.bisect_right(self._first_seqs, seq) - 1
+            segment = self._segments[index]
+            with open(segment.path, "rb") as file:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                offset = self._offset(index, seq)
+                while True:
+                    # up to the end of the segment, which grows while it's active
+                    limit = self._next_seq
+                    if index + 1 < len(self._first_seqs):
+                        limit = self._first_seqs[index + 1]
+                    if to_seq is not None:
+                        limit = min(limit, to_seq)
+                    if seq >= limit:
+                        break
+
+                    length = _RECORD.unpack_from(mapped, offset)[0]
+                    start = offset + _RECORD.size
+                    with memoryview(mapped)[start : start + length] as payload:
+                        value = loads(payload)
+                    yield seq, value
+                    seq += 1
+                    offset = start + length
+            finally:
+                mapped.close()
+
+    def _offset(self, index: int, seq: int) -> int:
+        # the offset of the record in the segment with the given index
+        segment = self._segments[index]
+        position = seq - segment.first_seq
+        if index == len(self._segments) - 1:
+            return self._offsets[position]
+        with open(segment.index_path, "rb") as file:
+            file.seek(position * _OFFSET.size)
+            offset: int = _OFFSET.unpack(file.read(_OFFSET.size))[0]
+            return offset
+
+    def replay(
+        self, target: Callable[[Any], Any], from_seq: int = 1, to_seq: Optional[int] = None
+    ) -> int:
+        """Calls `target` (like an event, or a subscriber) with the recorded values from
+        `from_seq` on, one at a time; up to `to_seq` (not including it), or the records
+        that were there when the replay started. Returns the next sequence number."""
+        if to_seq is None:
+            to_seq = self._next_seq
+        next_seq = from_seq
+        for seq, value in self.read(from_seq, to_seq):
+            target(value)
+            next_seq = seq + 1
+        return next_seq
+
+    async def replay_async(
+        self,
+        target: Callable[[Any], Awaitable[Any]],
+        from_seq: int = 1,
+        to_seq: Optional[int] = None,
+    ) -> int:
+        """Same as `replay` but awaits `target` (like an async event, or subscriber)"""
+        if to_seq is None:
+            to_seq = self._next_seq
+        next_seq = from_seq
+        for seq, value in self.read(from_seq, to_seq):
+            result = target(value)
+            if inspect.isawaitable(result):
+                await result
+            next_seq = seq + 1
+        return next_seq
+
+    def __repr__(self) -> str:
+        return f"EventLog({self.directory!r}, records={self.first_seq}..{self._next_seq - 1})"
+
+
+def _valid(mapped: mmap.mmap, offset: int, seq: int) -> bool:
+    # if there's a complete record with the given sequence number at `offset`
+    if offset + _RECORD.size > len(mapped):
+        return False
+    length, crc, record_seq = _RECORD.unpack_from(mapped, offset)
+    start = offset + _RECORD.size
+    if record_seq != seq or start + length > len(mapped):
+        return False
+    with memoryview(mapped)[start : start + length] as payload:
+        return bool(zlib.crc32(payload) == crc)
+
+
+def record(
+    event: Union[Event[Any], AsyncEvent[Any]], log: EventLog, priority: int = sys.maxsize
+) -> Callable[[], Any]:
+    """Appends the values fired by `event` to `log`; by default before the other
+    subscribers are invoked. Returns a callable that stops recording."""
+    if isinstance(event, AsyncEvent):
+
+        async def extend(values: Iterable[Any]) -> None:
+            log.extend(values)
+
+        return event.add_batch(extend, priority)
+    return event.add_batch(log.extend, priority)
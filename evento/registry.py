@@ -0,0 +1,178 @@
+from typing import Any, Callable, Generic, Iterable, Optional, TypeVar, Union
+
+from .base import BaseEvent
+
+T = TypeVar("T")
+
+SEPARATOR = "."
+# matches a single segment of a topic
+ANY_SEGMENT = "*"
+# matches zero or more segments of a topic
+ANY_SEGMENTS = "#"
+
+
+class TopicEvent(Generic[T], BaseEvent):
+    """The event of a topic pattern in an `EventRegistry`;
+    subscribers receive the fired topic and value"""
+
+    __slots__ = ("pattern",)
+
+    def __init__(self, pattern: str) -> None:
+        super().__init__()
+        self.pattern = pattern
+
+    def fire(self, topic: str, value: T) -> None:
+        self._fire((topic, value), {})
+
+    __call__ = fire
+
+    def __iadd__(
+        self, subscribers: Union[Callable[[str, T], Any], Iterable[Callable[[str, T], Any]]]
+    ) -> "TopicEvent[T]":
+        """Adds given `subscriber` and returns this Event"""
+        self.append(subscribers)
+        return self
+
+    def __isub__(self, subscriber: Callable[[str, T], Any]) -> "TopicEvent[T]":
+        """Removes given `subscriber` and returns this Event"""
+        self.remove(subscriber)
+        return self
+
+    def __repr__(self) -> str:
+        return f"TopicEvent(pattern={self.pattern!r}, len={len(self)})"
+
+
+class _Node:
+    __slots__ = ("children", "event")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node] = {}
+        self.event: Optional[TopicEvent[Any]] = None
+
+
+class EventRegistry(Generic[T]):
+    """Events addressed by hierarchical topics, like "orders.eu.created" (segments
+    separated by dots). Subscribers subscribe to a topic pattern, in which "*" matches
+    any single segment and "#" any number of segments (including none); for example
+    "orders.*.created" or "orders.#".
+
+    Every pattern has a `TopicEvent` of its own. Firing a topic fires the events of all
+    matching patterns, which are looked up in a trie of the patterns (in O(topic depth)
+    for patterns without "#") and cached per topic until patterns are added; the cache
+    holds at most `cache_size` topics."""
+
+    def __init__(self, cache_size: int = 4096) -> None:
+        self._root = _Node()
+        self._events: dict[str, TopicEvent[T]] = {}
+        # topic => events of the matching patterns
+        self._cache: dict[str, tuple[TopicEvent[T], ...]] = {}
+        self._cache_size = cache_size
+
+    def event(self, pattern: str) -> TopicEvent[T]:
+        """The event of the given topic `pattern`, created when needed"""
+        event = self._events.get(pattern)
+        if event is None:
+            event = self._add(pattern)
+        return event
+
+    def subscribe(
+        self, pattern: str, subscriber: Callable[[str, T], Any], priority: int = 0
+    ) -> Callable[[], None]:
+        """Subscribes the given `subscriber` to the topics matching `pattern` and returns
+        a callable without arguments that can be used to unsubscribe it; subscribers
+        receive the topic and the value. `priority` only orders the subscribers of the
+        same pattern."""
+        return self.event(pattern).add(subscriber, priority)
+
+    def unsubscribe(self, pattern: str, subscriber: Callable[[str, T], Any]) -> None:
+        event = self._events.get(pattern)
+        if event is not None:
+            event.remove(subscriber)
+
+    def fire(self, topic: str, value: T) -> None:
+        """Fires the events of all patterns that match `topic` (without wildcards)"""
+        events = self._cache.get(topic)
+        if events is None:
+            events = self._resolve(topic)
+
+        for event in events:
+            event.fire(topic, value)
+
+    __call__ = fire
+
+    def matches(self, topic: str) -> list[str]:
+        """The patterns that match the given `topic`"""
+        events = self._cache.get(topic)
+        if events is None:
+            events = self._resolve(topic)
+        return [event.pattern for event in events]
+
+    def patterns(self) -> list[str]:
+        return list(self._events)
+
+    def _add(self, pattern: str) -> TopicEvent[T]:
+        node = self._root
+        for segment in _segments(pattern):
+            if segment != ANY_SEGMENT and segment != ANY_SEGMENTS and _is_wildcard(segment):
+                raise ValueError(f"Wildcards should be entire segments: {pattern!r}")
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = _Node()
+            node = child
+
+        event = node.event = TopicEvent[T](pattern)
+        self._events[pattern] = event
+        # the new pattern might match cached topics
+        self._cache.clear()
+        return event
+
+    def _resolve(self, topic: str) -> tuple[TopicEvent[T], ...]:
+        segments = _segments(topic)
+        if any(_is_wildcard(segment) for segment in segments):
+            raise ValueError(f"Fired topics can't contain wildcards: {topic!r}")
+
+        matched: list[TopicEvent[T]] = []
+        _match(self._root, segments, 0, matched)
+        # "#" can match the same pattern in multiple ways (events aren't hashable)
+        events = tuple({id(event): event for event in matched}.values())
+
+        cache = self._cache
+        if len(cache) >= self._cache_size:
+            # the oldest topic makes room
+            del cache[next(iter(cache))]
+        cache[topic] = events
+        return events
+
+
+def _segments(topic: str) -> list[str]:
+    segments = topic.split(SEPARATOR)
+    if not all(segments):
+        raise ValueError(f"Topics can't have empty segments: {topic!r}")
+    return segments
+
+
+def _is_wildcard(segment: str) -> bool:
+    return ANY_SEGMENT in segment or ANY_SEGMENTS in segment
+
+
+def _match(node: _Node, segments: list[str], index: int, matched: list[TopicEvent[Any]]) -> None:
+    children = node.children
+
+    any_segments = children.get(ANY_SEGMENTS)
+    if any_segments is not None:
+        # zero or more segments
+        for next_index in range(index, len(segments) + 1):
+            _match(any_segments, segments, next_index, matched)
+
+    if index == len(segments):
+        if node.event is not None:
+            matched.append(node.event)
+        return
+
+    child = children.get(segments[index])
+    if child is not None:
+        _match(child, segments, index + 1, matched)
+
+    child = children.get(ANY_SEGMENT)
+    if child is not None:
+        _match(child, segments, index + 1, matched)
@@ -0,0 +1,198 @@
+"""Serializers for values that are sent to other processes (see `mirror`)"""
+
+import pickle
+import struct
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Optional, Union
+
+
+class Serializer(ABC):
+    """Converts values to bytes and back"""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def dumps(self, value: Any) -> bytes:
+        """Returns `value` as bytes"""
+
+    @abstractmethod
+    def loads(self, data: Union[bytes, memoryview]) -> Any:
+        """Returns the value that `dumps` converted into `data`"""
+
+
+class PickleSerializer(Serializer):
+    """Serializes (almost) any value; only use it between trusted processes"""
+
+    __slots__ = ("protocol",)
+
+    def __init__(self, protocol: int = pickle.HIGHEST_PROTOCOL) -> None:
+        self.protocol = protocol
+
+    def dumps(self, value: Any) -> bytes:
+        return pickle.dumps(value, self.protocol)
+
+    def loads(self, data: Union[bytes, memoryview]) -> Any:
+        return pickle.loads(data)
+
+
+class CompactSerializer(Serializer):
+    """Serializes None, bools, ints (of up to 64 bits), floats, strings, bytes, lists,
+    tuples and dicts in the (compact, binary) msgpack format; tuples come back as lists.
+    Safe to use with untrusted data, and readable by other languages."""
+
+    __slots__ = ()
+
+    def dumps(self, value: Any) -> bytes:
+        parts: list[bytes] = []
+        _pack(value, parts.append)
+        return b"".join(parts)
+
+    def loads(self, data: Union[bytes, memoryview]) -> Any:
+        value, end = _unpack(memoryview(data), 0)
+        if end != len(data):
+            raise ValueError("Unexpected data after the value")
+        return value
+
+
+def _pack(value: Any, write: Callable[[bytes], Any]) -> None:
+    # see https://github.com/msgpack/msgpack/blob/master/spec.md
+    if value is None:
+        write(b"\xc0")
+    elif value is True:
+        write(b"\xc3")
+    elif value is False:
+        write(b"\xc2")
+    elif type(value) is int:
+        if 0 <= value < 0x80:
+            write(bytes((value,)))
+        elif -0x20 <= value < 0:
+            write(struct.pack("b", value))
+        elif 0 <= value < 1 << 64:
+            write(b"\xcf" + struct.pack(">Q", value))
+        elif -(1 << 63) <= value < 0:
+            write(b"\xd3" + struct.pack(">q", value))
+        else:
+            raise OverflowError("Integers should fit in 64 bits")
+    elif type(value) is float:
+        write(b"\xcb" + struct.pack(">d", value))
+    elif type(value) is str:
+        data = value.encode()
+        _pack_header(len(data), 0xA0, 32, b"\xd9", b"\xda", b"\xdb", write)
+        write(data)
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        data = bytes(value)
+        _pack_header(len(data), None, 0, b"\xc4", b"\xc5", b"\xc6", write)
+        write(data)
+    elif type(value) is list or type(value) is tuple:
+        _pack_header(len(value), 0x90, 16, None, b"\xdc", b"\xdd", write)
+        for item in value:
+            _pack(item, write)
+    elif type(value) is dict:
+        _pack_header(len(value), 0x80, 16, None, b"\xde", b"\xdf", write)
+        for key, item in value.items():
+            _pack(key, write)
+            _pack(item, write)
+    else:
+        raise TypeError(f"Can't serialize values of type {type(value).__name__}")
+
+
+def _pack_header(
+    length: int,
+    fix: Optional[int],
+    fix_limit: int,
+    tag8: Optional[bytes],
+    tag16: bytes,
+    tag32: bytes,
+    write: Callable[[bytes], Any],
+) -> None:
+    if fix is not None and length < fix_limit:
+        write(bytes((fix | length,)))
+    elif tag8 is not None and length < 0x100:
+        write(tag8 + bytes((length,)))
+    elif length < 0x10000:
+        write(tag16 + struct.pack(">H", length))
+    else:
+        write(tag32 + struct.pack(">I", length))
+
+
+# tag => (struct format, size) of fixed size values
+_FIXED = {
+    0xCA: (">f", 4),
+    0xCB: (">d", 8),
+    0xCC: (">B", 1),
+    0xCD: (">H", 2),
+    0xCE: (">I", 4),
+    0xCF: (">Q", 8),
+    0xD0: (">b", 1),
+    0xD1: (">h", 2),
+    0xD2: (">i", 4),
+    0xD3: (">q", 8),
+}
+
+# tag => (kind, size of the length) of values with a length
+_SIZED = {
+    0xC4: ("bin", 1),
+    0xC5: ("bin", 2),
+    0xC6: ("bin", 4),
+    0xD9: ("str", 1),
+    0xDA: ("str", 2),
+    0xDB: ("str", 4),
+    0xDC: ("array", 2),
+    0xDD: ("array", 4),
+    0xDE: ("map", 2),
+    0xDF: ("map", 4),
+}
+
+_LENGTH_FORMATS = {1: ">B", 2: ">H", 4: ">I"}
+
+
+def _unpack(data: memoryview, offset: int) -> tuple[Any, int]:
+    tag = data[offset]
+    offset += 1
+
+    if tag < 0x80:
+        return tag, offset
+    if tag >= 0xE0:
+        return tag - 0x100, offset
+    if tag == 0xC0:
+        return None, offset
+    if tag == 0xC2:
+        return False, offset
+    if tag == 0xC3:
+        return True, offset
+
+    fixed = _FIXED.get(tag)
+    if fixed is not None:
+        fmt, size = fixed
+        return struct.unpack_from(fmt, data, offset)[0], offset + size
+
+    if 0xA0 <= tag < 0xC0:
+        kind, length = "str", tag & 0x1F
+    elif 0x90 <= tag < 0xA0:
+        kind, length = "array", tag & 0x0F
+    elif 0x80 <= tag < 0x90:
+        kind, length = "map", tag & 0x0F
+    elif tag in _SIZED:
+        kind, size = _SIZED[tag]
+        length = struct.unpack_from(_LENGTH_FORMATS[size], data, offset)[0]
+        offset += size
+    else:
+        raise ValueError(f"Unsupported msgpack type 0x{tag:02x}")
+
+    if kind == "str":
+        return str(data[offset : offset + length], "utf-8"), offset + length
+    if kind == "bin":
+        return bytes(data[offset : offset + length]), offset + length
+
+    if kind == "array":
+        items = []
+        for _ in range(length):
+            item, offset = _unpack(data, offset)
+            items.append(item)
+        return items, offset
+
+    result = {}
+    for _ in range(length):
+        key, offset = _unpack(data, offset)
+        result[key], offset = _unpack(data, offset)
+    return result, offset
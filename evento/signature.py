@@ -1,31 +1,161 @@
+import weakref
+from concurrent.futures import Future
+from contextlib import aclosing, closing
+from functools import partial
 from typing import (
     Any,
+    AsyncGenerator,
     Awaitable,
     Callable,
+    Generator,
     Generic,
     Iterable,
+    Optional,
     ParamSpec,
     TypeVar,
     Union,
+    overload,
 )
 
 from .base import BaseEvent
+from .concurrency import Concurrency
+from .errors import ErrorPolicy
+from .executor import ExecutorDispatcher, combine_futures
+from .memoize import AsyncMemoCache, MemoCache, Memoize
+from .subscribers import AsyncWeakSubscriber
 
 P = ParamSpec("P")
 R = TypeVar("R")
 
 
 class SignatureEvent(Generic[P, R], BaseEvent):
-    def __init__(self, method: Callable[P, R]) -> None:
+    __slots__ = ("_method", "_instances")
+
+    def __init__(self, method: Callable[P, R], memoize: Optional[Memoize] = None) -> None:
+        """When `memoize` is given, the results of `method` are cached"""
         super().__init__()
-        self._method = method
+        self._method = method if memoize is None else MemoCache(method, memoize)
+        # id => the event of an instance, once it has subscribers
+        self._instances: Optional[dict[int, BaseEvent]] = None
+
+    @property
+    def cache(self) -> Optional[MemoCache[R]]:
+        """The cache of the original method's results, when memoizing"""
+        return self._method if isinstance(self._method, MemoCache) else None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        # used as a method, so the results are cached per instance
+        cache = self.cache
+        if cache is not None:
+            cache.per_instance = True
+
+    @overload
+    def __get__(self, instance: None, owner: Optional[type] = None) -> "SignatureEvent[P, R]":
+        ...
+
+    @overload
+    def __get__(self, instance: object, owner: Optional[type] = None) -> "SignatureEvent[..., R]":
+        ...
+
+    def __get__(self, instance: Optional[object], owner: Optional[type] = None) -> Any:
+        """Used as a method, every instance gets an event of its own. It is kept by this
+        (class level) event once it has subscribers, for as long as the instance exists
+        (which requires the instance to support weak references); until then, every
+        access returns a new event. The instance's `__dict__` is left alone.
+
+        Firing an instance's event invokes the instance's subscribers,
+        followed by this (class level) event's subscribers, which also
+        receive the instance as first argument, and then the original method."""
+        if instance is None:
+            return self
+
+        instances = self._instances
+        if instances is not None:
+            bound = instances.get(id(instance))
+            if bound is not None:
+                return bound
+        # holds the instance strongly, so calls on temporary instances work
+        return BoundSignatureEvent(self, instance)
+
+    def __set__(self, instance: object, value: Any) -> None:
+        # `instance.method += subscriber` assigns the instance's event back
+        _assign(self, instance, value)
 
     def fire(self, *args: P.args, **kwargs: P.kwargs) -> R:
-        self._fire(*args, **kwargs)
+        self._fire(args, kwargs)
         return self._method(*args, **kwargs)
 
     __call__ = fire
 
+    def fire_many(self, calls: Iterable[tuple[Any, ...]]) -> list[R]:
+        """Fires the event once for every tuple of positional arguments in `calls`,
+        with a single bookkeeping cycle for the entire batch, and returns
+        the results of the original method for every call.
+
+        Every subscriber receives all calls before the next subscriber is invoked,
+        the original method is invoked for every call after that."""
+        calls = list(calls)
+        self._fire((calls,), {}, partial(_fire_many, calls))
+        method = self._method
+        return [method(*args) for args in calls]  # type: ignore
+
+    def fire_results(self, *args: P.args, **kwargs: P.kwargs) -> Generator[Any, None, None]:
+        """Fires the event lazily; yields the result of every subscriber,
+        invoking the next subscriber only when the next result is requested.
+        The original method is not invoked.
+
+        For example `next(filter(None, e.fire_results(...)), None)` invokes
+        subscribers until one returns a truthy result."""
+        subscribers = self._snapshot
+        if subscribers is None:
+            subscribers = self._take_snapshot()
+
+        self._currentFireCount += 1
+
+        try:
+            for subscriber in subscribers:
+                if subscribers is not self._snapshot and subscriber not in self._subscribers:
+                    continue
+                yield subscriber(*args, **kwargs)
+        finally:
+            # also when the generator is closed before all subscribers were invoked
+            self._currentFireCount -= 1
+            self._fireCount += 1
+
+    def fire_first(self, *args: P.args, **kwargs: P.kwargs) -> Any:
+        """Fires the event until a subscriber returns a result other than `None`
+        and returns that result (or `None` when none did); the remaining
+        subscribers and the original method are not invoked."""
+        with closing(self.fire_results(*args, **kwargs)) as results:
+            for result in results:
+                if result is not None:
+                    return result
+        return None
+
+    def fire_intercept(self, *args: P.args, **kwargs: P.kwargs) -> R:
+        """Same as `fire_first`, but when no subscriber answered the call (with a
+        result other than `None`) the original method is invoked and its result
+        returned; subscribers can veto or answer a call, for example from a cache"""
+        result = self.fire_first(*args, **kwargs)
+        if result is not None:
+            return result  # type: ignore[no-any-return]
+        return self._method(*args, **kwargs)
+
+    def submit(
+        self, dispatcher: ExecutorDispatcher, *args: P.args, **kwargs: P.kwargs
+    ) -> Future[R]:
+        """Fires the event without blocking; the subscribers are run by the given
+        `dispatcher`. Once they are all done, the original method is invoked
+        (on the thread that completed the last subscriber) and the returned future
+        resolves to its result."""
+        subscribers = self._snapshot
+        if subscribers is None:
+            subscribers = self._take_snapshot()
+
+        self._fireCount += 1
+        futures = dispatcher.submit_each(subscribers, *args, **kwargs)
+        return combine_futures(futures, lambda: self._method(*args, **kwargs))
+
     def __iadd__(
         self, subscribers: Union[Callable[P, Any], Iterable[Callable[P, Any]]]
     ) -> "SignatureEvent[P, R]":
@@ -35,34 +165,211 @@ class SignatureEvent(Generic[P, R], BaseEvent):
 
     def __isub__(self, subscriber: Callable[P, Any]) -> "SignatureEvent[P, R]":
         """Removes given `subscriber` and returns this Event"""
-        # only modify self if we're not currently firing
-        # otherwise queue the unsubscription for processing after firing is done
         self.remove(subscriber)
         return self
 
-    def append(self, subscribers: Union[Callable[P, Any], Iterable[Callable[P, Any]]]) -> None:
-        super().append(subscribers)
+    def append(
+        self, subscribers: Union[Callable[P, Any], Iterable[Callable[P, Any]]], priority: int = 0
+    ) -> None:
+        super().append(subscribers, priority)
 
     def remove(self, subscriber: Callable[P, Any]) -> None:
         super().remove(subscriber)
 
-    def add(self, subscriber: Callable[P, Any]) -> Callable[[], Any]:
-        return super().add(subscriber)
+    def add(self, subscriber: Callable[P, Any], priority: int = 0) -> Callable[[], Any]:
+        return super().add(subscriber, priority)
+
+    def append_weak(self, subscriber: Callable[P, Any], priority: int = 0) -> None:
+        super().append_weak(subscriber, priority)
+
+    def add_weak(self, subscriber: Callable[P, Any], priority: int = 0) -> Callable[[], Any]:
+        return super().add_weak(subscriber, priority)
+
+
+class BoundSignatureEvent(SignatureEvent[P, R]):
+    """The event of a single instance, for a `SignatureEvent` used as method"""
+
+    __slots__ = ("_class_event",)
+
+    _method: "_BoundMethod"
+
+    def __init__(self, class_event: SignatureEvent[..., R], instance: object) -> None:
+        # created by every access on an instance without subscribers,
+        # so only the base class is initialized (not SignatureEvent)
+        BaseEvent.__init__(self)
+        self._method = _BoundMethod(class_event, instance)
+        self._instances = None
+        self._class_event = class_event
+
+    @property
+    def _instance(self) -> object:
+        return self._method.instance
+
+    def append(
+        self, subscribers: Union[Callable[P, Any], Iterable[Callable[P, Any]]], priority: int = 0
+    ) -> None:
+        if self._method.ref is None:
+            bound = _cache(self)
+            if bound is not self:
+                bound.append(subscribers, priority)
+                return
+        super().append(subscribers, priority)
+
+    @property
+    def cache(self) -> Optional[MemoCache[R]]:
+        # shared by all instances, keyed by the instance and the other arguments
+        return self._class_event.cache
+
+    @property
+    def error_policy(self) -> Optional[ErrorPolicy]:
+        # the class level event's policy, unless the instance's event has one of its own
+        return super().error_policy or self._class_event.error_policy
+
+    @error_policy.setter
+    def error_policy(self, policy: Optional[ErrorPolicy]) -> None:
+        self._get_extras().error_policy = policy
+
+    def fire(self, *args: P.args, **kwargs: P.kwargs) -> R:
+        # same as SignatureEvent.fire, skipping the class level event's fire
+        # when it has no subscribers; calling unobserved methods is common
+        self._fire(args, kwargs)
+        class_event = self._class_event
+        if class_event._subscribers:
+            return class_event.fire(self._method.instance, *args, **kwargs)
+        return class_event._method(self._method.instance, *args, **kwargs)
+
+    __call__ = fire
+
+    def fire_results(self, *args: P.args, **kwargs: P.kwargs) -> Generator[Any, None, None]:
+        # the class level event's subscribers come after this event's subscribers
+        yield from super().fire_results(*args, **kwargs)
+        yield from self._class_event.fire_results(self._instance, *args, **kwargs)
+
+    def fire_intercept(self, *args: P.args, **kwargs: P.kwargs) -> R:
+        result = self.fire_first(*args, **kwargs)
+        if result is not None:
+            return result  # type: ignore[no-any-return]
+        return self._class_event._method(self._instance, *args, **kwargs)
 
 
 class AsyncSignatureEvent(Generic[P, R], BaseEvent):
-    def __init__(self, method: Callable[P, Awaitable[R]]) -> None:
+    __slots__ = ("_method", "_concurrency", "_instances")
+
+    _weak_subscriber_type = AsyncWeakSubscriber
+
+    def __init__(
+        self,
+        method: Callable[P, Awaitable[R]],
+        concurrency: Optional[Concurrency] = None,
+        memoize: Optional[Memoize] = None,
+    ) -> None:
+        """When `concurrency` is given, every fire runs the subscribers concurrently;
+        when `memoize` is given, the (awaited) results of `method` are cached"""
         super().__init__()
-        self._method = method
+        self._method = method if memoize is None else AsyncMemoCache(method, memoize)
+        self._concurrency = concurrency
+        # see SignatureEvent
+        self._instances: Optional[dict[int, BaseEvent]] = None
 
-    async def fire(self, *args: P.args, **kwargs: P.kwargs) -> R:
-        for subscriber in self._iter():
-            await subscriber(*args, **kwargs)
+    @property
+    def cache(self) -> Optional[AsyncMemoCache[R]]:
+        """The cache of the original method's results, when memoizing"""
+        return self._method if isinstance(self._method, AsyncMemoCache) else None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        cache = self.cache
+        if cache is not None:
+            cache.per_instance = True
+
+    @overload
+    def __get__(self, instance: None, owner: Optional[type] = None) -> "AsyncSignatureEvent[P, R]":
+        ...
+
+    @overload
+    def __get__(
+        self, instance: object, owner: Optional[type] = None
+    ) -> "AsyncSignatureEvent[..., R]":
+        ...
+
+    def __get__(self, instance: Optional[object], owner: Optional[type] = None) -> Any:
+        """Used as a method, every instance gets an event of its own;
+        see `SignatureEvent.__get__`"""
+        if instance is None:
+            return self
 
+        instances = self._instances
+        if instances is not None:
+            bound = instances.get(id(instance))
+            if bound is not None:
+                return bound
+        return BoundAsyncSignatureEvent(self, instance)
+
+    def __set__(self, instance: object, value: Any) -> None:
+        _assign(self, instance, value)
+
+    async def fire(self, *args: P.args, **kwargs: P.kwargs) -> R:
+        await self._fire_async(args, kwargs, None, self._concurrency)
         return await self._method(*args, **kwargs)
 
     __call__ = fire
 
+    async def fire_many(self, calls: Iterable[tuple[Any, ...]]) -> list[R]:
+        """Fires the event once for every tuple of positional arguments in `calls`,
+        with a single bookkeeping cycle for the entire batch, and returns
+        the results of the original method for every call.
+
+        Every subscriber receives all calls before the next subscriber is awaited,
+        the original method is awaited for every call after that."""
+        calls = list(calls)
+        await self._fire_async((calls,), {}, partial(_fire_many_async, calls))
+        method = self._method
+        return [await method(*args) for args in calls]  # type: ignore
+
+    async def fire_concurrent(self, *args: P.args, **kwargs: P.kwargs) -> R:
+        """Fires the event, running all subscribers concurrently using the event's
+        concurrency options (or unlimited concurrency without a timeout)"""
+        await self._fire_async(args, kwargs, None, self._concurrency or Concurrency())
+        return await self._method(*args, **kwargs)
+
+    async def fire_results(self, *args: P.args, **kwargs: P.kwargs) -> AsyncGenerator[Any, None]:
+        """Fires the event lazily; yields the result of every subscriber, awaiting the
+        next subscriber only when the next result is requested (regardless of the
+        event's concurrency options). The original method is not awaited."""
+        subscribers = self._snapshot
+        if subscribers is None:
+            subscribers = self._take_snapshot()
+
+        self._currentFireCount += 1
+
+        try:
+            for subscriber in subscribers:
+                if subscribers is not self._snapshot and subscriber not in self._subscribers:
+                    continue
+                yield await subscriber(*args, **kwargs)
+        finally:
+            # also when the generator is closed before all subscribers were awaited
+            self._currentFireCount -= 1
+            self._fireCount += 1
+
+    async def fire_first(self, *args: P.args, **kwargs: P.kwargs) -> Any:
+        """Awaits the subscribers one by one until one returns a result other than
+        `None` and returns that result (or `None` when none did); the remaining
+        subscribers and the original method are not awaited."""
+        async with aclosing(self.fire_results(*args, **kwargs)) as results:
+            async for result in results:
+                if result is not None:
+                    return result
+        return None
+
+    async def fire_intercept(self, *args: P.args, **kwargs: P.kwargs) -> R:
+        """Same as `fire_first`, but when no subscriber answered the call (with a
+        result other than `None`) the original method is awaited and its result
+        returned; see `SignatureEvent.fire_intercept`"""
+        result = await self.fire_first(*args, **kwargs)
+        if result is not None:
+            return result  # type: ignore[no-any-return]
+        return await self._method(*args, **kwargs)
+
     def __iadd__(
         self, subscribers: Union[Callable[P, Awaitable[Any]], Iterable[Callable[P, Awaitable[Any]]]]
     ) -> "AsyncSignatureEvent[P, R]":
@@ -72,18 +379,176 @@ class AsyncSignatureEvent(Generic[P, R], BaseEvent):
 
     def __isub__(self, subscriber: Callable[P, Awaitable[Any]]) -> "AsyncSignatureEvent[P, R]":
         """Removes given `subscriber` and returns this Event"""
-        # only modify self if we're not currently firing
-        # otherwise queue the unsubscription for processing after firing is done
         self.remove(subscriber)
         return self
 
     def append(
-        self, subscribers: Union[Callable[P, Awaitable[Any]], Iterable[Callable[P, Awaitable[Any]]]]
+        self,
+        subscribers: Union[Callable[P, Awaitable[Any]], Iterable[Callable[P, Awaitable[Any]]]],
+        priority: int = 0,
     ) -> None:
-        super().append(subscribers)
+        super().append(subscribers, priority)
 
     def remove(self, subscriber: Callable[P, Awaitable[Any]]) -> None:
         super().remove(subscriber)
 
-    def add(self, subscriber: Callable[P, Awaitable[Any]]) -> Callable[[], Any]:
-        return super().add(subscriber)
+    def add(self, subscriber: Callable[P, Awaitable[Any]], priority: int = 0) -> Callable[[], Any]:
+        return super().add(subscriber, priority)
+
+    def append_weak(self, subscriber: Callable[P, Awaitable[Any]], priority: int = 0) -> None:
+        super().append_weak(subscriber, priority)
+
+    def add_weak(
+        self, subscriber: Callable[P, Awaitable[Any]], priority: int = 0
+    ) -> Callable[[], Any]:
+        return super().add_weak(subscriber, priority)
+
+
+class BoundAsyncSignatureEvent(AsyncSignatureEvent[P, R]):
+    """The event of a single instance, for an `AsyncSignatureEvent` used as method"""
+
+    __slots__ = ("_class_event",)
+
+    _method: "_BoundMethod"
+
+    def __init__(self, class_event: AsyncSignatureEvent[..., R], instance: object) -> None:
+        # see BoundSignatureEvent
+        BaseEvent.__init__(self)
+        self._method = _BoundMethod(class_event, instance)
+        self._concurrency = class_event._concurrency
+        self._instances = None
+        self._class_event = class_event
+
+    @property
+    def _instance(self) -> object:
+        return self._method.instance
+
+    def append(
+        self,
+        subscribers: Union[Callable[P, Awaitable[Any]], Iterable[Callable[P, Awaitable[Any]]]],
+        priority: int = 0,
+    ) -> None:
+        if self._method.ref is None:
+            bound = _cache(self)
+            if bound is not self:
+                bound.append(subscribers, priority)
+                return
+        super().append(subscribers, priority)
+
+    @property
+    def cache(self) -> Optional[AsyncMemoCache[R]]:
+        # shared by all instances, keyed by the instance and the other arguments
+        return self._class_event.cache
+
+    @property
+    def error_policy(self) -> Optional[ErrorPolicy]:
+        # the class level event's policy, unless the instance's event has one of its own
+        return super().error_policy or self._class_event.error_policy
+
+    @error_policy.setter
+    def error_policy(self, policy: Optional[ErrorPolicy]) -> None:
+        self._get_extras().error_policy = policy
+
+    async def fire_results(self, *args: P.args, **kwargs: P.kwargs) -> AsyncGenerator[Any, None]:
+        # the class level event's subscribers come after this event's subscribers
+        async with aclosing(super().fire_results(*args, **kwargs)) as results:
+            async for result in results:
+                yield result
+        class_results = self._class_event.fire_results(self._instance, *args, **kwargs)
+        async with aclosing(class_results) as results:
+            async for result in results:
+                yield result
+
+    async def fire_intercept(self, *args: P.args, **kwargs: P.kwargs) -> R:
+        result = await self.fire_first(*args, **kwargs)
+        if result is not None:
+            return result  # type: ignore[no-any-return]
+        return await self._class_event._method(self._instance, *args, **kwargs)
+
+
+def _fire_many(calls: list[tuple[Any, ...]], subscriber: Callable[..., Any]) -> None:
+    # the subscriber's part of SignatureEvent.fire_many
+    for args in calls:
+        subscriber(*args)
+
+
+async def _fire_many_async(
+    calls: list[tuple[Any, ...]], subscriber: Callable[..., Awaitable[Any]]
+) -> None:
+    # the subscriber's part of AsyncSignatureEvent.fire_many
+    for args in calls:
+        await subscriber(*args)
+
+
+Bound = Union[BoundSignatureEvent[..., Any], BoundAsyncSignatureEvent[..., Any]]
+
+
+class _BoundMethod:
+    """The original method of an instance's event: the class level event's fire,
+    with the instance as first argument; the instance is referenced weakly once
+    its event is kept by the class level event, see `_cache`"""
+
+    __slots__ = ("event", "strong", "ref")
+
+    def __init__(self, event: Callable[..., Any], instance: object) -> None:
+        self.event = event
+        self.strong: Optional[object] = instance
+        self.ref: Optional[weakref.ref[object]] = None
+
+    @property
+    def instance(self) -> Any:
+        ref = self.ref
+        if ref is None:
+            return self.strong
+        instance = ref()
+        if instance is None:
+            raise ReferenceError("The instance of the event no longer exists")
+        return instance
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.event(self.instance, *args, **kwargs)
+
+
+def _assign(
+    event: Union[SignatureEvent[..., Any], AsyncSignatureEvent[..., Any]],
+    instance: object,
+    value: Any,
+) -> None:
+    if getattr(value, "_class_event", None) is event and value._instance is instance:
+        return
+    raise AttributeError("Can't replace the event of an instance")
+
+
+def _cache(bound: Bound) -> Bound:
+    # keeps the event of an instance (by its class level event), for as long as
+    # the instance exists; returns the event that was kept before, if any
+    event = bound._class_event
+    instance = bound._instance
+    instances = event._instances
+    if instances is None:
+        instances = event._instances = {}
+
+    key = id(instance)
+    kept = instances.get(key)
+    if kept is not None:
+        return kept  # type: ignore[return-value]
+    try:
+        ref = weakref.ref(instance, partial(_forget, instances, key))
+    except TypeError:
+        raise TypeError(
+            f"Can't subscribe to the event of a {type(instance).__name__} instance;"
+            " its class needs a __weakref__ slot"
+        ) from None
+
+    method = bound._method
+    method.ref = ref
+    method.strong = None
+    instances[key] = bound
+    return bound
+
+
+def _forget(instances: dict[int, BaseEvent], key: int, ref: "weakref.ref[object]") -> None:
+    # removes the event of an instance that no longer exists
+    bound = instances.get(key)
+    if bound is not None and bound._method.ref is ref:  # type: ignore[attr-defined]
+        del instances[key]
@@ -0,0 +1,103 @@
+from typing import Any, Callable, Hashable, Iterable, Optional, TypeVar, Union
+
+from .event import Event
+from .subscribers import BatchSubscriber
+
+T = TypeVar("T")
+
+
+class StickyEvent(Event[T]):
+    """Event that retains its last `retain` fired values (in a ring buffer) and
+    delivers them to subscribers when they're added, oldest first; so subscribers
+    that are added late get the current state without asking the producer for it.
+
+    Retaining a value costs a store in a preallocated ring slot per fire."""
+
+    __slots__ = ("_ring", "_count")
+
+    def __init__(self, retain: int = 1) -> None:
+        super().__init__()
+        if retain < 1:
+            raise ValueError("retain should be at least 1")
+        self._ring: list[Any] = [None] * retain
+        # the number of values stored in the ring, the next one goes in slot count % retain
+        self._count = 0
+
+    @property
+    def retain(self) -> int:
+        return len(self._ring)
+
+    @property
+    def retained(self) -> list[T]:
+        """The retained values, oldest first"""
+        ring = self._ring
+        count = self._count
+        if count <= len(ring):
+            return ring[:count]
+        index = count % len(ring)
+        return ring[index:] + ring[:index]
+
+    def clear(self) -> None:
+        """Forgets the retained values"""
+        self._ring = [None] * len(self._ring)
+        self._count = 0
+
+    def fire(self, value: T) -> None:
+        ring = self._ring
+        ring[self._count % len(ring)] = value
+        self._count += 1
+        self._fire((value,), {})
+
+    __call__ = fire
+
+    def fire_many(self, values: Iterable[T]) -> None:
+        if iter(values) is values:
+            values = list(values)
+
+        ring = self._ring
+        size = len(ring)
+        count = self._count
+        for value in values:
+            ring[count % size] = value
+            count += 1
+        self._count = count
+        super().fire_many(values)
+
+    def append(
+        self,
+        subscribers: Union[Callable[[T], Any], Iterable[Callable[[T], Any]]],
+        priority: int = 0,
+        *,
+        key: Optional[Callable[[T], Hashable]] = None,
+        match: Hashable = None,
+        where: Optional[Callable[[T], bool]] = None,
+        replay: bool = True,
+    ) -> None:
+        """Adds the given subscriber(s), see `Event.append`, and invokes the subscribers
+        that weren't added yet with the retained values (that satisfy `key`/`match` and
+        `where`) unless `replay` is False. Batch subscribers receive them as one batch."""
+        if not replay or not self._count:
+            super().append(subscribers, priority, key=key, match=match, where=where)
+            return
+
+        if callable(subscribers):
+            subscribers = [subscribers]
+        else:
+            subscribers = list(subscribers)
+        added = [subscriber for subscriber in subscribers if subscriber not in self]
+        super().append(subscribers, priority, key=key, match=match, where=where)
+
+        values = self.retained
+        if where is not None:
+            values = [value for value in values if where(value)]
+        if key is not None:
+            values = [value for value in values if key(value) == match]
+        if not values:
+            return
+
+        for subscriber in added:
+            if type(subscriber) is BatchSubscriber:
+                subscriber.subscriber(values)
+                continue
+            for value in values:
+                subscriber(value)
@@ -0,0 +1,288 @@
+import asyncio
+import weakref
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Generic,
+    Literal,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+from .subscribers import AsyncWeakSubscriber, BatchSubscriber, _done
+
+if TYPE_CHECKING:
+    from .async_event import AsyncEvent
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+# what a fire does when the buffer of a stream is full, see `Stream`
+StreamPolicy = Literal["block", "drop_newest", "drop_oldest"]
+
+_POLICIES = ("block", "drop_newest", "drop_oldest")
+
+# returned by the stages for values that are filtered out
+_SKIP: Any = object()
+
+
+class Stream(Generic[T]):
+    """Async iterator over the values fired by an `AsyncEvent`, see `AsyncEvent.stream`.
+
+    Fires put the values in a buffer (of `maxsize` values) that the iteration takes
+    them from. When the buffer is full, `policy` decides what happens to a new value:
+    - "block": the fire waits for room
+    - "drop_newest": the new value is dropped
+    - "drop_oldest": the oldest buffered value is dropped to make room
+
+    `map` and `filter` add stages that are applied to the values when they're taken
+    from the buffer, inline (without creating tasks).
+
+    The stream unsubscribes when it's closed (`aclose`, leaving `async with`, or
+    the iterating task getting cancelled); closing drops the buffered values.
+    The event only references the stream weakly, so a stream that is abandoned
+    (e.g. by breaking out of the iteration) unsubscribes once it's garbage collected."""
+
+    __slots__ = (
+        "maxsize",
+        "policy",
+        "dropped",
+        "_buffer",
+        "_stages",
+        "_unsubscribe",
+        "_closed",
+        "_waiter",
+        "_room",
+        "__weakref__",
+    )
+
+    def __init__(
+        self, event: "AsyncEvent[T]", maxsize: int = 1024, policy: StreamPolicy = "block"
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize should be at least 1")
+        if policy not in _POLICIES:
+            raise ValueError(f"policy should be one of {', '.join(_POLICIES)}")
+        self.maxsize = maxsize
+        self.policy = policy
+        # the number of values that were dropped because the buffer was full
+        self.dropped = 0
+        self._buffer: deque[Any] = deque()
+        self._stages: list[tuple[bool, Callable[[Any], Any]]] = []
+        self._closed = False
+        # awaited by the iteration when the buffer is empty
+        self._waiter: Optional[asyncio.Future[None]] = None
+        # awaited by fires when the buffer is full (and the policy is "block")
+        self._room: Optional[asyncio.Future[None]] = None
+        # as a (weak) batch subscriber, so fire_many buffers all of its values in one call
+        receiver = event._weak(self, _Receiver)  # type: ignore[arg-type]
+        self._unsubscribe = event.add(BatchSubscriber(receiver))
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def __len__(self) -> int:
+        """The number of buffered values"""
+        return len(self._buffer)
+
+    async def _receive(self, values: Sequence[T]) -> None:
+        buffer = self._buffer
+        maxsize = self.maxsize
+        for value in values:
+            if len(buffer) >= maxsize:
+                if self.policy == "drop_newest":
+                    self.dropped += 1
+                    continue
+                if self.policy == "drop_oldest":
+                    buffer.popleft()
+                    self.dropped += 1
+                else:
+                    self._wake()
+                    while len(buffer) >= maxsize and not self._closed:
+                        room = self._room
+                        if room is None or room.done():
+                            room = self._room = asyncio.get_running_loop().create_future()
+                        await room
+                    if self._closed:
+                        return
+            buffer.append(value)
+        self._wake()
+
+    def _wake(self) -> None:
+        # wakes the iteration waiting for values
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def _make_room(self) -> None:
+        # wakes the fires waiting for room
+        room = self._room
+        if room is not None and not room.done():
+            room.set_result(None)
+
+    async def _wait(self, timeout: Optional[float] = None) -> bool:
+        """Waits (up to `timeout` seconds) until there are buffered values;
+        returns False when there aren't, because it timed out or the stream is closed"""
+        loop = asyncio.get_running_loop()
+        while not self._buffer:
+            if self._closed:
+                return False
+            waiter = self._waiter = loop.create_future()
+            timer = None if timeout is None else loop.call_later(timeout, _resolve, waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                self.close()
+                raise
+            finally:
+                self._waiter = None
+                if timer is not None:
+                    timer.cancel()
+            if timeout is not None:
+                break
+        return bool(self._buffer)
+
+    def _apply(self, value: Any) -> Any:
+        for is_filter, function in self._stages:
+            if is_filter:
+                if not function(value):
+                    return _SKIP
+            else:
+                value = function(value)
+        return value
+
+    def __aiter__(self) -> "Stream[T]":
+        return self
+
+    async def __anext__(self) -> T:
+        buffer = self._buffer
+        while True:
+            if not buffer and not await self._wait():
+                raise StopAsyncIteration
+            value = buffer.popleft()
+            self._make_room()
+            if self._stages:
+                value = self._apply(value)
+                if value is _SKIP:
+                    continue
+            return value  # type: ignore[no-any-return]
+
+    def map(self, function: Callable[[T], U]) -> "Stream[U]":
+        """Adds a stage that replaces the values by the result of `function`;
+        returns this stream"""
+        self._stages.append((False, function))
+        return self  # type: ignore[return-value]
+
+    def filter(self, predicate: Callable[[T], bool]) -> "Stream[T]":
+        """Adds a stage that skips the values for which `predicate` returns False;
+        returns this stream"""
+        self._stages.append((True, predicate))
+        return self
+
+    def batches(self, size: int, timeout: Optional[float] = 0.0) -> AsyncIterator[list[T]]:
+        """Returns an async iterator over lists of (up to `size`) values: once the buffer
+        runs out, a list that isn't full waits up to `timeout` seconds for more values
+        (None waits until it's full). Values are taken from the buffer all at once."""
+        if size < 1:
+            raise ValueError("size should be at least 1")
+        return _Batches(self, size, timeout)
+
+    async def _next_batch(self, size: int, timeout: Optional[float]) -> list[T]:
+        batch: list[T] = []
+        deadline = None
+        buffer = self._buffer
+        while len(batch) < size:
+            if not buffer:
+                if not batch or timeout is None:
+                    if not await self._wait():
+                        break
+                    continue
+                loop = asyncio.get_running_loop()
+                if deadline is None:
+                    deadline = loop.time() + timeout
+                remaining = deadline - loop.time()
+                if remaining <= 0 or not await self._wait(remaining):
+                    break
+                continue
+
+            if self._stages:
+                apply = self._apply
+                while buffer and len(batch) < size:
+                    value = apply(buffer.popleft())
+                    if value is not _SKIP:
+                        batch.append(value)
+            else:
+                count = min(size - len(batch), len(buffer))
+                batch.extend(buffer.popleft() for _ in range(count))
+            self._make_room()
+        if not batch:
+            raise StopAsyncIteration
+        return batch
+
+    def close(self) -> None:
+        """Unsubscribes, drops the buffered values and ends the iteration"""
+        if self._closed:
+            return
+        self._closed = True
+        self._unsubscribe()
+        self._buffer.clear()
+        self._wake()
+        self._make_room()
+
+    async def aclose(self) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "Stream[T]":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"Stream(buffered={len(self._buffer)}, dropped={self.dropped})"
+
+
+def _resolve(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class _Receiver(AsyncWeakSubscriber):
+    """Subscribed by a `Stream` (as batch subscriber); references it weakly"""
+
+    __slots__ = ()
+
+    def __init__(self, stream: Stream[Any], on_dead: Callable[[], Any]) -> None:
+        self._hash = id(stream)
+        self.ref = weakref.ref(stream, lambda _: on_dead())  # type: ignore[arg-type]
+
+    def __call__(self, values: Sequence[Any]) -> Any:
+        stream: Optional[Stream[Any]] = self.ref()  # type: ignore[assignment]
+        if stream is None:
+            return _done()
+        return stream._receive(values)
+
+
+class _Batches(Generic[T]):
+    """The async iterator returned by `Stream.batches`"""
+
+    __slots__ = ("stream", "size", "timeout")
+
+    def __init__(self, stream: Stream[T], size: int, timeout: Optional[float]) -> None:
+        self.stream = stream
+        self.size = size
+        self.timeout = timeout
+
+    def __aiter__(self) -> "_Batches[T]":
+        return self
+
+    async def __anext__(self) -> list[T]:
+        return await self.stream._next_batch(self.size, self.timeout)
+
+    async def aclose(self) -> None:
+        self.stream.close()
@@ -0,0 +1,100 @@
+import weakref
+from types import MethodType
+from typing import Any, Callable, Optional
+
+
+class SubscriberWrapper:
+    """Base class for objects that are subscribed in place of a subscriber,
+    to change how the subscriber gets invoked.
+
+    A wrapper is equal to (and hashes the same as) the subscriber it wraps,
+    so the subscriber can still be found, and removed, by itself."""
+
+    __slots__ = ("subscriber",)
+
+    def __init__(self, subscriber: Callable[..., Any]) -> None:
+        self.subscriber = subscriber
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.subscriber(*args, **kwargs)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, SubscriberWrapper):
+            other = other.subscriber
+        return bool(self.subscriber == other)
+
+    def __hash__(self) -> int:
+        return hash(self.subscriber)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.subscriber!r})"
+
+
+class BatchSubscriber(SubscriberWrapper):
+    """Wraps a subscriber that takes a sequence of values instead of a single value.
+
+    It receives the entire batch of `fire_many` in a single call,
+    and a single item sequence for every normal fire."""
+
+    __slots__ = ()
+
+    def __call__(self, value: Any) -> Any:
+        return self.subscriber((value,))
+
+
+class WeakSubscriber(SubscriberWrapper):
+    """Wraps a subscriber using a weak reference, so subscribing doesn't keep
+    the subscriber (or, for bound methods, its object) alive.
+
+    `on_dead` is invoked when the subscriber got garbage collected,
+    calling a dead weak subscriber does nothing."""
+
+    __slots__ = ("ref", "_hash")
+
+    def __init__(self, subscriber: Callable[..., Any], on_dead: Callable[[], Any]) -> None:
+        # the hash of the subscriber is needed to find this wrapper after the subscriber is gone
+        self._hash = hash(subscriber)
+        ref_type = weakref.WeakMethod if isinstance(subscriber, MethodType) else weakref.ref
+        self.ref: weakref.ref[Callable[..., Any]] = ref_type(subscriber, lambda _: on_dead())
+
+    @property
+    def subscriber(self) -> Optional[Callable[..., Any]]:  # type: ignore[override]
+        return self.ref()
+
+    @property
+    def dead(self) -> bool:
+        return self.ref() is None
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        subscriber = self.ref()
+        if subscriber is not None:
+            return subscriber(*args, **kwargs)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, WeakSubscriber):
+            return self.ref == other.ref
+
+        subscriber = self.ref()
+        if isinstance(other, SubscriberWrapper):
+            other = other.subscriber
+        return subscriber is not None and bool(subscriber == other)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+
+class AsyncWeakSubscriber(WeakSubscriber):
+    """WeakSubscriber for async events; calling it after the subscriber
+    got garbage collected returns an awaitable that does nothing."""
+
+    __slots__ = ()
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        subscriber = self.ref()
+        if subscriber is None:
+            return _done()
+        return subscriber(*args, **kwargs)
+
+
+async def _done() -> None:
+    pass
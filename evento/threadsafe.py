@@ -0,0 +1,69 @@
+import threading
+from typing import Any, Callable, Iterable, Optional, TypeVar, Union
+
+from .base import BaseEvent
+from .event import Event
+
+T = TypeVar("T")
+
+
+class ThreadSafeBaseEvent(BaseEvent):
+    """BaseEvent that can be fired, subscribed to and unsubscribed from concurrently
+    by multiple threads.
+
+    Fires don't take any lock; they iterate the immutable subscribers snapshot.
+    Only subscribing, unsubscribing and rebuilding the snapshot (which happens on
+    the first fire after the subscribers changed) are serialized by a lock.
+
+    `is_firing` tells if the *current thread* is firing the event
+    and `_fireCount` is not exact for concurrent fires."""
+
+    __slots__ = ("_lock", "_local")
+
+    @property
+    def is_firing(self) -> bool:
+        return getattr(self._local, "depth", 0) > 0
+
+    def __init__(self) -> None:
+        super().__init__()
+        # reentrant, because unsubscribing can be triggered by garbage collection
+        # (of weakly referenced subscribers) while the lock is held
+        self._lock = threading.RLock()
+        self._local = threading.local()
+
+    def _fire(
+        self,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        call: Optional[Callable[[Callable[..., Any]], Any]] = None,
+    ) -> None:
+        local = self._local
+        local.depth = getattr(local, "depth", 0) + 1
+        try:
+            super()._fire(args, kwargs, call)
+        finally:
+            local.depth -= 1
+
+    def append(
+        self,
+        subscribers: Union[Callable[..., Any], Iterable[Callable[..., Any]]],
+        priority: int = 0,
+        **options: Any,
+    ) -> None:
+        # options of subclasses, like the keys of `Event.append`
+        with self._lock:
+            super().append(subscribers, priority, **options)
+
+    def remove(self, subscriber: Callable[..., Any]) -> None:
+        with self._lock:
+            super().remove(subscriber)
+
+    def _take_snapshot(self) -> tuple[Callable[..., Any], ...]:
+        with self._lock:
+            return super()._take_snapshot()
+
+
+class ThreadSafeEvent(ThreadSafeBaseEvent, Event[T]):
+    """Thread-safe version of `Event`, see `ThreadSafeBaseEvent`"""
+
+    __slots__ = ()
@@ -0,0 +1,560 @@
+"""Transports that deliver messages (bytes) between processes on the same host, see `mirror`"""
+
+import os
+import random
+import socket
+import struct
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from time import monotonic, sleep
+from typing import Any, Literal, Optional
+
+TransportKind = Literal["auto", "shared_memory", "socket"]
+
+
+class Transport(ABC):
+    """Delivers the messages sent through it to all other transports
+    of the same channel, in the same or in other processes.
+
+    Transports of a channel share files (like locks and sockets) in `directory`,
+    by default the "evento" directory in the temporary directory."""
+
+    __slots__ = ("channel", "directory")
+
+    def __init__(self, channel: str, directory: Optional[str] = None) -> None:
+        if not channel or not channel.replace("-", "").replace("_", "").isalnum():
+            raise ValueError("Channel names should consist of letters, digits, - and _")
+        self.channel = channel
+        self.directory = directory or os.path.join(tempfile.gettempdir(), "evento")
+
+    @abstractmethod
+    def send(self, message: bytes) -> None:
+        """Delivers `message` to the other transports of the channel"""
+
+    @abstractmethod
+    def receive(self, timeout: float) -> list[bytes]:
+        """Returns the messages sent by other transports; waits up to
+        `timeout` seconds for the first one, returns [] when there are none"""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Releases the resources of the transport"""
+
+
+def open_transport(
+    channel: str, kind: TransportKind = "auto", directory: Optional[str] = None
+) -> Transport:
+    """Opens a transport of the given kind; "auto" uses shared memory
+    and falls back to unix sockets when shared memory isn't available"""
+    if kind == "shared_memory":
+        return SharedMemoryTransport(channel, directory=directory)
+    if kind == "socket":
+        return UnixSocketTransport(channel, directory=directory)
+    if kind != "auto":
+        raise ValueError("kind should be one of auto, shared_memory, socket")
+
+    try:
+        return SharedMemoryTransport(channel, directory=directory)
+    except (ImportError, OSError):
+        return UnixSocketTransport(channel, directory=directory)
+
+
+def _sender_id() -> int:
+    # identifies a transport, so receivers can skip their own messages
+    return random.getrandbits(32)
+
+
+# the shared memory starts with the position up to which messages are written
+# and the position up to which the memory is being (over)written, followed by
+# the slots of the readers and the ring of messages. Positions only increase,
+# `position % capacity` is the offset in the ring. Every message starts with a
+# header: its position (so a reader can tell it apart from an older message at
+# the same offset), its length and its sender.
+_POSITION = struct.Struct("<Q")
+_RESERVED_OFFSET = 8
+# a reader's position and sender; writers wait for readers to make room
+_READER = struct.Struct("<QI4x")
+_READERS_OFFSET = 64
+_READERS = 64
+_HEADER = struct.Struct("<QII")
+_DATA_OFFSET = _READERS_OFFSET + _READERS * _READER.size
+# the header length of the unused space at the end of the ring
+_WRAP = 0xFFFFFFFF
+# the position of readers that writers no longer wait for
+_EVICTED = 0xFFFFFFFFFFFFFFFF
+
+
+def _align(size: int) -> int:
+    return (size + 15) & ~15
+
+
+class SharedMemoryTransport(Transport):
+    """Transport that writes messages to a ring buffer in shared memory, which every
+    transport of the channel reads. Readers poll for new messages, backing off up to
+    `poll_interval` seconds while there are none.
+
+    Sends wait for (up to 64) readers that didn't read the messages that would be
+    overwritten, up to `send_timeout` seconds; after that the writers stop waiting
+    for the reader (which is gone or stuck) until it reads again. A reader that falls
+    more than `capacity` bytes behind skips to the newest message (and counts an
+    `overrun`). The shared memory (and the lock file of the channel) outlive the
+    processes, `unlink` removes them."""
+
+    __slots__ = (
+        "_memory",
+        "_buffer",
+        "_capacity",
+        "_lock_file",
+        "_lock",
+        "_sender",
+        "_position",
+        "_read_lock",
+        "_slot",
+        "_slowest",
+        "_backlog",
+        "poll_interval",
+        "send_timeout",
+        "overruns",
+        "evictions",
+    )
+
+    def __init__(
+        self,
+        channel: str,
+        capacity: int = 16 << 20,
+        poll_interval: float = 0.001,
+        send_timeout: float = 1.0,
+        directory: Optional[str] = None,
+    ) -> None:
+        super().__init__(channel, directory)
+        # imported here, because they aren't available on every platform
+        import fcntl
+        from multiprocessing import resource_tracker, shared_memory
+
+        # writers (of all processes) lock this file, and (as flock
+        # doesn't exclude threads that share the file) a thread lock
+        os.makedirs(self.directory, exist_ok=True)
+        self._lock_file = os.open(self._lock_path(), os.O_RDWR | os.O_CREAT, 0o600)
+        self._lock = _FileLock(threading.Lock(), self._lock_file, fcntl)
+        try:
+            with self._lock:
+                name = f"evento-{channel}"
+                try:
+                    memory = shared_memory.SharedMemory(
+                        name, create=True, size=_DATA_OFFSET + _align(capacity)
+                    )
+                except FileExistsError:
+                    memory = shared_memory.SharedMemory(name)
+                # otherwise the memory gets removed when this process exits,
+                # while other processes are still using it
+                resource_tracker.unregister(memory._name, "shared_memory")  # type: ignore
+        except BaseException:
+            os.close(self._lock_file)
+            raise
+
+        buffer = memory.buf
+        assert buffer is not None
+        self._memory = memory
+        self._buffer = buffer
+        self._capacity = (memory.size - _DATA_OFFSET) & ~15
+        self._sender = _sender_id()
+        # the position up to which this transport has read
+        self._position: int = _POSITION.unpack_from(self._buffer, 0)[0]
+        self._read_lock = threading.Lock()
+        # the reader slot of this transport, taken by the first receive
+        self._slot = -1
+        # a position that all readers reached, the last time it was checked
+        self._slowest = 0
+        # messages read by a send (that waited for this transport), for the next receive
+        self._backlog: list[bytes] = []
+        self.poll_interval = poll_interval
+        self.send_timeout = send_timeout
+        self.overruns = 0
+        # the number of times the writers stopped waiting for a reader
+        self.evictions = 0
+
+    def send(self, message: bytes) -> None:
+        length = len(message)
+        size = _align(_HEADER.size + length)
+        capacity = self._capacity
+        if size > capacity:
+            raise ValueError(f"Messages should be smaller than {capacity - _HEADER.size} bytes")
+
+        buffer = self._buffer
+        with self._lock:
+            position = _POSITION.unpack_from(buffer, 0)[0]
+            offset = position % capacity
+            end = position + size
+            if offset + size > capacity:
+                end += capacity - offset
+            if end - capacity > self._slowest:
+                self._wait_for_readers(end - capacity)
+            _POSITION.pack_into(buffer, _RESERVED_OFFSET, end)
+
+            if offset + size > capacity:
+                _HEADER.pack_into(buffer, _DATA_OFFSET + offset, position, _WRAP, self._sender)
+                position += capacity - offset
+                offset = 0
+
+            start = _DATA_OFFSET + offset + _HEADER.size
+            buffer[start : start + length] = message
+            # the header last, so readers don't read a message that's still being written
+            _HEADER.pack_into(buffer, _DATA_OFFSET + offset, position, length, self._sender)
+            _POSITION.pack_into(buffer, 0, end)
+
+    def _wait_for_readers(self, limit: int) -> None:
+        # waits until all readers reached `limit`, with the lock held
+        buffer = self._buffer
+        deadline = monotonic() + self.send_timeout
+        delay = 0.0
+        while True:
+            slowest = _EVICTED
+            behind = []
+            for slot in range(_READERS):
+                position, sender = _READER.unpack_from(
+                    buffer, _READERS_OFFSET + slot * _READER.size
+                )
+                if sender == 0 or position == _EVICTED:
+                    continue
+                if position < limit:
+                    behind.append(slot)
+                slowest = min(slowest, position)
+
+            if not behind:
+                # without readers, new readers have at least a capacity of room
+                self._slowest = limit if slowest == _EVICTED else slowest
+                return
+
+            if self._slot in behind:
+                # this transport's reader can't read while this waits, so it reads here
+                with self._read_lock:
+                    self._backlog += self._read()
+                continue
+
+            if monotonic() >= deadline:
+                for slot in behind:
+                    _POSITION.pack_into(buffer, _READERS_OFFSET + slot * _READER.size, _EVICTED)
+                    self.evictions += 1
+                continue
+
+            sleep(delay)
+            delay = min(max(delay * 2, 0.00005), self.poll_interval)
+
+    def receive(self, timeout: float) -> list[bytes]:
+        if self._slot < 0:
+            self._take_slot()
+
+        with self._read_lock:
+            messages, self._backlog = self._backlog + self._read(), []
+        if messages:
+            return messages
+
+        deadline = monotonic() + timeout
+        delay = 0.0
+        while True:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                return []
+            sleep(min(delay, remaining))
+            delay = min(max(delay * 2, 0.00005), self.poll_interval)
+            with self._read_lock:
+                messages, self._backlog = self._backlog + self._read(), []
+            if messages:
+                return messages
+
+    def _take_slot(self) -> None:
+        buffer = self._buffer
+        with self._lock:
+            for slot in range(_READERS):
+                position, sender = _READER.unpack_from(
+                    buffer, _READERS_OFFSET + slot * _READER.size
+                )
+                if sender == 0 or position == _EVICTED:
+                    _READER.pack_into(
+                        buffer, _READERS_OFFSET + slot * _READER.size, self._position, self._sender
+                    )
+                    self._slot = slot
+                    return
+
+    def _read(self) -> list[bytes]:
+        # with the read lock held
+        buffer = self._buffer
+        capacity = self._capacity
+        written = _POSITION.unpack_from(buffer, 0)[0]
+        position = self._position
+        if position == written:
+            return []
+
+        messages = []
+        if written - position > capacity:
+            self.overruns += 1
+            position = written
+
+        while position < written:
+            offset = position % capacity
+            header_position, length, sender = _HEADER.unpack_from(buffer, _DATA_OFFSET + offset)
+            message = None
+            if length == _WRAP:
+                next_position = position + capacity - offset
+            else:
+                if sender != self._sender:
+                    start = _DATA_OFFSET + offset + _HEADER.size
+                    message = bytes(buffer[start : start + length])
+                next_position = position + _align(_HEADER.size + length)
+
+            # when a writer reached this message's place in the ring (while
+            # it got read), it's (partially) overwritten by a newer message
+            reserved = _POSITION.unpack_from(buffer, _RESERVED_OFFSET)[0]
+            if header_position != position or reserved > position + capacity:
+                self.overruns += 1
+                position = _POSITION.unpack_from(buffer, 0)[0]
+                break
+
+            if message is not None:
+                messages.append(message)
+            position = next_position
+
+        self._position = position
+        slot = self._slot
+        if slot >= 0:
+            offset = _READERS_OFFSET + slot * _READER.size
+            if _READER.unpack_from(buffer, offset)[1] == self._sender:
+                _POSITION.pack_into(buffer, offset, position)
+            else:
+                # another reader took the slot, after the writers stopped waiting for this one
+                self._slot = -1
+        return messages
+
+    def close(self) -> None:
+        if self._lock_file < 0:
+            return
+        if self._slot >= 0:
+            with self._lock:
+                offset = _READERS_OFFSET + self._slot * _READER.size
+                if _READER.unpack_from(self._buffer, offset)[1] == self._sender:
+                    _READER.pack_into(self._buffer, offset, 0, 0)
+        self._buffer.release()
+        self._memory.close()
+        os.close(self._lock_file)
+        self._lock_file = -1
+
+    def unlink(self) -> None:
+        """Removes the shared memory and the lock file of the channel
+        (once all processes closed it)"""
+        from multiprocessing import resource_tracker
+
+        # unlink unregisters it (again)
+        resource_tracker.register(self._memory._name, "shared_memory")  # type: ignore
+        self._memory.unlink()
+        try:
+            os.unlink(self._lock_path())
+        except FileNotFoundError:
+            pass
+
+    def _lock_path(self) -> str:
+        return os.path.join(self.directory, f"{self.channel}.lock")
+
+
+class _FileLock:
+    """Context manager that holds a thread lock and an exclusive lock on a file"""
+
+    __slots__ = ("lock", "fd", "fcntl")
+
+    def __init__(self, lock: threading.Lock, fd: int, fcntl: Any) -> None:
+        self.lock = lock
+        self.fd = fd
+        self.fcntl = fcntl
+
+    def __enter__(self) -> None:
+        self.lock.acquire()
+        try:
+            self.fcntl.flock(self.fd, self.fcntl.LOCK_EX)
+        except BaseException:
+            self.lock.release()
+            raise
+
+    def __exit__(self, *args: object) -> None:
+        self.fcntl.flock(self.fd, self.fcntl.LOCK_UN)
+        self.lock.release()
+
+
+# every datagram starts with the sender, the id of the message and its
+# index in and the number of datagrams of the message
+_DATAGRAM_HEADER = struct.Struct("<IIHH")
+
+
+class UnixSocketTransport(Transport):
+    """Transport that sends every message as unix datagrams to the socket of every other
+    transport of the channel (which are bound to files in a directory of the channel).
+    Messages larger than `datagram_size` are split up (and joined by the receivers).
+
+    Sends block while a receiver's socket buffer is full (or it has `max_dgram_qlen`
+    datagrams queued, see `man 7 unix`), up to `send_timeout` seconds; after that the
+    message is dropped for that receiver (and counted). The directory of the channel
+    is removed when the last transport closes."""
+
+    __slots__ = (
+        "_directory",
+        "_path",
+        "_socket",
+        "_sending_socket",
+        "_sender",
+        "_message_id",
+        "_peers",
+        "_peers_version",
+        "_listed_at",
+        "_incomplete",
+        "datagram_size",
+        "dropped",
+    )
+
+    def __init__(
+        self,
+        channel: str,
+        datagram_size: int = 64 * 1024,
+        send_timeout: float = 1.0,
+        directory: Optional[str] = None,
+    ) -> None:
+        super().__init__(channel, directory)
+        self._directory = os.path.join(self.directory, channel)
+        self._sender = _sender_id()
+        self._path = os.path.join(self._directory, f"{os.getpid()}-{self._sender}.sock")
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 << 20)
+        for attempt in range(10):
+            os.makedirs(self._directory, exist_ok=True)
+            try:
+                self._socket.bind(self._path)
+                break
+            except FileNotFoundError:
+                # the last transport of another process closed, and removed the directory
+                if attempt == 9:
+                    self._socket.close()
+                    raise
+        self._sending_socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._sending_socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4 << 20)
+        self._sending_socket.settimeout(send_timeout)
+        self._message_id = 0
+        self._peers: list[str] = []
+        # the modification time of the directory when the peers got listed
+        self._peers_version = -1
+        self._listed_at = 0.0
+        # sender => (message id, the datagrams so far) of partially received messages
+        self._incomplete: dict[int, tuple[int, list[bytes]]] = {}
+        self.datagram_size = datagram_size
+        self.dropped = 0
+
+    def _list_peers(self) -> list[str]:
+        # relisted when the directory changed, or (in case the change happened
+        # within the resolution of the modification time) a while ago
+        version = os.stat(self._directory).st_mtime_ns
+        now = monotonic()
+        if version != self._peers_version or now - self._listed_at > 1.0:
+            self._peers_version = version
+            self._listed_at = now
+            self._peers = [
+                os.path.join(self._directory, name)
+                for name in os.listdir(self._directory)
+                if name.endswith(".sock")
+            ]
+            if self._path in self._peers:
+                self._peers.remove(self._path)
+        return self._peers
+
+    def send(self, message: bytes) -> None:
+        peers = self._list_peers()
+        if not peers:
+            return
+
+        self._message_id = message_id = (self._message_id + 1) & 0xFFFFFFFF
+        chunk_size = self.datagram_size - _DATAGRAM_HEADER.size
+        count = max(1, -(-len(message) // chunk_size))
+        if count > 0xFFFF:
+            raise ValueError("Message too large")
+
+        view = memoryview(message)
+        datagrams = [
+            b"".join(
+                (
+                    _DATAGRAM_HEADER.pack(self._sender, message_id, index, count),
+                    view[index * chunk_size : (index + 1) * chunk_size],
+                )
+            )
+            for index in range(count)
+        ]
+
+        sendto = self._sending_socket.sendto
+        for peer in list(peers):
+            try:
+                for datagram in datagrams:
+                    sendto(datagram, peer)
+            except (ConnectionRefusedError, FileNotFoundError):
+                # the transport of the peer is gone (without removing its socket)
+                self._remove_peer(peer)
+            except TimeoutError:
+                self.dropped += 1
+
+    def _remove_peer(self, peer: str) -> None:
+        if peer in self._peers:
+            self._peers.remove(peer)
+        try:
+            os.unlink(peer)
+        except FileNotFoundError:
+            pass
+
+    def receive(self, timeout: float) -> list[bytes]:
+        sock = self._socket
+        messages: list[bytes] = []
+        sock.settimeout(timeout)
+        try:
+            datagram = sock.recv(self.datagram_size)
+        except (TimeoutError, BlockingIOError):
+            return messages
+        self._received(datagram, messages)
+
+        # and everything else that's already there
+        sock.setblocking(False)
+        while True:
+            try:
+                datagram = sock.recv(self.datagram_size)
+            except BlockingIOError:
+                return messages
+            self._received(datagram, messages)
+
+    def _received(self, datagram: bytes, messages: list[bytes]) -> None:
+        sender, message_id, index, count = _DATAGRAM_HEADER.unpack_from(datagram)
+        data = datagram[_DATAGRAM_HEADER.size :]
+        if count == 1:
+            messages.append(data)
+            return
+
+        incomplete = self._incomplete
+        if index == 0:
+            incomplete[sender] = (message_id, [data])
+            return
+
+        # datagrams of a sender arrive in order, but some might have been dropped
+        received = incomplete.get(sender)
+        if received is None or received[0] != message_id or len(received[1]) != index:
+            incomplete.pop(sender, None)
+            return
+        received[1].append(data)
+        if index == count - 1:
+            del incomplete[sender]
+            messages.append(b"".join(received[1]))
+
+    def close(self) -> None:
+        if self._socket.fileno() < 0:
+            return
+        self._socket.close()
+        self._sending_socket.close()
+        try:
+            os.unlink(self._path)
+        except FileNotFoundError:
+            pass
+        try:
+            # fails while other transports use it
+            os.rmdir(self._directory)
+        except OSError:
+            pass
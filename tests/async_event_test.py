@@ -1,3 +1,5 @@
+import gc
+
 import pytest
 from mock import AsyncMock
 
@@ -140,6 +142,54 @@ class TestAsyncEvent:
         unsub()
         assert len(e) == 0
 
+    async def test_fire_many(self):
+        e = AsyncEvent[int]()
+        log = []
+
+        async def f1(v):
+            log.append((1, v))
+
+        async def f2(v):
+            log.append((2, v))
+
+        e += [f1, f2]
+        await e.fire_many([1, 2])
+        assert log == [(1, 1), (1, 2), (2, 1), (2, 2)]
+        assert e._fireCount == 1
+
+    async def test_batch_subscriber(self):
+        e = AsyncEvent[int]()
+        batches = []
+
+        async def observer(values):
+            batches.append(values)
+
+        e.append_batch(observer)
+        values = [1, 2, 3]
+        await e.fire_many(values)
+        await e(4)
+        assert batches == [values, (4,)]
+        assert batches[0] is values
+
+    async def test_append_weak(self):
+        e = AsyncEvent[int]()
+        record = []
+
+        class Counter:
+            async def on_value(self, value):
+                record.append(value)
+
+        counter = Counter()
+        e.append_weak(counter.on_value)
+        await e(1)
+        assert record == [1]
+
+        del counter
+        gc.collect()
+        await e(2)
+        assert record == [1]
+        assert len(e) == 0
+
     async def test_invoke_with_invalid_signature(self):
         e = AsyncEvent()
         await e(1)
@@ -0,0 +1,153 @@
+import threading
+
+import pytest
+
+from evento import BufferEvent, BufferPool
+
+
+class TestBufferPool:
+    def test_reuse(self):
+        pool = BufferPool(min_size=16)
+        lease = pool.acquire(10)
+        assert len(lease) == 10
+        assert len(lease.view) == 10
+        lease.release()
+
+        # the same size class
+        with pool.acquire(16) as lease:
+            assert len(lease) == 16
+        lease = pool.acquire(17)
+        assert pool.stats.as_dict() == {
+            "acquired": 3,
+            "allocated": 2,
+            "allocated_bytes": 16 + 32,
+            "reused": 1,
+            "retained": 0,
+            "in_use": 1,
+        }
+        lease.release()
+        assert pool.stats.in_use == 0
+
+    def test_leases(self):
+        pool = BufferPool()
+        lease = pool.acquire(4)
+        other = lease.lease()
+        lease.release()
+        # releasing again does nothing
+        lease.release()
+        assert lease.released
+        with pytest.raises(ValueError):
+            lease.view
+
+        # the other lease keeps the buffer
+        assert pool.stats.in_use == 1
+        view = other.view
+        other.release()
+        assert pool.stats.in_use == 0
+        # views of released buffers no longer work
+        with pytest.raises(ValueError):
+            view[0]
+
+    def test_max_free(self):
+        pool = BufferPool(max_free=1)
+        leases = [pool.acquire(100) for _ in range(3)]
+        for lease in leases:
+            lease.release()
+        for _ in range(3):
+            pool.acquire(100).release()
+        assert (pool.stats.allocated, pool.stats.reused) == (3, 3)
+
+
+class TestBufferEvent:
+    def test_fire(self):
+        log = []
+        e = BufferEvent()
+        e += lambda view: log.append((bytes(view[2:4]), view.readonly))
+        e.fire(b"abcdef")
+        e(bytearray(b"123456"))
+        assert log == [(b"cd", True), (b"34", True)]
+        assert e.pool.stats.in_use == 0
+        assert e.pool.stats.allocated == 1
+
+    def test_kept_slices(self):
+        slices = []
+        e = BufferEvent()
+        e += lambda view: slices.append(view[:4])
+        e.fire(b"AAAAAAAA")
+        e.fire(b"BBBBBBBB")
+        # kept slices keep their buffer, instead of showing the next contents
+        assert [bytes(view) for view in slices] == [b"AAAA", b"BBBB"]
+        assert e.pool.stats.retained == 2
+        assert e.pool.stats.in_use == 0
+
+        assert e.pool.stats.allocated == 2
+
+    def test_fire_lease(self):
+        views = []
+        e = BufferEvent()
+        e += views.append
+
+        lease = e.acquire(5)
+        lease.view[:] = b"hello"
+        e.fire(lease)
+        # the fire took over the lease
+        assert lease.released
+        with pytest.raises(ValueError):
+            bytes(views[0])
+
+        # without copying; the subscribers get a view of the same buffer
+        lease = e.acquire(5)
+        buffer = lease.view.obj
+        e.fire(lease)
+        assert e.pool.stats.reused == 1
+        assert e.acquire(5).view.obj is buffer
+
+    def test_lease(self):
+        leases = []
+        e = BufferEvent()
+        e += lambda view: leases.append(e.lease())
+        e.fire(b"first")
+        e.fire(b"second")
+        # both buffers are still in use
+        assert e.pool.stats.in_use == 2
+        assert [bytes(lease.readonly) for lease in leases] == [b"first", b"second"]
+
+        def release():
+            for lease in leases:
+                lease.release()
+
+        thread = threading.Thread(target=release)
+        thread.start()
+        thread.join()
+        assert e.pool.stats.in_use == 0
+
+        with pytest.raises(RuntimeError):
+            e.lease()
+
+    def test_nested_fires(self):
+        log = []
+        e = BufferEvent()
+
+        def subscriber(view):
+            if bytes(view) == b"outer":
+                e.fire(b"inner")
+            with e.lease() as lease:
+                log.append(bytes(lease.readonly))
+
+        e += subscriber
+        e.fire(b"outer")
+        assert log == [b"inner", b"outer"]
+
+    def test_raising_subscriber(self):
+        e = BufferEvent()
+        e += lambda view: 1 / 0
+        with pytest.raises(ZeroDivisionError):
+            e.fire(b"data")
+        assert e.pool.stats.in_use == 0
+
+    def test_fire_many(self):
+        log = []
+        e = BufferEvent()
+        e += lambda view: log.append(bytes(view))
+        e.fire_many([b"a", b"b", memoryview(b"c")])
+        assert log == [b"a", b"b", b"c"]
@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+
+from evento import AsyncEvent, Concurrency, ExceptionGroup, async_event
+
+
+class TestConcurrency:
+    pytestmark = [pytest.mark.asyncio]
+
+    def make_sleepers(self, count, delay=0.05):
+        self.running = 0
+        self.max_running = 0
+        self.done = []
+
+        def make(index):
+            async def sleeper(value):
+                self.running += 1
+                self.max_running = max(self.max_running, self.running)
+                await asyncio.sleep(delay)
+                self.running -= 1
+                self.done.append((index, value))
+
+            return sleeper
+
+        return [make(i) for i in range(count)]
+
+    async def test_fire_concurrent(self):
+        e = AsyncEvent[int]()
+        e += self.make_sleepers(5)
+        await e.fire_concurrent(1)
+        assert self.max_running == 5
+        assert sorted(self.done) == [(i, 1) for i in range(5)]
+        assert not e.is_firing
+        assert e._fireCount == 1
+
+    async def test_per_event_concurrency(self):
+        e = AsyncEvent[int](concurrency=Concurrency())
+        e += self.make_sleepers(5)
+        await e(1)
+        assert self.max_running == 5
+
+    async def test_max_concurrency(self):
+        e = AsyncEvent[int](concurrency=Concurrency(max_concurrency=2))
+        e += self.make_sleepers(5, delay=0.01)
+        await e(1)
+        assert self.max_running == 2
+        assert len(self.done) == 5
+
+    async def test_per_fire_options_override_event_options(self):
+        e = AsyncEvent[int](concurrency=Concurrency(max_concurrency=2))
+        e += self.make_sleepers(5, delay=0.01)
+        await e.fire_concurrent(1, Concurrency(max_concurrency=3))
+        assert self.max_running == 3
+
+    async def test_invalid_max_concurrency(self):
+        with pytest.raises(ValueError):
+            Concurrency(max_concurrency=0)
+
+    @pytest.mark.parametrize("max_concurrency", [None, 1])
+    async def test_exceptions_are_aggregated(self, max_concurrency):
+        e = AsyncEvent[int](concurrency=Concurrency(max_concurrency=max_concurrency))
+        record = []
+
+        async def fail(value):
+            raise ValueError(value)
+
+        async def succeed(value):
+            record.append(value)
+
+        async def fail_too(value):
+            raise KeyError(value)
+
+        e += [fail, succeed, fail_too]
+
+        with pytest.raises(ExceptionGroup) as info:
+            await e(3)
+
+        # all subscribers ran, regardless of the failures
+        assert record == [3]
+        assert [type(exc) for exc in info.value.exceptions] == [ValueError, KeyError]
+        assert not e.is_firing
+
+    async def test_timeout(self):
+        e = AsyncEvent[int](concurrency=Concurrency(timeout=0.01))
+        e += self.make_sleepers(3, delay=1.0)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await e(1)
+
+        assert self.done == []
+        assert not e.is_firing
+
+    async def test_async_event_decorator(self):
+        sleepers = self.make_sleepers(3)
+
+        @async_event(concurrency=Concurrency(max_concurrency=2))
+        async def action(value: int) -> str:
+            return f"done {value}"
+
+        action += sleepers
+        assert await action(4) == "done 4"
+        assert self.max_running == 2
+        assert len(self.done) == 3
+
+    async def test_signature_fire_concurrent(self):
+        @async_event
+        async def action(value: int) -> str:
+            return f"done {value}"
+
+        action += self.make_sleepers(3)
+        assert await action.fire_concurrent(2) == "done 2"
+        assert self.max_running == 3
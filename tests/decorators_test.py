@@ -117,3 +117,18 @@ class TestDecorators:
 
         assert before in some_action.beforeEvent
         assert after in some_action.afterEvent
+
+    def test_events_are_created_lazily(self):
+        @triggers_beforeafter_events
+        def some_action():
+            self.value += "a"
+
+        self.value = ""
+        some_action()
+        assert self.value == "a"
+        assert some_action._beforeEvent is None
+        assert some_action._afterEvent is None
+
+        before = some_action.beforeEvent
+        assert some_action.beforeEvent is before
+        assert some_action._afterEvent is None
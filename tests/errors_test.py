@@ -0,0 +1,246 @@
+import logging
+
+import pytest
+
+from evento import (
+    AsyncEvent,
+    Concurrency,
+    Event,
+    ExceptionGroup,
+    SubscriberError,
+    ThreadSafeEvent,
+    async_event,
+    event,
+    log_errors,
+    raise_after_all,
+    raise_group,
+    route_errors,
+)
+
+
+def failing(value):
+    raise ValueError(value)
+
+
+class TestBookkeeping:
+    def test_event(self):
+        e = Event[int]()
+        e += failing
+        with pytest.raises(ValueError):
+            e(1)
+        assert not e.is_firing
+        assert e._fireCount == 1
+
+        with pytest.raises(ValueError):
+            e.fire_many([1, 2])
+        assert not e.is_firing
+
+    def test_threadsafe_event(self):
+        e = ThreadSafeEvent[int]()
+        e += failing
+        with pytest.raises(ValueError):
+            e(1)
+        assert not e.is_firing
+
+    def test_signature_event(self):
+        @event
+        def method(value: int) -> int:
+            return value
+
+        method += failing
+        for fire in (method, method.fire_first, method.fire_intercept):
+            with pytest.raises(ValueError):
+                fire(1)
+            assert not method.is_firing
+
+    def test_subscribing_after_failure(self):
+        e = Event[int]()
+        log = []
+        e += failing
+        with pytest.raises(ValueError):
+            e(1)
+
+        e -= failing
+        e += log.append
+        e(2)
+        assert log == [2]
+
+
+class TestPolicies:
+    def test_raise_after_all(self):
+        log = []
+        e = Event[int]()
+        e += failing
+        e += log.append
+        e.error_policy = raise_after_all
+        with pytest.raises(ValueError):
+            e(1)
+        assert log == [1]
+        assert not e.is_firing
+
+    def test_raise_group(self):
+        log = []
+        e = Event[int]()
+        e += [failing, log.append, lambda value: 1 / 0]
+        e.error_policy = raise_group
+        with pytest.raises(ExceptionGroup) as info:
+            e(1)
+        assert [type(error) for error in info.value.exceptions] == [ValueError, ZeroDivisionError]
+        assert log == [1]
+
+    def test_log_errors(self, caplog):
+        log = []
+        e = Event[int]()
+        e += [failing, log.append]
+        e.error_policy = log_errors
+        with caplog.at_level(logging.ERROR):
+            e(1)
+        assert log == [1]
+        assert "raised" in caplog.text
+        assert caplog.records[0].exc_info[0] is ValueError
+
+    def test_route_errors(self):
+        errors = Event[SubscriberError]()
+        routed = []
+        errors += routed.append
+        e = Event[int]()
+        e += failing
+        e.error_policy = route_errors(errors)
+        e(1)
+        assert [(error.event, error.subscriber) for error in routed] == [(e, failing)]
+        assert isinstance(routed[0].error, ValueError)
+
+    def test_fire_many(self):
+        log, batches = [], []
+        e = Event[int]()
+        e += failing
+        e += log.append
+        e.append_batch(batches.append)
+        e.error_policy = log_errors
+        e.fire_many([1, 2])
+        assert log == [1, 2]
+        assert batches == [[1, 2]]
+
+    def test_unsubscribed_during_fire(self):
+        log = []
+        e = Event[int]()
+
+        def unsubscribing(value):
+            e.remove(log.append)
+            raise ValueError()
+
+        e += [unsubscribing, log.append]
+        e.error_policy = log_errors
+        e(1)
+        assert log == []
+
+    def test_signature_event(self):
+        @event
+        def method(value: int) -> int:
+            return value * 2
+
+        method += failing
+        method.error_policy = log_errors
+        assert method(1) == 2
+
+    def test_method(self):
+        class Counter:
+            @event
+            def count(self, value: int) -> int:
+                return value
+
+        Counter.count.error_policy = log_errors
+        counter = Counter()
+        counter.count += failing
+        # instances use the policy of the class level event
+        assert counter.count(1) == 1
+
+        counter.count.error_policy = raise_after_all
+        with pytest.raises(ValueError):
+            counter.count(1)
+
+
+class TestAsyncPolicies:
+    pytestmark = [pytest.mark.asyncio]
+
+    async def test_bookkeeping(self):
+        async def failing(value):
+            raise ValueError()
+
+        e = AsyncEvent[int]()
+        e += failing
+        with pytest.raises(ValueError):
+            await e(1)
+        assert not e.is_firing
+
+    async def test_route_errors(self):
+        routed = []
+
+        async def failing(value):
+            raise ValueError()
+
+        async def also_failing(value):
+            raise KeyError()
+
+        async def route(error):
+            routed.append(error)
+
+        errors = AsyncEvent[SubscriberError]()
+        errors += route
+        e = AsyncEvent[int]()
+        e += [failing, also_failing]
+        e.error_policy = route_errors(errors)
+        await e(1)
+        assert len(routed) == 2
+
+    async def test_concurrent(self, caplog):
+        async def failing(value):
+            raise ValueError()
+
+        async def observer(value):
+            log.append(value)
+
+        log = []
+        e = AsyncEvent[int](concurrency=Concurrency(max_concurrency=1))
+        e += [failing, observer]
+        e.error_policy = log_errors
+        with caplog.at_level(logging.ERROR):
+            await e(1)
+            await e.fire_concurrent(2, Concurrency())
+        assert log == [1, 2]
+        assert len(caplog.records) == 2
+        assert not e.is_firing
+
+        routed = []
+        e.error_policy = route_errors(routed.append)
+        await e(3)
+        assert [(error.event, error.subscriber) for error in routed] == [(e, failing)]
+
+        # without a policy they're raised in a group
+        e.error_policy = None
+        with pytest.raises(ExceptionGroup):
+            await e(4)
+
+    async def test_signature_event(self):
+        log = []
+
+        @async_event
+        async def method(value: int) -> int:
+            return value * 2
+
+        async def failing(value):
+            raise ValueError()
+
+        async def observer(value):
+            log.append(value)
+
+        method += [failing, observer]
+        method.error_policy = raise_group
+        with pytest.raises(ExceptionGroup):
+            await method(1)
+        assert log == [1]
+        assert not method.is_firing
+
+        with pytest.raises(ExceptionGroup):
+            await method.fire_many([(2,), (3,)])
+        assert log == [1, 2, 3]
@@ -1,3 +1,5 @@
+import gc
+
 import pytest
 
 from evento import Event
@@ -75,6 +77,33 @@ class TestEvent:
         e(2)
         assert record == [(1, 1), (2, 1), (2, 2)]
 
+    def test_remove_later_subscriber_during_fire(self):
+        e = Event()
+        record = []
+
+        def observer1(v: int):
+            record.append((1, v))
+            e.remove(observer2)
+
+        def observer2(v: int):
+            record.append((2, v))
+
+        e += observer1
+        e += observer2
+
+        # observer2 got removed before its turn, so it's skipped
+        e(1)
+        assert record == [(1, 1)]
+        assert len(e) == 1
+
+    def test_fire_count(self):
+        e = Event()
+        e += lambda _: None
+        e(1)
+        e(2)
+        assert e._fireCount == 2
+        assert not e.is_firing
+
     def test_append_during_fire(self):
         e = Event()
 
@@ -97,6 +126,46 @@ class TestEvent:
         assert record == [(2, 1), (2, 2), (1, 2)]
         assert len(e) == 2
 
+    def test_append_during_recursive_fire(self):
+        e = Event()
+        record = []
+
+        def observer1(v: int):
+            record.append((1, v))
+
+        def observer2(v: int):
+            record.append((2, v))
+            if v == 1:
+                e.append(observer1)
+                # the nested fire already sees the new subscriber
+                e(2)
+
+        e += observer2
+        e(1)
+        # the outer fire keeps iterating its own snapshot
+        assert record == [(2, 1), (2, 2), (1, 2)]
+        assert not e.is_firing
+
+    def test_remove_during_recursive_fire(self):
+        e = Event()
+        record = []
+
+        def observer1(v: int):
+            record.append((1, v))
+            if v == 1:
+                e(2)
+
+        def observer2(v: int):
+            record.append((2, v))
+            e.remove(observer2)
+
+        e += observer1
+        e += observer2
+        e(1)
+        # observer2 was removed by the nested fire, so the outer fire skips it
+        assert record == [(1, 1), (1, 2), (2, 2)]
+        assert len(e) == 1
+
     def test_len(self):
 
         e = Event()
@@ -141,6 +210,281 @@ class TestEvent:
         unsub()
         assert len(e) == 0
 
+    def test_contains(self):
+        e = Event()
+
+        def observer(_):
+            pass
+
+        assert observer not in e
+        e += observer
+        assert observer in e
+        e -= observer
+        assert observer not in e
+
+    def test_chaining(self):
+        log = []
+        a = Event()
+        b = Event()
+        b += log.append
+        a += b
+        assert b in a
+        a("value")
+        assert log == ["value"]
+        a -= b
+        assert len(a) == 0
+
+    def test_unhashable_subscriber(self):
+        class Unhashable:
+            __hash__ = None
+
+            def __call__(self, value):
+                pass
+
+        e = Event()
+        with pytest.raises(TypeError, match="hashable"):
+            e += Unhashable()
+
+    def test_order_after_resubscribe(self):
+        e = Event()
+        log = []
+
+        def observer1(_):
+            log.append(1)
+
+        def observer2(_):
+            log.append(2)
+
+        e += observer1
+        e += observer2
+        # duplicates don't change the order
+        e += observer1
+        e(0)
+        assert log == [1, 2]
+
+        # re-subscribing after removal moves the observer to the end
+        e -= observer1
+        e += observer1
+        e(0)
+        assert log == [1, 2, 2, 1]
+
+    def test_priority(self):
+        e = Event[int]()
+        log = []
+
+        e += lambda _: log.append("a")
+        e.append(lambda _: log.append("high"), priority=10)
+        e += lambda _: log.append("b")
+        e.append(lambda _: log.append("low"), priority=-1)
+        e.append(lambda _: log.append("high2"), priority=10)
+        e(0)
+        # higher priorities first, equal priorities in the order they were added
+        assert log == ["high", "high2", "a", "b", "low"]
+
+    def test_remove_with_priority(self):
+        e = Event[int]()
+        log = []
+
+        def observer1(_):
+            log.append(1)
+
+        def observer2(_):
+            log.append(2)
+
+        unsub = e.add(observer1, priority=5)
+        e += observer2
+        unsub()
+        e(0)
+        assert log == [2]
+        assert len(e) == 1
+
+        # a removed priority level can be used again
+        e.append(observer1, priority=5)
+        # appending again doesn't change the priority
+        e.append(observer1, priority=-5)
+        e(0)
+        assert log == [2, 1, 2]
+
+    def test_weak_subscriber_with_priority(self):
+        e = Event[int]()
+        log = []
+
+        class Counter:
+            def on_value(self, value):
+                log.append("weak")
+
+        counter = Counter()
+        e += lambda _: log.append("strong")
+        e.append_weak(counter.on_value, priority=1)
+        e(0)
+        assert log == ["weak", "strong"]
+
+        del counter
+        gc.collect()
+        e(0)
+        assert log == ["weak", "strong", "strong"]
+        assert len(e) == 1
+
+    def test_fire_many(self):
+        e = Event[int]()
+        log = []
+        e += lambda v: log.append((1, v))
+        e += lambda v: log.append((2, v))
+
+        e.fire_many([1, 2, 3])
+        # every subscriber receives the entire batch before the next one
+        assert log == [(1, 1), (1, 2), (1, 3), (2, 1), (2, 2), (2, 3)]
+        assert e._fireCount == 1
+        assert not e.is_firing
+
+    def test_fire_many_with_iterator(self):
+        e = Event[int]()
+        log = []
+        e += lambda v: log.append((1, v))
+        e += lambda v: log.append((2, v))
+        e.fire_many(iter([1, 2]))
+        assert log == [(1, 1), (1, 2), (2, 1), (2, 2)]
+
+    def test_batch_subscriber(self):
+        e = Event[int]()
+        batches = []
+
+        def observer(values):
+            batches.append(values)
+
+        e.append_batch(observer)
+        assert observer in e
+
+        values = memoryview(b"abc")
+        e.fire_many(values)
+        # the batch is delivered as-is, without copying
+        assert batches[0] is values
+
+        # normal fires deliver single value batches
+        e(4)
+        assert batches[1] == (4,)
+
+        # batch subscribers are removed like normal subscribers
+        e.remove(observer)
+        assert len(e) == 0
+
+    def test_add_batch(self):
+        e = Event[int]()
+
+        def observer(values):
+            pass
+
+        unsub = e.add_batch(observer)
+        # appending the same subscriber again doesn't add a duplicate
+        e += observer
+        assert len(e) == 1
+        unsub()
+        assert len(e) == 0
+
+    def test_append_weak(self):
+        e = Event[int]()
+        record = []
+
+        class Counter:
+            def on_value(self, value):
+                record.append(value)
+
+        counter = Counter()
+        e.append_weak(counter.on_value)
+        assert counter.on_value in e
+        assert len(e) == 1
+        e(1)
+        assert record == [1]
+
+        # the event doesn't keep the counter alive
+        del counter
+        gc.collect()
+        e(2)
+        assert record == [1]
+        assert len(e) == 0
+
+    def test_append_weak_function(self):
+        e = Event[int]()
+        record = []
+
+        def observer(value):
+            record.append(value)
+
+        e.append_weak(observer)
+        e(1)
+        del observer
+        gc.collect()
+        e(2)
+        assert record == [1]
+        assert len(e) == 0
+
+    def test_add_weak(self):
+        e = Event[int]()
+
+        class Counter:
+            def on_value(self, value):
+                pass
+
+        counter = Counter()
+        unsub = e.add_weak(counter.on_value)
+        assert len(e) == 1
+        unsub()
+        assert len(e) == 0
+
+        # the unsubscribe callable doesn't keep the subscriber alive
+        e.add_weak(counter.on_value)
+        del counter
+        gc.collect()
+        assert len(e) == 0
+        unsub()
+
+    def test_remove_weak(self):
+        e = Event[int]()
+
+        class Counter:
+            def on_value(self, value):
+                pass
+
+        counter = Counter()
+        e.append_weak(counter.on_value)
+        # subscribing again (weakly or not) doesn't add a duplicate
+        e.append_weak(counter.on_value)
+        e += counter.on_value
+        assert len(e) == 1
+        e -= counter.on_value
+        assert len(e) == 0
+
+    def test_weak_subscriber_collected_during_fire(self):
+        e = Event[int]()
+        record = []
+
+        class Counter:
+            def on_value(self, value):
+                record.append(value)
+
+        counter = Counter()
+
+        def drop(value):
+            nonlocal counter
+            counter = None
+            gc.collect()
+
+        e += drop
+        e.append_weak(counter.on_value)
+        e(1)
+        assert record == []
+        assert len(e) == 1
+
+    def test_slots(self):
+        e = Event[int]()
+        assert not hasattr(e, "__dict__")
+
+        # events without subscribers share their (read-only) storage
+        assert e._subscribers is Event()._subscribers
+        e += lambda _: None
+        assert e._subscribers is not Event()._subscribers
+        assert len(Event()) == 0
+
     def test_invoke_with_invalid_signature(self):
         e = Event()
         e(1)
@@ -0,0 +1,145 @@
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from evento import Event, ExceptionGroup, ExecutorDispatcher, event
+
+
+def square(value):
+    return value * value
+
+
+class TestExecutorDispatcher:
+    def test_submit(self):
+        e = Event[int]()
+        threads = []
+        values = []
+
+        def observer(value):
+            threads.append(threading.current_thread())
+            values.append(value)
+
+        e += observer
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            future = e.submit(ExecutorDispatcher(executor), 3)
+            assert future.result(timeout=5) is None
+
+        assert values == [3]
+        assert threads != [threading.current_thread()]
+        assert e._fireCount == 1
+        assert not e.is_firing
+
+    def test_submit_without_subscribers(self):
+        e = Event[int]()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert e.submit(ExecutorDispatcher(executor), 3).result(timeout=5) is None
+
+    def test_exceptions(self):
+        e = Event[int]()
+
+        def fail(value):
+            raise ValueError(value)
+
+        e += fail
+        e += lambda value: None
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            future = e.submit(ExecutorDispatcher(executor), 3)
+
+            with pytest.raises(ExceptionGroup) as info:
+                future.result(timeout=5)
+
+        assert [type(exc) for exc in info.value.exceptions] == [ValueError]
+
+    def test_ordered(self):
+        e = Event[int]()
+        record = []
+
+        def slow_first(value):
+            # the first call takes longest, but calls to the same subscriber are serialized
+            time.sleep(0.05 if value == 0 else 0)
+            record.append(value)
+
+        e += slow_first
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            dispatcher = ExecutorDispatcher(executor, ordered=True)
+            futures = [e.submit(dispatcher, i) for i in range(4)]
+            for future in futures:
+                future.result(timeout=5)
+
+        assert record == [0, 1, 2, 3]
+        assert dispatcher._tails == {}
+
+    def test_ordered_after_shutdown(self):
+        e = Event[int]()
+        started = threading.Event()
+
+        def slow(value):
+            started.set()
+            time.sleep(0.05)
+
+        e += slow
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        dispatcher = ExecutorDispatcher(executor, ordered=True)
+        first = e.submit(dispatcher, 0)
+        # deferred until the first call is done, when the executor is shut down
+        second = e.submit(dispatcher, 1)
+        started.wait(timeout=5)
+        executor.shutdown(wait=False)
+
+        first.result(timeout=5)
+        with pytest.raises(ExceptionGroup) as info:
+            second.result(timeout=5)
+        assert isinstance(info.value.exceptions[0], RuntimeError)
+
+    def test_ordered_cancel(self):
+        release = threading.Event()
+        record = []
+
+        def subscriber(value):
+            record.append(("start", value))
+            if value == 0:
+                release.wait(timeout=5)
+            record.append(("end", value))
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            dispatcher = ExecutorDispatcher(executor, ordered=True)
+            futures = [dispatcher.submit_each([subscriber], i)[0] for i in range(3)]
+            # the deferred call is cancelled, the call after it still waits for the first
+            assert futures[1].cancel()
+            release.set()
+            futures[2].result(timeout=5)
+
+        assert futures[1].cancelled()
+        assert record == [("start", 0), ("end", 0), ("start", 2), ("end", 2)]
+        assert dispatcher._tails == {}
+
+    def test_process_pool(self):
+        e = Event[int]()
+        e += square
+
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            assert e.submit(ExecutorDispatcher(executor), 3).result(timeout=30) is None
+
+    def test_signature_event_submit(self):
+        record = []
+
+        @event
+        def action(value: int) -> int:
+            record.append("method")
+            return value * 2
+
+        action += lambda value: record.append("subscriber")
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = action.submit(ExecutorDispatcher(executor), 21)
+            assert future.result(timeout=5) == 42
+
+        # the original method runs after the subscribers
+        assert record == ["subscriber", "method"]
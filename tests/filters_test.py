@@ -0,0 +1,116 @@
+from typing import NamedTuple
+
+import pytest
+
+from evento import Event, ExceptionGroup, ThreadSafeEvent, raise_group
+
+
+class Message(NamedTuple):
+    kind: str
+    value: int
+
+
+def kind(message):
+    return message.kind
+
+
+class TestKeyedSubscribers:
+    def test_key(self):
+        log = []
+        e = Event[Message]()
+        e.append(lambda m: log.append(("a", m.value)), key=kind, match="a")
+        e.append(lambda m: log.append(("b", m.value)), key=kind, match="b")
+        e += lambda m: log.append(("all", m.value))
+
+        e(Message("a", 1))
+        e(Message("c", 2))
+        assert log == [("a", 1), ("all", 1), ("all", 2)]
+        # keyed subscribers count as subscribers, not their index
+        assert len(e) == 3
+
+    def test_remove(self):
+        log = []
+        e = Event[Message]()
+        unsub = e.add(log.append, key=kind, match="a")
+        assert log.append in e
+        e(Message("a", 1))
+
+        assert len(e) == 1
+        unsub()
+        assert log.append not in e
+        assert len(e) == 0
+        e(Message("a", 2))
+        assert log == [Message("a", 1)]
+        # the index got removed too
+        assert len(e._subscribers) == 0
+
+    def test_priorities(self):
+        log = []
+        e = Event[Message]()
+        e.append(lambda m: log.append("low"), key=kind, match="a")
+        e.append(lambda m: log.append("high"), priority=1, key=kind, match="a")
+        e.append(lambda m: log.append("plain"))
+        e(Message("a", 1))
+        assert log == ["high", "low", "plain"]
+
+    def test_where(self):
+        log = []
+        e = Event[Message]()
+        e.append(log.append, where=lambda m: m.value > 1)
+        e(Message("a", 1))
+        e(Message("a", 2))
+        assert log == [Message("a", 2)]
+        e -= log.append
+        assert len(e) == 0
+
+    def test_key_and_where(self):
+        log = []
+        e = Event[Message]()
+        e.append(log.append, key=kind, match="a", where=lambda m: m.value > 1)
+        for message in (Message("a", 1), Message("a", 2), Message("b", 3)):
+            e(message)
+        assert log == [Message("a", 2)]
+
+    def test_unsubscribed_during_fire(self):
+        log = []
+        e = Event[Message]()
+
+        def first(message):
+            log.append("first")
+            e.remove(second)
+
+        def second(message):
+            log.append("second")
+
+        e.append([first, second], key=kind, match="a")
+        e(Message("a", 1))
+        assert log == ["first"]
+
+    def test_error_policy(self):
+        log = []
+        e = Event[Message]()
+
+        def failing(message):
+            raise ValueError()
+
+        e.append([failing, log.append], key=kind, match="a")
+        e.append(lambda message: 1 / 0)
+        e.error_policy = raise_group
+        with pytest.raises(ExceptionGroup) as info:
+            e(Message("a", 1))
+        assert [type(error) for error in info.value.exceptions] == [ValueError, ZeroDivisionError]
+        assert log == [Message("a", 1)]
+
+        # without a policy the first exception propagates
+        e.error_policy = None
+        with pytest.raises(ValueError):
+            e(Message("a", 1))
+        assert not e.is_firing
+
+    def test_threadsafe_event(self):
+        log = []
+        e = ThreadSafeEvent[Message]()
+        e.append(log.append, key=kind, match="a")
+        e(Message("a", 1))
+        e(Message("b", 1))
+        assert log == [Message("a", 1)]
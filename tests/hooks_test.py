@@ -0,0 +1,284 @@
+import threading
+
+import pytest
+
+from evento import (
+    AsyncEvent,
+    Event,
+    Hooks,
+    ThreadSafeEvent,
+    add_hooks,
+    async_event,
+    instrument,
+    remove_hooks,
+    uninstrument,
+)
+from evento.hooks import _wrap
+
+
+class RecordingHooks(Hooks):
+    def __init__(self, name, log):
+        self.name = name
+        self.log = log
+
+    def fire_started(self, event, args, kwargs):
+        self.log.append((self.name, "fire", args))
+        return "context"
+
+    def fire_ended(self, event, context, error):
+        self.log.append((self.name, "fire ended", context, type(error)))
+
+    def subscriber_started(self, event, subscriber, args, kwargs):
+        self.log.append((self.name, subscriber.__name__, args))
+        return subscriber.__name__
+
+    def subscriber_ended(self, event, subscriber, context, error):
+        self.log.append((self.name, f"{context} ended", type(error)))
+
+
+class TestHooks:
+    def test_event_hooks(self):
+        log = []
+        e = Event[int]()
+
+        def observer(value):
+            log.append("observer")
+
+        e += observer
+        hooks = RecordingHooks("hooks", log)
+        add_hooks(hooks, e)
+        e(1)
+        assert log == [
+            ("hooks", "fire", (1,)),
+            ("hooks", "observer", (1,)),
+            "observer",
+            ("hooks", "observer ended", type(None)),
+            ("hooks", "fire ended", "context", type(None)),
+        ]
+
+        # other events aren't affected
+        log.clear()
+        other = Event[int]()
+        other += observer
+        other(1)
+        assert log == ["observer"]
+        assert type(other) is Event
+
+        remove_hooks(hooks, e)
+        assert type(e) is Event
+        e(1)
+        assert log == ["observer", "observer"]
+
+    def test_global_hooks(self):
+        log = []
+        e = Event[int]()
+
+        def observer(value):
+            log.append("observer")
+
+        e += observer
+        # snapshots taken before the hooks were added get replaced
+        e(0)
+        log.clear()
+
+        hooks = RecordingHooks("global", log)
+        add_hooks(hooks)
+        try:
+            e(1)
+        finally:
+            remove_hooks(hooks)
+
+        assert log == [
+            ("global", "fire", (1,)),
+            ("global", "observer", (1,)),
+            "observer",
+            ("global", "observer ended", type(None)),
+            ("global", "fire ended", "context", type(None)),
+        ]
+
+        log.clear()
+        e(2)
+        e(3)
+        assert log == ["observer", "observer"]
+        assert type(e._snapshot) is tuple
+
+    def test_fire_many(self):
+        log = []
+        e = Event[int]()
+
+        def observer(value):
+            pass
+
+        e += observer
+        hooks = RecordingHooks("global", log)
+        add_hooks(RecordingHooks("hooks", log), e)
+        add_hooks(hooks)
+        try:
+            e.fire_many([1, 2])
+        finally:
+            remove_hooks(hooks)
+
+        assert log == [
+            ("hooks", "fire", ([1, 2],)),
+            ("global", "fire", ([1, 2],)),
+            ("global", "observer", (1,)),
+            ("hooks", "observer", (1,)),
+            ("hooks", "observer ended", type(None)),
+            ("global", "observer ended", type(None)),
+            ("global", "observer", (2,)),
+            ("hooks", "observer", (2,)),
+            ("hooks", "observer ended", type(None)),
+            ("global", "observer ended", type(None)),
+            ("global", "fire ended", "context", type(None)),
+            ("hooks", "fire ended", "context", type(None)),
+        ]
+
+    @pytest.mark.parametrize("is_global", [False, True])
+    def test_subscribe_while_taking_snapshot(self, monkeypatch, is_global):
+        e = ThreadSafeEvent[int]()
+        record = []
+        e += lambda value: None
+        hooks = Hooks()
+        add_hooks(hooks, None if is_global else e)
+
+        thread = threading.Thread(target=e.append, args=(record.append,))
+
+        def subscribe_while_wrapping(*args):
+            # waits for the lock of the event, which is held while taking the snapshot
+            thread.start()
+            thread.join(timeout=0.05)
+            return _wrap(*args)
+
+        monkeypatch.setattr("evento.hooks._wrap", subscribe_while_wrapping)
+        try:
+            e(1)
+            monkeypatch.setattr("evento.hooks._wrap", _wrap)
+            thread.join(timeout=5)
+            # the subscriber that was added while taking the snapshot isn't lost
+            e(2)
+        finally:
+            remove_hooks(hooks, None if is_global else e)
+        assert record == [2]
+
+    def test_hooks_nest(self):
+        log = []
+        e = Event[int]()
+        e += lambda value: None
+        outer, inner = RecordingHooks("outer", log), RecordingHooks("inner", log)
+        add_hooks(outer)
+        add_hooks(inner, e)
+        try:
+            e(1)
+        finally:
+            remove_hooks(outer)
+
+        assert [entry[:2] for entry in log] == [
+            ("inner", "fire"),
+            ("outer", "fire"),
+            ("outer", "<lambda>"),
+            ("inner", "<lambda>"),
+            ("inner", "<lambda> ended"),
+            ("outer", "<lambda> ended"),
+            ("outer", "fire ended"),
+            ("inner", "fire ended"),
+        ]
+
+    def test_exceptions(self):
+        log = []
+        e = Event[int]()
+
+        def failing(value):
+            raise ValueError()
+
+        e += failing
+        add_hooks(RecordingHooks("hooks", log), e)
+        with pytest.raises(ValueError):
+            e(1)
+        assert log[-2:] == [
+            ("hooks", "failing ended", ValueError),
+            ("hooks", "fire ended", "context", ValueError),
+        ]
+
+    def test_with_instrumentation(self):
+        log = []
+        e = Event[int]()
+
+        def observer(value):
+            pass
+
+        e += observer
+        hooks = RecordingHooks("hooks", log)
+        stats = instrument(e)
+        add_hooks(hooks, e)
+        uninstrument(e)
+        e(1)
+        # the hooks remain, and receive the subscriber as it was subscribed
+        assert ("hooks", "observer", (1,)) in log
+        assert stats.fires == 0
+        remove_hooks(hooks, e)
+        assert type(e) is Event
+
+
+class TestAsyncHooks:
+    pytestmark = [pytest.mark.asyncio]
+
+    async def test_event_hooks(self):
+        log = []
+        e = AsyncEvent[int]()
+
+        async def observer(value):
+            log.append("observer")
+
+        e += observer
+        add_hooks(RecordingHooks("hooks", log), e)
+        await e(1)
+        assert log == [
+            ("hooks", "fire", (1,)),
+            ("hooks", "observer", (1,)),
+            "observer",
+            ("hooks", "observer ended", type(None)),
+            ("hooks", "fire ended", "context", type(None)),
+        ]
+
+    async def test_global_hooks(self):
+        log = []
+
+        @async_event
+        async def add(a: int, b: int) -> int:
+            return a + b
+
+        async def observer(a, b):
+            log.append("observer")
+
+        add += observer
+        hooks = RecordingHooks("global", log)
+        add_hooks(hooks)
+        try:
+            assert await add(1, 2) == 3
+        finally:
+            remove_hooks(hooks)
+
+        assert log == [
+            ("global", "fire", (1, 2)),
+            ("global", "observer", (1, 2)),
+            "observer",
+            ("global", "observer ended", type(None)),
+            ("global", "fire ended", "context", type(None)),
+        ]
+
+    async def test_fire_concurrent(self):
+        log = []
+        e = AsyncEvent[int]()
+
+        async def observer(value):
+            pass
+
+        e += observer
+        add_hooks(RecordingHooks("hooks", log), e)
+        await e.fire_concurrent(1)
+        await e.fire_many([2, 3])
+        assert [entry for entry in log if entry[1] == "fire"] == [
+            ("hooks", "fire", (1,)),
+            ("hooks", "fire", ([2, 3],)),
+        ]
+        assert [entry[2] for entry in log if entry[1] == "observer"] == [(1,), (2,), (3,)]
@@ -0,0 +1,170 @@
+import asyncio
+import threading
+
+import pytest
+
+from evento import (
+    AsyncEvent,
+    Event,
+    ThreadSafeEvent,
+    async_event,
+    event,
+    instrument,
+    to_prometheus,
+    uninstrument,
+)
+from evento.instrumentation import EventStats
+
+
+def observer(value):
+    pass
+
+
+def failing_observer(value):
+    raise ValueError()
+
+
+class TestInstrumentation:
+    def test_instrument(self):
+        e = Event[int]()
+        e += observer
+        stats = instrument(e, "values")
+
+        e(1)
+        e.fire(2)
+        assert stats.fires == 2
+        assert stats.latency.count == 2
+        assert stats.latency.sum > 0
+
+        result = stats.as_dict()
+        assert result["name"] == "values"
+        assert result["fires"] == 2
+        assert result["latency"]["buckets"]["inf"] == 2
+        assert result["subscribers"] == {
+            f"{__name__}.observer": {"calls": 2, "time": pytest.approx(0, abs=1), "exceptions": 0}
+        }
+
+        # instrumenting again keeps the statistics
+        assert instrument(e) is stats
+
+    def test_exceptions(self):
+        e = Event[int]()
+        e += failing_observer
+        stats = instrument(e)
+
+        with pytest.raises(ValueError):
+            e(1)
+        assert stats.fires == 1
+        assert stats.subscribers[failing_observer].exceptions == 1
+        assert stats.subscribers[failing_observer].calls == 1
+
+    def test_subscribers_stay_unwrapped(self):
+        e = Event[int]()
+        stats = instrument(e)
+        e += observer
+        e.append_batch(lambda values: None)
+        e(1)
+        e.fire_many([1, 2])
+        assert observer in e
+        assert stats.subscribers[observer].calls == 3
+        e -= observer
+        e(1)
+        assert observer not in stats.subscribers
+
+    def test_subscribe_while_taking_snapshot(self, monkeypatch):
+        e = ThreadSafeEvent[int]()
+        record = []
+        e += observer
+        instrument(e)
+
+        wrap = EventStats._wrap
+        thread = threading.Thread(target=e.append, args=(record.append,))
+
+        def subscribe_while_wrapping(stats, snapshot, timed_type):
+            # waits for the lock of the event, which is held while taking the snapshot
+            thread.start()
+            thread.join(timeout=0.05)
+            return wrap(stats, snapshot, timed_type)
+
+        monkeypatch.setattr(EventStats, "_wrap", subscribe_while_wrapping)
+        e(1)
+        monkeypatch.setattr(EventStats, "_wrap", wrap)
+        thread.join(timeout=5)
+        # the subscriber that was added while taking the snapshot isn't lost
+        e(2)
+        assert record == [2]
+
+    def test_uninstrument(self):
+        e = Event[int]()
+        e += observer
+        stats = instrument(e)
+        e(1)
+
+        uninstrument(e)
+        assert type(e) is Event
+        e(1)
+        assert stats.fires == 1
+        assert stats.subscribers[observer].calls == 1
+        # without effect for events that aren't instrumented
+        uninstrument(e)
+
+    def test_signature_event(self):
+        @event
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        add += lambda a, b: None
+        stats = instrument(add)
+        assert add(1, 2) == 3
+        assert stats.fires == 1
+
+    def test_prometheus(self):
+        e = Event[int]()
+        e += observer
+        stats = instrument(e, 'my "event"')
+        e(1)
+
+        text = to_prometheus([stats])
+        assert "# TYPE evento_fires_total counter\n" in text
+        assert 'evento_fires_total{event="my \\"event\\""} 1\n' in text
+        assert 'evento_fire_duration_seconds_bucket{event="my \\"event\\"",le="+Inf"} 1\n' in text
+        assert 'evento_fire_duration_seconds_count{event="my \\"event\\""} 1\n' in text
+        assert (
+            'evento_subscriber_calls_total{event="my \\"event\\"",'
+            f'subscriber="{__name__}.observer"}} 1\n'
+            in text
+        )
+
+
+class TestAsyncInstrumentation:
+    pytestmark = [pytest.mark.asyncio]
+
+    async def test_instrument(self):
+        e = AsyncEvent[int]()
+
+        async def sleeper(value):
+            await asyncio.sleep(0.01)
+
+        e += sleeper
+        stats = instrument(e)
+        await e(1)
+        assert stats.fires == 1
+        assert stats.latency.sum >= 0.01
+        # timed until the subscriber is done
+        assert stats.subscribers[sleeper].time >= 0.01
+
+    async def test_signature_event(self):
+        @async_event
+        async def add(a: int, b: int) -> int:
+            return a + b
+
+        async def failing(a, b):
+            raise ValueError()
+
+        stats = instrument(add)
+        assert await add(1, 2) == 3
+        add += failing
+        with pytest.raises(ValueError):
+            await add(1, 2)
+        assert stats.fires == 2
+        assert stats.subscribers[failing].exceptions == 1
@@ -0,0 +1,263 @@
+import asyncio
+import gc
+import time
+import weakref
+
+import pytest
+
+from evento import CacheAccess, Memoize, async_event, event
+
+
+class TestMemoize:
+    def test_memoize(self):
+        calls = []
+        observed = []
+
+        @event(memoize=Memoize())
+        def square(value: int) -> int:
+            calls.append(value)
+            return value * value
+
+        square += observed.append
+
+        assert square(3) == 9
+        assert square(3) == 9
+        assert square(4) == 16
+        # the original method is only invoked for new arguments
+        assert calls == [3, 4]
+        # while subscribers still see every call
+        assert observed == [3, 3, 4]
+        assert len(square.cache) == 2
+        assert (3,) in square.cache
+
+        square.cache.clear()
+        assert square(3) == 9
+        assert calls == [3, 4, 3]
+
+    def test_not_memoized(self):
+        @event
+        def square(value: int) -> int:
+            return value * value
+
+        assert square.cache is None
+
+    def test_keyword_arguments(self):
+        calls = []
+
+        @event(memoize=Memoize())
+        def join(a: str, b: str = "-") -> str:
+            calls.append((a, b))
+            return a + b
+
+        assert join("a", b="b") == "ab"
+        assert join("a", b="b") == "ab"
+        assert join("a", "b") == "ab"
+        assert calls == [("a", "b"), ("a", "b")]
+
+    def test_maxsize(self):
+        calls = []
+
+        @event(memoize=Memoize(maxsize=2))
+        def identity(value: int) -> int:
+            calls.append(value)
+            return value
+
+        identity(1)
+        identity(2)
+        identity(1)
+        # evicts the least recently used result (2)
+        identity(3)
+        assert len(identity.cache) == 2
+        identity(1)
+        identity(2)
+        assert calls == [1, 2, 3, 2]
+
+        with pytest.raises(ValueError):
+            Memoize(maxsize=0)
+
+    def test_ttl(self):
+        calls = []
+
+        @event(memoize=Memoize(ttl=0.01))
+        def identity(value: int) -> int:
+            calls.append(value)
+            return value
+
+        identity(1)
+        identity(1)
+        time.sleep(0.02)
+        identity(1)
+        assert calls == [1, 1]
+
+    def test_exceptions_are_not_cached(self):
+        calls = []
+
+        @event(memoize=Memoize())
+        def fail(value: int) -> int:
+            calls.append(value)
+            raise ValueError()
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                fail(1)
+        assert calls == [1, 1]
+
+    def test_accessed_event(self):
+        @event(memoize=Memoize())
+        def square(value: int) -> int:
+            return value * value
+
+        accesses = []
+        square.cache.accessed += accesses.append
+        square(2)
+        square(2)
+        square(value=2)
+        assert accesses == [
+            CacheAccess(False, (2,), {}),
+            CacheAccess(True, (2,), {}),
+            CacheAccess(False, (), {"value": 2}),
+        ]
+
+    def test_method(self):
+        class Door:
+            def __init__(self):
+                self.calls = 0
+
+            @event(memoize=Memoize())
+            def weight(self) -> int:
+                self.calls += 1
+                return 10
+
+        front, back = Door(), Door()
+        assert front.weight() == back.weight() == front.weight() == 10
+        assert (front.calls, back.calls) == (1, 1)
+        assert front.weight.cache is Door.weight.cache
+
+    def test_instances_not_kept_alive(self):
+        class Door:
+            @event(memoize=Memoize())
+            def weight(self, unit: str) -> int:
+                return 10
+
+        front, back = Door(), Door()
+        front.weight("kg")
+        front.weight("lb")
+        back.weight("kg")
+        cache = Door.weight.cache
+        assert len(cache) == 3
+        assert (front, "kg") in cache
+
+        ref = weakref.ref(front)
+        del front
+        gc.collect()
+        assert ref() is None
+        # the results of the collected instance are evicted
+        assert len(cache) == 1
+        assert (back, "kg") in cache
+
+
+class TestAsyncMemoize:
+    pytestmark = [pytest.mark.asyncio]
+
+    async def test_memoize(self):
+        calls = []
+
+        @async_event(memoize=Memoize())
+        async def square(value: int) -> int:
+            calls.append(value)
+            return value * value
+
+        assert await square(3) == 9
+        assert await square(3) == 9
+        assert calls == [3]
+        assert len(square.cache) == 1
+
+    async def test_instances_not_kept_alive(self):
+        class Door:
+            @async_event(memoize=Memoize())
+            async def weight(self) -> int:
+                return 10
+
+        door = Door()
+        assert await door.weight() == 10
+        assert len(Door.weight.cache) == 1
+
+        ref = weakref.ref(door)
+        del door
+        gc.collect()
+        assert ref() is None
+        assert len(Door.weight.cache) == 0
+
+    async def test_single_flight(self):
+        calls = []
+
+        @async_event(memoize=Memoize())
+        async def slow(value: int) -> int:
+            calls.append(value)
+            await asyncio.sleep(0.01)
+            return value * 2
+
+        accesses = []
+        slow.cache.accessed += lambda access: accesses.append(access.hit)
+
+        results = await asyncio.gather(slow(1), slow(1), slow(1), slow(2))
+        assert results == [2, 2, 2, 4]
+        # concurrent calls with the same arguments await a single call
+        assert calls == [1, 2]
+        assert accesses == [False, True, True, False]
+        assert not slow.cache._pending
+
+    async def test_single_flight_exception(self):
+        calls = []
+
+        @async_event(memoize=Memoize())
+        async def fail(value: int) -> int:
+            calls.append(value)
+            await asyncio.sleep(0.01)
+            raise ValueError()
+
+        results = await asyncio.gather(fail(1), fail(1), return_exceptions=True)
+        assert [type(result) for result in results] == [ValueError, ValueError]
+        assert calls == [1]
+
+        # not cached
+        with pytest.raises(ValueError):
+            await fail(1)
+        assert calls == [1, 1]
+
+    async def test_cancel_waiting_call(self):
+        @async_event(memoize=Memoize())
+        async def slow(value: int) -> int:
+            await asyncio.sleep(0.01)
+            return value
+
+        first = asyncio.ensure_future(slow(1))
+        second = asyncio.ensure_future(slow(1))
+        await asyncio.sleep(0)
+        second.cancel()
+        # cancelling a coalesced call doesn't cancel the call it's waiting for
+        assert await first == 1
+        with pytest.raises(asyncio.CancelledError):
+            await second
+
+    async def test_cancel_first_call(self):
+        calls = []
+
+        @async_event(memoize=Memoize())
+        async def slow(value: int) -> int:
+            calls.append(value)
+            await asyncio.sleep(0.01)
+            return value
+
+        first = asyncio.ensure_future(slow(1))
+        second = asyncio.ensure_future(slow(1))
+        await asyncio.sleep(0)
+        first.cancel()
+        # cancelling the call that awaits the method doesn't cancel the waiting calls
+        assert await second == 1
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert calls == [1]
+        # and the result got cached
+        assert await slow(1) == 1
+        assert calls == [1]
@@ -0,0 +1,381 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+
+import pytest
+
+from evento import (
+    AsyncEvent,
+    CompactSerializer,
+    Event,
+    PickleSerializer,
+    Serializer,
+    SharedMemoryTransport,
+    Transport,
+    UnixSocketTransport,
+    mirror,
+)
+
+KINDS = ["shared_memory", "socket"]
+
+
+@pytest.fixture
+def directory(tmp_path):
+    return str(tmp_path)
+
+
+@pytest.fixture
+def channel(directory):
+    name = f"test-{uuid.uuid4().hex[:12]}"
+    yield name
+    # removes the shared memory (if any)
+    try:
+        transport = SharedMemoryTransport(name, capacity=16, directory=directory)
+    except OSError:
+        return
+    transport.unlink()
+    transport.close()
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def receive(transport, count=1, timeout=5.0):
+    messages = []
+    deadline = time.monotonic() + timeout
+    while len(messages) < count and time.monotonic() < deadline:
+        messages += transport.receive(0.05)
+    return messages
+
+
+class TestSerializers:
+    def test_compact(self):
+        value = {
+            "ints": [0, 1, 127, 128, 255, 256, 65536, 2**32, 2**64 - 1],
+            "negative ints": [-1, -32, -33, -(2**63)],
+            "floats": [0.0, 1.5, -2.25],
+            "strings": ["", "a" * 31, "b" * 32, "c" * 256, "d" * 70000, "ünï"],
+            "bytes": [b"", b"x" * 300],
+            "nested": [None, True, False, [], {}, {1: [2, {"3": None}]}],
+            "list": list(range(20)),
+        }
+        s = CompactSerializer()
+        assert s.loads(s.dumps(value)) == value
+        # tuples come back as lists
+        assert s.loads(s.dumps((1, (2,)))) == [1, [2]]
+
+    def test_compact_format(self):
+        s = CompactSerializer()
+        # the same bytes msgpack produces
+        assert s.dumps({"a": [1, -1, None, True]}) == b"\x81\xa1a\x94\x01\xff\xc0\xc3"
+        assert s.dumps(1.5) == b"\xcb?\xf8\x00\x00\x00\x00\x00\x00"
+
+    def test_compact_unsupported(self):
+        s = CompactSerializer()
+        with pytest.raises(TypeError):
+            s.dumps(object())
+        with pytest.raises(OverflowError):
+            s.dumps(2**64)
+        with pytest.raises(ValueError):
+            s.loads(b"\x01\x02")
+
+    def test_pickle(self):
+        s = PickleSerializer()
+        value = {"a": (1, 2), "b": {3}}
+        assert s.loads(s.dumps(value)) == value
+
+    def test_abstract(self, channel):
+        # serializers and transports have to implement all methods
+        class Incomplete(Serializer):
+            def dumps(self, value):
+                return b""
+
+        with pytest.raises(TypeError):
+            Incomplete()
+        with pytest.raises(TypeError):
+            Transport(channel)
+
+
+class TestSharedMemoryTransport:
+    def test_unlink(self, channel, directory):
+        a = SharedMemoryTransport(channel, capacity=1024, directory=directory)
+        assert os.listdir(directory) == [f"{channel}.lock"]
+        a.unlink()
+        a.close()
+        assert os.listdir(directory) == []
+
+    def test_send(self, channel, directory):
+        a = SharedMemoryTransport(channel, directory=directory)
+        b = SharedMemoryTransport(channel, directory=directory)
+        a.send(b"1")
+        b.send(b"2")
+        a.send(b"3")
+        # transports don't receive their own messages
+        assert receive(b, 2) == [b"1", b"3"]
+        assert receive(a) == [b"2"]
+        assert a.receive(0.01) == []
+        a.close()
+        b.close()
+
+    def test_wrap_around(self, channel, directory):
+        a = SharedMemoryTransport(channel, directory=directory, capacity=1024)
+        b = SharedMemoryTransport(channel, directory=directory)
+        messages = [bytes([i]) * (i * 10) for i in range(50)]
+        for message in messages:
+            a.send(message)
+            assert b.receive(1) == [message]
+        assert b.overruns == 0
+        a.close()
+        b.close()
+
+    def test_overrun(self, channel, directory):
+        a = SharedMemoryTransport(channel, directory=directory, capacity=1024)
+        b = SharedMemoryTransport(channel, directory=directory)
+        for i in range(100):
+            a.send(bytes([i]) * 100)
+        # b fell behind more than the capacity, and skipped to the newest message
+        assert b.receive(0.01) == []
+        assert b.overruns == 1
+        a.send(b"new")
+        assert b.receive(1) == [b"new"]
+
+        with pytest.raises(ValueError):
+            a.send(b"x" * 1024)
+        a.close()
+        b.close()
+
+    def test_wait_for_readers(self, channel, directory):
+        a = SharedMemoryTransport(channel, directory=directory, capacity=1024)
+        b = SharedMemoryTransport(channel, directory=directory)
+        # takes a reader slot
+        assert b.receive(0) == []
+        received = []
+
+        def read():
+            while len(received) < 100:
+                received.extend(b.receive(0.05))
+                time.sleep(0.001)
+
+        reader = threading.Thread(target=read)
+        reader.start()
+        messages = [bytes([i]) * 100 for i in range(100)]
+        for message in messages:
+            a.send(message)
+        reader.join(5)
+        # a waited for b, instead of overwriting messages b didn't read
+        assert received == messages
+        assert (b.overruns, a.evictions) == (0, 0)
+        a.close()
+        b.close()
+
+    def test_evict_reader(self, channel, directory):
+        a = SharedMemoryTransport(channel, directory=directory, capacity=1024, send_timeout=0.01)
+        b = SharedMemoryTransport(channel, directory=directory)
+        assert b.receive(0) == []
+        # b doesn't read
+        for i in range(20):
+            a.send(bytes([i]) * 100)
+        assert a.evictions == 1
+        assert b.receive(0) == []
+        assert b.overruns == 1
+        # b reads again, so a waits for it again
+        a.send(b"new")
+        assert b.receive(1) == [b"new"]
+        for i in range(20):
+            a.send(bytes([i]) * 100)
+        assert a.evictions == 2
+        a.close()
+        b.close()
+
+
+class TestUnixSocketTransport:
+    def test_send(self, channel, directory):
+        a = UnixSocketTransport(channel, directory=directory)
+        b = UnixSocketTransport(channel, directory=directory)
+        c = UnixSocketTransport(channel, directory=directory)
+        a.send(b"1")
+        assert receive(b) == [b"1"]
+        assert receive(c) == [b"1"]
+        assert a.receive(0.01) == []
+        for transport in (a, b, c):
+            transport.close()
+        # the last one removed the directory of the channel
+        assert os.listdir(directory) == []
+
+    def test_large_message(self, channel, directory):
+        a = UnixSocketTransport(channel, directory=directory, datagram_size=4096)
+        b = UnixSocketTransport(channel, directory=directory, datagram_size=4096)
+        # split up in 5 datagrams
+        message = bytes(range(256)) * 64
+        a.send(message)
+        a.send(b"small")
+        assert receive(b, 2) == [message, b"small"]
+        a.close()
+        b.close()
+
+    def test_closed_peer(self, channel, directory):
+        a = UnixSocketTransport(channel, directory=directory)
+        b = UnixSocketTransport(channel, directory=directory)
+        # a peer that went away without closing its transport
+        b._socket.close()
+        a.send(b"1")
+        assert a._list_peers() == []
+        a.close()
+
+
+def child(channel, directory, kind, ready, results):
+    e = Event()
+    received = []
+    e += received.append
+    m = mirror(e, channel, kind, directory=directory, batch_size=10, linger=0.001)
+    ready.set()
+    wait_for(lambda: len(received) == 3)
+    e.fire("pong")
+    e.fire_many(["a", "b"])
+    m.close()
+    results.put(received)
+
+
+@pytest.mark.parametrize("kind", KINDS)
+class TestMirror:
+    def test_processes(self, channel, directory, kind):
+        context = multiprocessing.get_context("spawn")
+        ready = context.Event()
+        results = context.Queue()
+        process = context.Process(target=child, args=(channel, directory, kind, ready, results))
+        process.start()
+
+        e = Event()
+        received = []
+        e += received.append
+        m = mirror(e, channel, kind, directory=directory)
+        assert ready.wait(10)
+        e.fire(1)
+        e.fire_many([{"large": "x" * 100_000}, (2, 3)])
+        large = {"large": "x" * 100_000}
+        assert results.get(timeout=10) == [1, large, (2, 3), "pong", "a", "b"]
+        process.join(10)
+        wait_for(lambda: len(received) == 6)
+        assert received[3:] == ["pong", "a", "b"]
+        assert (m.sent, m.received) == (3, 3)
+        m.close()
+
+    def test_batches(self, channel, directory, kind):
+        a, b = Event[int](), Event[int]()
+        batches = []
+        b.append_batch(batches.append)
+        mirror_a = mirror(a, channel, kind, directory=directory, batch_size=3, linger=60)
+        mirror_b = mirror(b, channel, kind, directory=directory)
+
+        for i in range(4):
+            a.fire(i)
+        wait_for(lambda: len(batches) == 1)
+        assert batches == [[0, 1, 2]]
+        # the last value waits for a full batch, or close
+        mirror_a.close()
+        wait_for(lambda: len(batches) == 2)
+        assert batches[1] == (3,)
+        mirror_b.close()
+
+    def test_linger(self, channel, directory, kind):
+        a, b = Event[int](), Event[int]()
+        log = []
+        b += log.append
+        mirror_a = mirror(a, channel, kind, directory=directory, batch_size=100, linger=0.01)
+        mirror_b = mirror(b, channel, kind, directory=directory)
+        a.fire(1)
+        a.fire(2)
+        wait_for(lambda: log == [1, 2])
+        mirror_a.close()
+        mirror_b.close()
+
+    def test_no_echo(self, channel, directory, kind):
+        a, b = Event[int](), Event[int]()
+        log_a, log_b = [], []
+        a += log_a.append
+        b += log_b.append
+        # b fires values of its own while firing received values
+        b += lambda value: b.fire(value * 10) if value < 10 else None
+        mirror_a = mirror(a, channel, kind, directory=directory)
+        mirror_b = mirror(b, channel, kind, directory=directory)
+        a.fire(1)
+        wait_for(lambda: log_b == [1, 10])
+        time.sleep(0.05)
+        # neither the received value nor the value fired by its subscriber is sent back
+        assert log_a == [1]
+        mirror_a.close()
+        mirror_b.close()
+
+    def test_compact_serializer(self, channel, directory, kind):
+        a, b = Event[dict](), Event[dict]()
+        log = []
+        b += log.append
+        mirror_a = mirror(a, channel, kind, directory=directory, serializer=CompactSerializer())
+        mirror_b = mirror(b, channel, kind, directory=directory, serializer=CompactSerializer())
+        a.fire({"a": [1, 2.5, "3"]})
+        wait_for(lambda: log == [{"a": [1, 2.5, "3"]}])
+        mirror_a.close()
+        mirror_b.close()
+
+    def test_subscriber_raises(self, channel, directory, kind):
+        a, b = Event[int](), Event[int]()
+        log = []
+        b += lambda value: 1 / value
+        b += log.append
+        mirror_a = mirror(a, channel, kind, directory=directory)
+        mirror_b = mirror(b, channel, kind, directory=directory)
+        a.fire(0)
+        a.fire(1)
+        # the exception is logged and the mirror keeps going
+        wait_for(lambda: log == [1])
+        mirror_a.close()
+        mirror_b.close()
+
+
+@pytest.mark.parametrize("kind", KINDS)
+class TestAsyncMirror:
+    pytestmark = [pytest.mark.asyncio]
+
+    async def test_fire(self, channel, directory, kind):
+        a, b = AsyncEvent[int](), AsyncEvent[int]()
+        log = []
+
+        async def observer(value):
+            log.append(value)
+
+        b += observer
+        mirror_a = mirror(a, channel, kind, directory=directory)
+        mirror_b = mirror(b, channel, kind, directory=directory)
+        await a.fire(1)
+        await a.fire_many([2, 3])
+
+        deadline = time.monotonic() + 5
+        while len(log) < 3 and time.monotonic() < deadline:
+            await asyncio.sleep(0.001)
+        assert log == [1, 2, 3]
+        mirror_a.close()
+        mirror_b.close()
+
+    async def test_no_echo(self, channel, directory, kind):
+        a, b = AsyncEvent[int](), AsyncEvent[int]()
+        log = []
+
+        async def observer(value):
+            log.append(value)
+
+        a += observer
+        b += observer
+        mirror_a = mirror(a, channel, kind, directory=directory)
+        mirror_b = mirror(b, channel, kind, directory=directory)
+        await a.fire(1)
+        await asyncio.sleep(0.1)
+        assert log == [1, 1]
+        mirror_a.close()
+        mirror_b.close()
@@ -0,0 +1,168 @@
+import asyncio
+import gc
+
+import pytest
+
+from evento import AsyncEvent, Event, buffer, coalesce, debounce, sample, throttle
+from evento.operators import Operator
+
+
+class TestOperators:
+    pytestmark = [pytest.mark.asyncio]
+
+    async def test_throttle(self):
+        e = Event[int]()
+        log = []
+        throttled = throttle(e, 0.05)
+        throttled += log.append
+
+        for value in range(5):
+            e(value)
+        # the first value right away, the latest one at the end of the interval
+        assert log == [0]
+        await asyncio.sleep(0.08)
+        assert log == [0, 4]
+
+        e(5)
+        assert log == [0, 4]
+        await asyncio.sleep(0.08)
+        assert log == [0, 4, 5]
+
+    async def test_throttle_without_trailing(self):
+        e = Event[int]()
+        log = []
+        throttled = throttle(e, 0.05, trailing=False)
+        throttled += log.append
+        for value in range(5):
+            e(value)
+        await asyncio.sleep(0.08)
+        e(5)
+        assert log == [0, 5]
+
+    async def test_debounce(self):
+        e = Event[int]()
+        log = []
+        debounced = debounce(e, 0.03)
+        debounced += log.append
+
+        for value in range(3):
+            e(value)
+            await asyncio.sleep(0.01)
+        assert log == []
+        await asyncio.sleep(0.05)
+        assert log == [2]
+
+    async def test_coalesce(self):
+        e = Event[tuple[str, int]]()
+        log = []
+        coalesced = coalesce(e, 0.02, key=lambda value: value[0])
+        coalesced += log.append
+        for value in [("a", 1), ("b", 1), ("a", 2)]:
+            e(value)
+        await asyncio.sleep(0.04)
+        assert log == [("a", 2), ("b", 1)]
+
+    async def test_sample(self):
+        e = Event[int]()
+        log = []
+        sampled = sample(e, 0.02)
+        sampled += log.append
+        e(1)
+        e(2)
+        await asyncio.sleep(0.03)
+        assert log == [2]
+        # nothing new, no sample
+        await asyncio.sleep(0.03)
+        assert log == [2]
+
+    async def test_buffer(self):
+        e = Event[int]()
+        log = []
+        buffered = buffer(e, count=3, time=0.02)
+        buffered += log.append
+        for value in range(4):
+            e(value)
+        assert log == [[0, 1, 2]]
+        await asyncio.sleep(0.04)
+        assert log == [[0, 1, 2], [3]]
+
+    async def test_chaining(self):
+        e = Event[int]()
+        log = []
+        chained = buffer(debounce(e, 0.01), count=2)
+        chained += log.append
+        for value in (1, 2):
+            e(value)
+            await asyncio.sleep(0.03)
+        assert log == [[1, 2]]
+
+    async def test_detach(self):
+        e = Event[int]()
+        log = []
+        debounced = debounce(e, 0.01)
+        debounced += log.append
+        e(1)
+        debounced.detach()
+        e(2)
+        await asyncio.sleep(0.03)
+        assert log == []
+        assert len(e) == 0
+
+
+class TestWithoutLoop:
+    def test_buffer_by_count(self):
+        # doesn't need an event loop
+        e = Event[int]()
+        log = []
+        buffered = buffer(e, count=2)
+        buffered += log.append
+        for value in range(5):
+            e(value)
+        assert log == [[0, 1], [2, 3]]
+
+    def test_garbage_collected(self):
+        e = Event[int]()
+        buffer(e, count=2)
+        gc.collect()
+        e(1)
+        assert len(e) == 0
+
+    def test_operator_without_receive(self):
+        class Incomplete(Operator[int]):
+            pass
+
+        with pytest.raises(TypeError):
+            Incomplete(Event[int](), None)
+
+
+class TestAsyncOperators:
+    pytestmark = [pytest.mark.asyncio]
+
+    async def test_throttle(self):
+        e = AsyncEvent[int]()
+        log = []
+
+        async def observer(value):
+            log.append(value)
+
+        throttled = throttle(e, 0.02)
+        throttled += observer
+        for value in range(3):
+            await e(value)
+        # the leading value is awaited by the fire
+        assert log == [0]
+        await asyncio.sleep(0.04)
+        assert log == [0, 2]
+
+    async def test_buffer(self):
+        e = AsyncEvent[int]()
+        log = []
+
+        async def observer(values):
+            log.append(values)
+
+        buffered = buffer(e, count=2)
+        buffered += observer
+        for value in range(4):
+            await e(value)
+        assert log == [[0, 1], [2, 3]]
@@ -0,0 +1,139 @@
+import asyncio
+
+import pytest
+
+from evento import QueuedEvent, log_errors
+
+
+class TestQueuedEvent:
+    pytestmark = [pytest.mark.asyncio]
+
+    async def test_fire(self):
+        log = []
+
+        async def observer(value):
+            log.append(value)
+
+        e = QueuedEvent[int]()
+        e += observer
+        await e(1)
+        assert e.fire_nowait(2)
+        # fires don't wait for the subscribers
+        assert log == []
+
+        await e.join()
+        assert log == [1, 2]
+        stats = e.queue_stats
+        assert (stats.enqueued, stats.dispatched, stats.dropped) == (2, 2, 0)
+        assert stats.latency.count == 2
+        await e.close()
+
+    async def test_block(self):
+        e = QueuedEvent[int](maxsize=2)
+        e += self.make_slow_observer()
+        await e.fire_many([1, 2, 3])
+        # the first value was taken by the consumer
+        assert e.depth == 2
+        with pytest.raises(asyncio.QueueFull):
+            e.fire_nowait(4)
+        await e.close()
+        assert self.log == [1, 2, 3]
+
+    async def test_drop_newest(self):
+        e = QueuedEvent[int](maxsize=2, backpressure="drop_newest")
+        e += self.make_slow_observer()
+        results = [e.fire_nowait(value) for value in range(4)]
+        assert results == [True, True, False, False]
+        await e.close()
+        assert self.log == [0, 1]
+        assert e.queue_stats.dropped == 2
+
+    async def test_drop_oldest(self):
+        e = QueuedEvent[int](maxsize=2, backpressure="drop_oldest")
+        e += self.make_slow_observer()
+        for value in range(4):
+            e.fire_nowait(value)
+        await e.close()
+        assert self.log == [2, 3]
+        assert e.queue_stats.max_depth == 2
+
+    async def test_coalesce(self):
+        e = QueuedEvent[tuple[str, int]](backpressure="coalesce", key=lambda value: value[0])
+        e += self.make_slow_observer()
+        for value in [("a", 1), ("b", 1), ("a", 2), ("a", 3)]:
+            await e(value)
+        await e.close()
+        assert self.log == [("a", 3), ("b", 1)]
+        assert e.queue_stats.coalesced == 2
+
+    async def test_batches(self):
+        batches = []
+
+        async def batch_observer(values):
+            batches.append(list(values))
+
+        e = QueuedEvent[int](batch_size=3)
+        e.append_batch(batch_observer)
+        for value in range(5):
+            e.fire_nowait(value)
+        await e.close()
+        assert batches == [[0, 1, 2], [3, 4]]
+
+    async def test_consumers(self):
+        running = []
+
+        async def sleeper(value):
+            running.append(value)
+            await asyncio.sleep(0.05)
+
+        e = QueuedEvent[int](consumers=3)
+        e += sleeper
+        for value in range(3):
+            e.fire_nowait(value)
+        await asyncio.sleep(0.01)
+        assert sorted(running) == [0, 1, 2]
+        await e.close()
+
+    async def test_exceptions(self, caplog):
+        log = []
+
+        async def failing(value):
+            raise ValueError()
+
+        async def observer(value):
+            log.append(value)
+
+        e = QueuedEvent[int]()
+        e += failing
+        e.fire_nowait(1)
+        await e.join()
+        # the consumer keeps going
+        assert "raised" in caplog.text
+        assert not e.is_firing
+
+        e.error_policy = log_errors
+        e += observer
+        e.fire_nowait(2)
+        await e.close()
+        assert log == [2]
+
+    async def test_close(self):
+        e = QueuedEvent[int]()
+        e += self.make_slow_observer()
+        for value in range(3):
+            e.fire_nowait(value)
+        await e.close(drain=False)
+        assert self.log == []
+        # fires start new consumers
+        await e(4)
+        await e.close()
+        assert 4 in self.log
+
+    def make_slow_observer(self):
+        self.log = []
+
+        async def observer(value):
+            await asyncio.sleep(0.001)
+            self.log.append(value)
+
+        return observer
@@ -0,0 +1,149 @@
+import os
+
+import pytest
+
+from evento import AsyncEvent, CompactSerializer, Event, EventLog, record
+
+
+class TestEventLog:
+    def test_append_and_read(self, tmp_path):
+        with EventLog(str(tmp_path)) as log:
+            assert log.append("a") == 1
+            assert log.extend(["b", {"c": 3}]) == 4
+            assert len(log) == 3
+            assert list(log.read()) == [(1, "a"), (2, "b"), (3, {"c": 3})]
+            assert list(log.read(2, 3)) == [(2, "b")]
+            assert list(log.read(10)) == []
+
+    def test_reopen(self, tmp_path):
+        with EventLog(str(tmp_path)) as log:
+            log.extend(range(10))
+        with EventLog(str(tmp_path)) as log:
+            assert log.next_seq == 11
+            assert log.append(10) == 11
+            assert [value for _, value in log.read(9)] == [8, 9, 10]
+
+    def test_segments(self, tmp_path):
+        with EventLog(str(tmp_path), segment_size=256) as log:
+            for i in range(100):
+                log.append(f"value {i}")
+            # a record larger than a segment gets a segment of its own
+            log.append("x" * 1000)
+            assert len(log._segments) > 10
+            assert [value for _, value in log.read(50, 53)] == ["value 49", "value 50", "value 51"]
+            assert list(log.read(101)) == [(101, "x" * 1000)]
+
+        with EventLog(str(tmp_path), segment_size=256) as log:
+            assert [seq for seq, _ in log.read()] == list(range(1, 102))
+
+    def test_read_while_appending(self, tmp_path):
+        with EventLog(str(tmp_path), segment_size=256) as log:
+            log.append(0)
+            values = []
+            for seq, value in log.read():
+                values.append(value)
+                if seq < 50:
+                    log.append(seq)
+            assert values == list(range(50))
+
+    def test_uncommitted(self, tmp_path):
+        log = EventLog(str(tmp_path), commit_every=1000, commit_interval=60)
+        log.extend(range(5))
+        # the process crashed: records made it to disk, the index didn't
+        log._map.flush()
+        log._committed = log.next_seq
+
+        with EventLog(str(tmp_path)) as recovered:
+            assert [value for _, value in recovered.read()] == list(range(5))
+        log._close_active()
+
+    def test_incomplete_record(self, tmp_path):
+        with EventLog(str(tmp_path)) as log:
+            log.extend(["a", "b"])
+            end = log._end
+            path = log._segments[-1].path
+
+        # the process crashed while writing the last record
+        with open(path, "r+b") as file:
+            file.seek(end - 1)
+            file.write(b"\xff")
+        with EventLog(str(tmp_path)) as log:
+            assert list(log.read()) == [(1, "a")]
+            assert log.append("c") == 2
+            assert list(log.read()) == [(1, "a"), (2, "c")]
+
+    def test_index_files(self, tmp_path):
+        with EventLog(str(tmp_path), segment_size=256, commit_every=1) as log:
+            log.extend(range(20))
+            names = sorted(os.listdir(tmp_path))
+            assert names[:2] == ["00000000000000000001.idx", "00000000000000000001.log"]
+            first = log._segments[0]
+            # a record per offset in the index
+            assert os.path.getsize(first.index_path) == 8 * (log._first_seqs[1] - 1)
+
+    def test_compact_serializer(self, tmp_path):
+        with EventLog(str(tmp_path), serializer=CompactSerializer()) as log:
+            log.append({"a": [1, 2]})
+            assert list(log.read()) == [(1, {"a": [1, 2]})]
+
+
+class TestRecord:
+    def test_record_and_replay(self, tmp_path):
+        log = EventLog(str(tmp_path))
+        e = Event[int]()
+        stop = record(e, log)
+        e.fire(1)
+        e.fire_many([2, 3])
+        stop()
+        e.fire(4)
+        assert [value for _, value in log.read()] == [1, 2, 3]
+
+        # a late subscriber
+        late = []
+        assert log.replay(late.append) == 4
+        assert late == [1, 2, 3]
+        assert log.replay(late.append, from_seq=3) == 4
+        assert late == [1, 2, 3, 3]
+        log.close()
+
+    def test_replay_into_recorded_event(self, tmp_path):
+        log = EventLog(str(tmp_path))
+        e = Event[int]()
+        log_values = []
+        e += log_values.append
+        record(e, log)
+        e.fire(1)
+        e.fire(2)
+        # replays the records that were there when it started
+        assert log.replay(e) == 3
+        assert log_values == [1, 2, 1, 2]
+        assert len(log) == 4
+        log.close()
+
+    def test_write_ahead(self, tmp_path):
+        log = EventLog(str(tmp_path))
+        e = Event[int]()
+        seen = []
+        e.append(lambda value: seen.append(log.next_seq), priority=10)
+        record(e, log)
+        e.fire(1)
+        # recorded before the subscribers got it
+        assert seen == [2]
+        log.close()
+
+    @pytest.mark.asyncio
+    async def test_async(self, tmp_path):
+        log = EventLog(str(tmp_path))
+        e = AsyncEvent[int]()
+        record(e, log)
+        await e.fire(1)
+        await e.fire_many([2, 3])
+
+        replayed = []
+
+        async def subscriber(value):
+            replayed.append(value)
+
+        assert await log.replay_async(subscriber, from_seq=2) == 4
+        assert replayed == [2, 3]
+        log.close()
@@ -0,0 +1,96 @@
+import pytest
+
+from evento import EventRegistry, Hooks, add_hooks, remove_hooks
+
+
+class TestEventRegistry:
+    def test_exact_topic(self):
+        registry = EventRegistry[int]()
+        log = []
+        registry.subscribe("orders.eu.created", lambda topic, value: log.append((topic, value)))
+        registry.fire("orders.eu.created", 1)
+        registry.fire("orders.us.created", 2)
+        assert log == [("orders.eu.created", 1)]
+
+    def test_wildcards(self):
+        registry = EventRegistry[int]()
+        log = []
+
+        def subscriber(pattern):
+            return lambda topic, value: log.append(pattern)
+
+        for pattern in ("orders.*.created", "orders.#", "#", "orders.#.created", "*.eu"):
+            registry.subscribe(pattern, subscriber(pattern))
+
+        registry.fire("orders.eu.created", 1)
+        assert sorted(log) == sorted(["orders.*.created", "orders.#", "#", "orders.#.created"])
+
+        log.clear()
+        registry.fire("orders", 1)
+        # "#" matches zero segments too
+        assert sorted(log) == ["#", "orders.#"]
+
+        log.clear()
+        registry.fire("orders.eu", 1)
+        assert sorted(log) == ["#", "*.eu", "orders.#"]
+
+        log.clear()
+        registry.fire("orders.eu.paid.created", 1)
+        assert sorted(log) == ["#", "orders.#", "orders.#.created"]
+
+    def test_cache_invalidated(self):
+        registry = EventRegistry[int]()
+        log = []
+        registry.fire("orders.eu.created", 1)
+        assert registry.matches("orders.eu.created") == []
+
+        unsubscribe = registry.subscribe("orders.*.created", lambda topic, value: log.append(1))
+        registry.fire("orders.eu.created", 1)
+        assert log == [1]
+
+        unsubscribe()
+        registry.fire("orders.eu.created", 1)
+        assert log == [1]
+
+    def test_event(self):
+        registry = EventRegistry[int]()
+        log = []
+        event = registry.event("orders.*")
+        assert registry.event("orders.*") is event
+        event += lambda topic, value: log.append(value)
+        registry.fire("orders.eu", 1)
+        assert log == [1]
+        assert registry.patterns() == ["orders.*"]
+
+    def test_cache_size(self):
+        registry = EventRegistry[int](cache_size=2)
+        registry.subscribe("#", lambda topic, value: None)
+        for topic in ("a", "b", "c"):
+            registry.fire(topic, 1)
+        assert list(registry._cache) == ["b", "c"]
+
+    def test_invalid_topics(self):
+        registry = EventRegistry[int]()
+        with pytest.raises(ValueError):
+            registry.subscribe("orders.eu*", lambda topic, value: None)
+        with pytest.raises(ValueError):
+            registry.fire("orders.*", 1)
+        with pytest.raises(ValueError):
+            registry.fire("orders..eu", 1)
+
+    def test_global_hooks(self):
+        fires = []
+
+        class Recording(Hooks):
+            def fire_started(self, event, args, kwargs):
+                fires.append((event.pattern, args))
+
+        registry = EventRegistry[int]()
+        registry.subscribe("orders.*", lambda topic, value: None)
+        hooks = Recording()
+        add_hooks(hooks)
+        try:
+            registry.fire("orders.created", 1)
+        finally:
+            remove_hooks(hooks)
+        assert fires == [("orders.*", ("orders.created", 1))]
@@ -0,0 +1,392 @@
+import copy
+import gc
+import pickle
+import weakref
+
+import pytest
+
+from evento import async_event, event
+
+
+class Counter:
+    # module level, so it can be pickled
+    def __init__(self):
+        self.count = 0
+
+    @event
+    def increment(self, amount: int) -> int:
+        self.count += amount
+        return self.count
+
+
+class TestSignatureEvent:
+    def test_fire_many(self):
+        log = []
+
+        @event
+        def action(a: int, b: int) -> int:
+            log.append(("method", a, b))
+            return a + b
+
+        action += lambda a, b: log.append(("observer", a, b))
+
+        assert action.fire_many([(1, 2), (3, 4)]) == [3, 7]
+        assert log == [
+            ("observer", 1, 2),
+            ("observer", 3, 4),
+            ("method", 1, 2),
+            ("method", 3, 4),
+        ]
+        assert action._fireCount == 1
+
+    def test_fire_results(self):
+        log = []
+
+        @event
+        def action(a: int) -> int:
+            log.append("method")
+            return a
+
+        def observer(result):
+            def subscriber(a):
+                log.append(result)
+                return result
+
+            return subscriber
+
+        action += [observer("first"), observer(None), observer("third")]
+
+        results = action.fire_results(1)
+        # lazily invokes the subscribers
+        assert log == []
+        assert next(results) == "first"
+        assert log == ["first"]
+        assert action.is_firing
+        assert list(results) == [None, "third"]
+        assert log == ["first", None, "third"]
+        assert not action.is_firing
+
+        # the first truthy result
+        log.clear()
+        results = action.fire_results(1)
+        assert next(filter(None, results), None) == "first"
+        results.close()
+        assert log == ["first"]
+        assert not action.is_firing
+
+    def test_fire_first(self):
+        log = []
+
+        @event
+        def action(a: int) -> int:
+            log.append("method")
+            return a
+
+        action += lambda a: log.append("observer")
+        assert action.fire_first(1) is None
+
+        action += lambda a: a * 10 if a > 1 else None
+        action += lambda a: log.append("last")
+        assert action.fire_first(2) == 20
+        assert log == ["observer", "observer"]
+        assert not action.is_firing
+
+    def test_fire_intercept(self):
+        cache = {2: "cached"}
+        log = []
+
+        @event
+        def action(a: int) -> str:
+            log.append(a)
+            return "computed"
+
+        action += cache.get
+        assert action.fire_intercept(2) == "cached"
+        assert action.fire_intercept(3) == "computed"
+        # the original method is only invoked without an answer
+        assert log == [3]
+
+
+class TestAsyncSignatureEvent:
+    pytestmark = [pytest.mark.asyncio]
+
+    async def test_fire_many(self):
+        log = []
+
+        @async_event
+        async def action(a: int, b: int) -> int:
+            log.append(("method", a, b))
+            return a + b
+
+        async def observer(a, b):
+            log.append(("observer", a, b))
+
+        action += observer
+
+        assert await action.fire_many([(1, 2), (3, 4)]) == [3, 7]
+        assert log == [
+            ("observer", 1, 2),
+            ("observer", 3, 4),
+            ("method", 1, 2),
+            ("method", 3, 4),
+        ]
+
+    async def test_fire_results(self):
+        @async_event
+        async def action(a: int) -> int:
+            return a
+
+        log = []
+
+        async def first(a):
+            log.append("first")
+
+        async def second(a):
+            log.append("second")
+            return a * 10
+
+        action += [first, second]
+
+        results = action.fire_results(2)
+        assert await results.__anext__() is None
+        assert log == ["first"]
+        assert [result async for result in results] == [20]
+        assert not action.is_firing
+
+    async def test_fire_intercept(self):
+        log = []
+
+        @async_event
+        async def action(a: int) -> str:
+            log.append(a)
+            return "computed"
+
+        async def cached(a):
+            return "cached" if a == 2 else None
+
+        action += cached
+        assert await action.fire_first(3) is None
+        assert await action.fire_intercept(2) == "cached"
+        assert await action.fire_intercept(3) == "computed"
+        assert log == [3]
+        assert not action.is_firing
+
+
+class TestSignatureEventMethod:
+    def make_class(self):
+        class Door:
+            def __init__(self, name):
+                self.name = name
+                self.log = []
+
+            @event
+            def open(self, speed: int) -> str:
+                self.log.append(("open", speed))
+                return f"{self.name} opened"
+
+        return Door
+
+    def test_call_unobserved(self):
+        Door = self.make_class()
+        door = Door("front")
+        assert door.open(1) == "front opened"
+        assert door.log == [("open", 1)]
+
+    def test_per_instance_subscribers(self):
+        Door = self.make_class()
+        front, back = Door("front"), Door("back")
+        record = []
+
+        front.open += lambda speed: record.append(("front", speed))
+
+        assert front.open(2) == "front opened"
+        assert back.open(3) == "back opened"
+        # subscribers don't receive the instance and only observe their own instance
+        assert record == [("front", 2)]
+        assert len(front.open) == 1
+        assert len(back.open) == 0
+
+    def test_bound_event_is_cached(self):
+        Door = self.make_class()
+        door = Door("front")
+        first, second = door.open, door.open
+        first += lambda speed: None
+        # subscribing through either one subscribes to the event that is kept
+        second += lambda speed: None
+        assert door.open is door.open is first
+        assert len(door.open) == 2
+        # the instance's attributes are left alone
+        assert "open" not in vars(door)
+
+    def test_temporary_instance(self):
+        Door = self.make_class()
+        assert Door("front").open(1) == "front opened"
+        assert Door("front").open.fire_intercept(1) == "front opened"
+
+    def test_copy_and_pickle(self):
+        counter = Counter()
+        counter.increment(1)
+        counter.increment += lambda amount: None
+
+        assert vars(counter) == {"count": 1}
+        duplicate = copy.copy(counter)
+        assert duplicate.increment(2) == 3
+        assert counter.count == 1
+        # subscriptions are not copied
+        assert len(duplicate.increment) == 0
+        assert len(counter.increment) == 1
+
+        restored = pickle.loads(pickle.dumps(counter))
+        assert restored.increment(3) == 4
+
+    def test_replace_bound_event(self):
+        Door = self.make_class()
+        door = Door("front")
+        with pytest.raises(AttributeError):
+            door.open = Door("back").open
+
+    def test_class_level_subscribers(self):
+        Door = self.make_class()
+        front, back = Door("front"), Door("back")
+        record = []
+
+        def on_instance(speed):
+            record.append(("instance", speed))
+
+        def on_any(door, speed):
+            record.append((door.name, speed))
+
+        Door.open += on_any
+        front.open += on_instance
+
+        front.open(1)
+        back.open(2)
+        # calling through the class still works as before
+        assert Door.open(back, 3) == "back opened"
+        assert record == [("instance", 1), ("front", 1), ("back", 2), ("back", 3)]
+        assert back.log == [("open", 2), ("open", 3)]
+
+    def test_renamed_attribute(self):
+        def open_impl(self) -> str:
+            return "opened"
+
+        class Door:
+            open = event(open_impl)
+
+        door = Door()
+        door.open += lambda: None
+        assert len(door.open) == 1
+        assert door.open() == "opened"
+
+    def test_instance_without_dict(self):
+        class Door:
+            __slots__ = ()
+
+            @event
+            def open(self) -> str:
+                return "opened"
+
+        door = Door()
+        assert door.open() == "opened"
+        # subscriptions can't be kept for it, so they fail instead of getting lost
+        with pytest.raises(TypeError):
+            door.open.append(lambda: None)
+
+    def test_slots_instance_subscribers(self):
+        class Door:
+            __slots__ = ("__weakref__",)
+
+            @event
+            def open(self, speed: int) -> str:
+                return "opened"
+
+        front, back = Door(), Door()
+        record = []
+        front.open += record.append
+        assert front.open is front.open
+        assert front.open(1) == "opened"
+        back.open(2)
+        assert record == [1]
+
+        # the cached event goes with the instance
+        del front
+        gc.collect()
+        assert Door.open._instances == {}
+
+    def test_instance_not_kept_alive(self):
+        Door = self.make_class()
+        door = Door("front")
+        door.open(1)
+        door.open += lambda speed: None
+        ref = weakref.ref(door)
+
+        gc.disable()
+        try:
+            # without the cyclic garbage collector
+            del door
+            assert ref() is None
+        finally:
+            gc.enable()
+
+    def test_fire_intercept(self):
+        Door = self.make_class()
+        front, back = Door("front"), Door("back")
+        front.open += lambda speed: "front is stuck" if speed > 5 else None
+        Door.open.append(lambda door, speed: "all are stuck" if speed > 9 else None)
+
+        assert front.open.fire_intercept(1) == "front opened"
+        assert front.open.fire_intercept(6) == "front is stuck"
+        assert front.open.fire_intercept(10) == "front is stuck"
+        assert back.open.fire_intercept(6) == "back opened"
+        assert back.open.fire_intercept(10) == "all are stuck"
+        assert list(back.open.fire_results(10)) == ["all are stuck"]
+        assert list(front.open.fire_results(1)) == [None, None]
+
+
+class TestAsyncSignatureEventMethod:
+    pytestmark = [pytest.mark.asyncio]
+
+    async def test_per_instance_subscribers(self):
+        class Door:
+            def __init__(self, name):
+                self.name = name
+
+            @async_event
+            async def open(self, speed: int) -> str:
+                return f"{self.name} opened"
+
+        front, back = Door("front"), Door("back")
+        record = []
+        # without subscribers, calls on temporary instances work
+        assert await Door("side").open(1) == "side opened"
+
+        async def on_front(speed):
+            record.append(("front", speed))
+
+        async def on_any(door, speed):
+            record.append(("any", door.name, speed))
+
+        front.open += on_front
+        Door.open += on_any
+
+        assert await front.open(1) == "front opened"
+        assert await back.open(2) == "back opened"
+        assert record == [("front", 1), ("any", "front", 1), ("any", "back", 2)]
+
+    async def test_fire_intercept(self):
+        class Door:
+            def __init__(self, name):
+                self.name = name
+
+            @async_event
+            async def open(self, speed: int) -> str:
+                return f"{self.name} opened"
+
+        async def stuck(door, speed):
+            return "stuck" if speed > 5 else None
+
+        front = Door("front")
+        Door.open += stuck
+        assert await front.open.fire_intercept(1) == "front opened"
+        assert await front.open.fire_intercept(6) == "stuck"
+        assert [r async for r in front.open.fire_results(6)] == ["stuck"]
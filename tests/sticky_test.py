@@ -0,0 +1,143 @@
+import gc
+
+import pytest
+
+from evento import Hooks, StickyEvent, add_hooks, instrument, remove_hooks
+
+
+class TestStickyEvent:
+    def test_late_subscriber(self):
+        event = StickyEvent[str]()
+        event.fire("a")
+        event.fire("b")
+
+        received: list[str] = []
+        event += received.append
+        assert received == ["b"]
+        event.fire("c")
+        assert received == ["b", "c"]
+
+    def test_no_value(self):
+        event = StickyEvent[str]()
+        received: list[str] = []
+        event.append(received.append)
+        assert received == []
+        assert event.retained == []
+
+    def test_retain(self):
+        event = StickyEvent[int](retain=3)
+        event.fire(1)
+        event.fire(2)
+        assert event.retained == [1, 2]
+        for value in range(3, 8):
+            event.fire(value)
+        assert event.retained == [5, 6, 7]
+        assert event.retain == 3
+
+        received: list[int] = []
+        event.add(received.append)
+        assert received == [5, 6, 7]
+
+    def test_invalid_retain(self):
+        with pytest.raises(ValueError):
+            StickyEvent[int](retain=0)
+
+    def test_fire_many(self):
+        event = StickyEvent[int](retain=2)
+        received: list[int] = []
+        event += received.append
+        event.fire_many(iter([1, 2, 3]))
+        assert received == [1, 2, 3]
+        assert event.retained == [2, 3]
+
+    def test_already_subscribed(self):
+        event = StickyEvent[int]()
+        received: list[int] = []
+        event += received.append
+        event.fire(1)
+        event += received.append
+        assert received == [1]
+
+    def test_no_replay(self):
+        event = StickyEvent[int]()
+        event.fire(1)
+        received: list[int] = []
+        event.append(received.append, replay=False)
+        assert received == []
+
+    def test_clear(self):
+        event = StickyEvent[int](retain=2)
+        event.fire(1)
+        event.clear()
+        assert event.retained == []
+        received: list[int] = []
+        event += received.append
+        assert received == []
+
+    def test_filtered(self):
+        event = StickyEvent[int](retain=5)
+        for value in range(5):
+            event.fire(value)
+
+        even: list[int] = []
+        event.append(even.append, where=lambda value: value % 2 == 0)
+        assert even == [0, 2, 4]
+
+        threes: list[int] = []
+        event.append(threes.append, key=lambda value: value % 3, match=0)
+        assert threes == [0, 3]
+
+    def test_batch(self):
+        event = StickyEvent[int](retain=3)
+        event.fire_many([1, 2, 3, 4])
+        batches: list[list[int]] = []
+        event.append_batch(lambda values: batches.append(list(values)))
+        assert batches == [[2, 3, 4]]
+
+    def test_weak(self):
+        class Receiver:
+            def __init__(self):
+                self.received: list[int] = []
+
+            def on_value(self, value: int) -> None:
+                self.received.append(value)
+
+        event = StickyEvent[int]()
+        event.fire(1)
+        receiver = Receiver()
+        event.add_weak(receiver.on_value)
+        assert receiver.received == [1]
+
+        del receiver
+        gc.collect()
+        event.fire(2)
+        assert len(event) == 0
+
+    def test_instrumented(self):
+        event = StickyEvent[int]()
+        stats = instrument(event, "values")
+        event.fire(1)
+        assert stats.fires == 1
+
+        received: list[int] = []
+        event += received.append
+        assert received == [1]
+
+    def test_global_hooks(self):
+        fires = []
+
+        class Recording(Hooks):
+            def fire_started(self, event, args, kwargs):
+                fires.append(args)
+
+        event = StickyEvent[int]()
+        event += lambda value: None
+        hooks = Recording()
+        add_hooks(hooks)
+        try:
+            event.fire(1)
+            event(2)
+        finally:
+            remove_hooks(hooks)
+        assert fires == [(1,), (2,)]
+        assert event.retained == [2]
@@ -0,0 +1,183 @@
+import asyncio
+import gc
+
+import pytest
+
+from evento import AsyncEvent
+
+
+class TestStream:
+    pytestmark = [pytest.mark.asyncio]
+
+    async def test_iterate(self):
+        e = AsyncEvent[int]()
+        stream = e.stream()
+        assert len(e) == 1
+
+        async def produce():
+            for value in range(5):
+                await e(value)
+            await e.fire_many([5, 6])
+
+        task = asyncio.ensure_future(produce())
+        received = []
+        async for value in stream:
+            received.append(value)
+            if value == 6:
+                break
+        await task
+        assert received == list(range(7))
+
+        await stream.aclose()
+        assert stream.closed
+        assert len(e) == 0
+
+    async def test_context_manager(self):
+        e = AsyncEvent[int]()
+        async with e.stream() as stream:
+            await e(1)
+            assert await stream.__anext__() == 1
+        assert len(e) == 0
+        # a closed stream ends the iteration
+        await e(2)
+        assert [value async for value in stream] == []
+
+    async def test_abandoned(self):
+        e = AsyncEvent[int]()
+
+        async def first():
+            async for value in e.stream(maxsize=4):
+                return value
+
+        task = asyncio.ensure_future(first())
+        await asyncio.sleep(0)
+        await e(1)
+        assert await task == 1
+        gc.collect()
+
+        # the abandoned stream unsubscribed, so fires don't block on its full buffer
+        for value in range(10):
+            await asyncio.wait_for(e(value), 1)
+        assert len(e) == 0
+
+    async def test_block(self):
+        e = AsyncEvent[int]()
+        stream = e.stream(maxsize=2)
+        fire = asyncio.ensure_future(e.fire_many([1, 2, 3]))
+        await asyncio.sleep(0)
+        # waits for room for the third value
+        assert not fire.done()
+        assert len(stream) == 2
+
+        assert await stream.__anext__() == 1
+        await fire
+        assert len(stream) == 2
+        assert stream.dropped == 0
+        await stream.aclose()
+
+    async def test_close_while_blocked(self):
+        e = AsyncEvent[int]()
+        stream = e.stream(maxsize=1)
+        fire = asyncio.ensure_future(e.fire_many([1, 2]))
+        await asyncio.sleep(0)
+        await stream.aclose()
+        await fire
+        assert len(stream) == 0
+
+    async def test_drop_newest(self):
+        e = AsyncEvent[int]()
+        stream = e.stream(maxsize=2, policy="drop_newest")
+        await e.fire_many([1, 2, 3, 4])
+        assert stream.dropped == 2
+        assert await stream.batches(10).__anext__() == [1, 2]
+
+    async def test_drop_oldest(self):
+        e = AsyncEvent[int]()
+        stream = e.stream(maxsize=2, policy="drop_oldest")
+        await e.fire_many([1, 2, 3, 4])
+        assert stream.dropped == 2
+        assert await stream.batches(10).__anext__() == [3, 4]
+
+    async def test_invalid(self):
+        e = AsyncEvent[int]()
+        with pytest.raises(ValueError):
+            e.stream(maxsize=0)
+        with pytest.raises(ValueError):
+            e.stream(policy="coalesce")  # type: ignore[arg-type]
+        assert len(e) == 0
+
+    async def test_cancel(self):
+        e = AsyncEvent[int]()
+        stream = e.stream()
+
+        async def consume():
+            async for _ in stream:
+                pass
+
+        task = asyncio.ensure_future(consume())
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert stream.closed
+        assert len(e) == 0
+
+    async def test_map_filter(self):
+        e = AsyncEvent[int]()
+        stream = e.stream().filter(lambda value: value % 2 == 0).map(str)
+        await e.fire_many(range(7))
+        await e(8)
+        received = []
+        async for value in stream:
+            received.append(value)
+            if value == "8":
+                break
+        assert received == ["0", "2", "4", "6", "8"]
+
+    async def test_batches(self):
+        e = AsyncEvent[int]()
+        stream = e.stream()
+        batches = stream.batches(3)
+        await e.fire_many(range(5))
+        # without timeout, batches are what's buffered
+        assert await batches.__anext__() == [0, 1, 2]
+        assert await batches.__anext__() == [3, 4]
+
+        # waits for the first value
+        batch = asyncio.ensure_future(batches.__anext__())
+        await asyncio.sleep(0)
+        assert not batch.done()
+        await e(5)
+        assert await batch == [5]
+
+        await batches.aclose()
+        assert stream.closed
+        with pytest.raises(StopAsyncIteration):
+            await batches.__anext__()
+
+    async def test_batches_timeout(self):
+        e = AsyncEvent[int]()
+        stream = e.stream().map(lambda value: value * 10)
+
+        async def produce():
+            await e(1)
+            await asyncio.sleep(0.01)
+            await e(2)
+            await asyncio.sleep(0.2)
+            await e(3)
+
+        task = asyncio.ensure_future(produce())
+        batches = stream.batches(3, timeout=0.1)
+        assert await batches.__anext__() == [10, 20]
+        assert await batches.__anext__() == [30]
+        await task
+
+        # None waits until the batch is full
+        task = asyncio.ensure_future(e.fire_many([4, 5]))
+        batch = asyncio.ensure_future(stream.batches(3, timeout=None).__anext__())
+        await task
+        await asyncio.sleep(0.01)
+        assert not batch.done()
+        await e(6)
+        assert await batch == [40, 50, 60]
+        await stream.aclose()
@@ -0,0 +1,92 @@
+import threading
+
+from evento import ThreadSafeEvent
+
+
+class TestThreadSafeEvent:
+    def test_fire(self):
+        e = ThreadSafeEvent[int]()
+        record = []
+        e += record.append
+        e(1)
+        e.fire(2)
+        assert record == [1, 2]
+        e -= record.append
+        e(3)
+        assert record == [1, 2]
+        assert len(e) == 0
+
+    def test_is_firing_per_thread(self):
+        e = ThreadSafeEvent[int]()
+        entered = threading.Event()
+        release = threading.Event()
+        record = []
+
+        def blocking(_):
+            record.append(e.is_firing)
+            entered.set()
+            release.wait(5)
+
+        e += blocking
+        thread = threading.Thread(target=e, args=(1,))
+        thread.start()
+        entered.wait(5)
+        # another thread is firing, this one isn't
+        assert not e.is_firing
+        release.set()
+        thread.join(5)
+        assert record == [True]
+
+    def test_stress(self):
+        e = ThreadSafeEvent[int]()
+        errors = []
+        calls = []
+        stop = threading.Event()
+
+        def make_subscriber():
+            def subscriber(_):
+                pass
+
+            return subscriber
+
+        # list.append is atomic, so no calls get lost
+        permanent = calls.append
+        subscribers = [permanent] + [make_subscriber() for _ in range(7)]
+        e += permanent
+
+        def fire():
+            try:
+                for i in range(2000):
+                    e(i)
+            except Exception as exc:  # pragma: no cover
+                errors.append(exc)
+
+        def mutate(offset):
+            try:
+                while not stop.is_set():
+                    for subscriber in subscribers[1:]:
+                        e.append(subscriber)
+                    for subscriber in subscribers[offset:]:
+                        e.remove(subscriber)
+            except Exception as exc:  # pragma: no cover
+                errors.append(exc)
+
+        mutators = [threading.Thread(target=mutate, args=(1 + i,)) for i in range(4)]
+        firers = [threading.Thread(target=fire) for _ in range(4)]
+
+        for thread in mutators + firers:
+            thread.start()
+        for thread in firers:
+            thread.join(30)
+        stop.set()
+        for thread in mutators:
+            thread.join(30)
+
+        assert errors == []
+        # the permanent subscriber never missed a fire
+        assert len(calls) == 4 * 2000
+        assert not e.is_firing
+        assert permanent in e
+        # the registry and the snapshot still agree
+        e(0)
+        assert set(e._snapshot) == set(e._subscribers)